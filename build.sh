@@ -13,3 +13,11 @@ python manage.py collectstatic --no-input
 
 # Create superuser (optional - you can do this manually later)
 # echo "from django.contrib.auth import get_user_model; User = get_user_model(); User.objects.create_superuser('admin', 'admin@example.com', 'admin123') if not User.objects.filter(username='admin').exists() else None" | python manage.py shell
+
+# Start command (set this in the host's start command, not here):
+#   WSGI, no live dashboard:
+#     gunicorn inventory_system.wsgi
+#   ASGI, needed for the live dashboard (server-sent events). Each open dashboard holds a
+#   connection, not a worker:
+#     LIVE_EVENTS_ENABLED=True uvicorn inventory_system.asgi:application --host 0.0.0.0 --port $PORT --workers 2
+# Under WSGI the dashboard stays static even with LIVE_EVENTS_ENABLED=True.
@@ -0,0 +1,204 @@
+import atexit
+import logging
+import os
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.core import serializers
+from django.core.cache import cache
+from django.db import close_old_connections, connection, transaction
+from django.utils import timezone
+
+from .caching import invalidate_tags
+from .models import ActivityLog
+from .sqlite import serialized_write
+
+
+logger = logging.getLogger(__name__)
+
+# Mga action na nakita na, para ma-invalidate lang ang actions dropdown kapag may bago
+ACTIVITY_ACTIONS_KEY = 'core:activity_actions'
+
+
+def activity_written(entries):
+    tags = ['activity']
+    actions = {entry.action for entry in entries}
+    seen = cache.get(ACTIVITY_ACTIONS_KEY)
+    if seen is None or not actions <= seen:
+        cache.set(ACTIVITY_ACTIONS_KEY, (seen or set()) | actions, timeout=None)
+        tags.append('activity_actions')
+    invalidate_tags(*tags)
+
+
+def activity_removed():
+    # Pagkatapos mag-archive/mag-delete: baka may action na wala na sa table
+    cache.delete(ACTIVITY_ACTIONS_KEY)
+    invalidate_tags('activity', 'activity_actions')
+
+
+class ActivityLogWriter:
+    """
+    In-process buffer ng ActivityLog records na fina-flush gamit ang bulk_create
+    mula sa background thread, kapag umabot sa batch_size o lumipas ang flush_interval.
+
+    Kapag pumalya ang bulk_create, ibinabalik ang batch sa buffer at susubukan ulit hanggang
+    max_retries; pagkatapos noon isa-isang sine-save, at ang hindi pa rin maisulat ay
+    dinadagdag sa spill_file (JSON Lines, puwedeng i-`loaddata`). Walang row na basta nawawala.
+    """
+
+    def __init__(self, batch_size=200, flush_interval=1.0, max_retries=3, spill_file=None):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.spill_file = spill_file
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._buffer = []
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopping = False
+        self._failures = 0
+
+    def _ensure_thread(self):
+        # Pagkatapos ng fork (hal. gunicorn --preload) bagong buffer at thread ang kailangan
+        if self._pid != os.getpid():
+            self._reset()
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='activity-log-writer', daemon=True)
+            self._thread.start()
+
+    def enqueue(self, entry):
+        with self._condition:
+            self._ensure_thread()
+            self._buffer.append(entry)
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify()
+
+    def _take(self):
+        with self._condition:
+            entries, self._buffer = self._buffer, []
+        return entries
+
+    def _requeue(self, entries):
+        # Sa unahan ng buffer para hindi magulo ang pagkakasunod-sunod ng timestamps
+        with self._condition:
+            self._buffer[:0] = entries
+
+    def _write(self, entries, retry=True):
+        """Isulat ang batch; False kapag pumalya (naka-requeue na o nasa fallback na)."""
+        if not entries:
+            return True
+        try:
+            serialized_write(ActivityLog.objects.bulk_create)(entries, batch_size=self.batch_size)
+        except Exception:
+            connection.close()
+            # Na-rollback ang insert; ibalik sa unsaved state bago subukan ulit
+            for entry in entries:
+                entry.pk = None
+                entry._state.adding = True
+            self._failures += 1
+            if retry and self._failures < self.max_retries:
+                logger.warning('Failed to write %d activity log entries (attempt %d of %d), will retry',
+                               len(entries), self._failures, self.max_retries, exc_info=True)
+                self._requeue(entries)
+                return False
+            logger.exception('Failed to bulk write %d activity log entries, writing one by one', len(entries))
+            self._failures = 0
+            self._write_each(entries)
+            return False
+        self._failures = 0
+        activity_written(entries)
+        return True
+
+    def _write_each(self, entries):
+        written, failed = [], []
+        for entry in entries:
+            try:
+                serialized_write(entry.save)()
+            except Exception:
+                connection.close()
+                entry.pk = None
+                entry._state.adding = True
+                failed.append(entry)
+            else:
+                written.append(entry)
+        if written:
+            activity_written(written)
+        if failed:
+            self._spill(failed)
+
+    def _spill(self, entries):
+        if not self.spill_file:
+            logger.error('Dropped %d activity log entries: no ACTIVITY_LOG_SPILL_FILE configured', len(entries))
+            return
+        path = Path(self.spill_file)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'a', encoding='utf-8') as fh:
+                fh.write(serializers.serialize('jsonl', entries))
+                fh.flush()
+                os.fsync(fh.fileno())
+        except Exception:
+            logger.exception('Failed to spill %d activity log entries to %s', len(entries), path)
+            return
+        logger.error('Spilled %d activity log entries to %s; load them with manage.py loaddata',
+                     len(entries), path)
+
+    def _run(self):
+        backoff = False
+        while True:
+            with self._condition:
+                # Pagkatapos pumalya, maghintay ng isang interval bago subukan ulit
+                if not self._stopping and (backoff or len(self._buffer) < self.batch_size):
+                    self._condition.wait(self.flush_interval)
+                stopping = self._stopping
+            close_old_connections()
+            backoff = not self._write(self._take(), retry=not stopping)
+            if stopping:
+                connection.close()
+                return
+
+    def flush(self):
+        # Synchronous na flush mula sa caller thread (hal. sa shutdown o sa tests); walang requeue
+        self._write(self._take(), retry=False)
+
+    def shutdown(self):
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None and thread.is_alive() and self._pid == os.getpid():
+            thread.join(timeout=5)
+        self.flush()
+
+
+writer = ActivityLogWriter(
+    batch_size=getattr(settings, 'ACTIVITY_LOG_BATCH_SIZE', 200),
+    flush_interval=getattr(settings, 'ACTIVITY_LOG_FLUSH_INTERVAL', 1.0),
+    max_retries=getattr(settings, 'ACTIVITY_LOG_MAX_RETRIES', 3),
+    spill_file=getattr(settings, 'ACTIVITY_LOG_SPILL_FILE', None),
+)
+atexit.register(writer.shutdown)
+
+
+def log_activity(user, action, model_name, object_id=None, object_repr='', changes=None, ip_address=None):
+    """Mag-record ng ActivityLog; buffered maliban kung ACTIVITY_LOG_SYNC = True."""
+    entry = ActivityLog(
+        user=user,
+        action=action,
+        model_name=model_name,
+        object_id=object_id,
+        object_repr=object_repr,
+        changes=changes,
+        ip_address=ip_address,
+        timestamp=timezone.now(),
+    )
+    if getattr(settings, 'ACTIVITY_LOG_SYNC', False):
+        entry.save()
+        return entry
+    # Isusulat lang kapag na-commit ang kasalukuyang transaction (o agad kung wala)
+    transaction.on_commit(lambda: writer.enqueue(entry))
+    return entry
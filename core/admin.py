@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Category, Product, StockMovement, ActivityLog
+from .models import Category, Product, StockMovement, ActivityLog, DailyMovementSummary, StockSnapshot
 
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
@@ -20,4 +20,13 @@ class StockMovementAdmin(admin.ModelAdmin):
 @admin.register(ActivityLog)
 class ActivityLogAdmin(admin.ModelAdmin):
     list_display = ['timestamp', 'user', 'action', 'model_name', 'object_repr']
-    list_filter = ['action', 'timestamp']
\ No newline at end of file
+    list_filter = ['action', 'timestamp']
+
+@admin.register(DailyMovementSummary)
+class DailyMovementSummaryAdmin(admin.ModelAdmin):
+    list_display = ['day', 'product', 'category', 'movement_type', 'quantity', 'total_value', 'movement_count']
+    list_filter = ['movement_type', 'day']
+@admin.register(StockSnapshot)
+class StockSnapshotAdmin(admin.ModelAdmin):
+    list_display = ['day', 'product', 'category', 'quantity', 'price', 'total_value']
+    list_filter = ['day']
@@ -0,0 +1,286 @@
+"""
+Read-only JSON API (v1) para sa POS terminals at spreadsheets.
+
+Bawat response ay may ETag (at Last-Modified kung mayroon) galing sa mismong resource:
+Product.updated_at sa detail, Max(updated_at) at bilang ng filtered products sa list. Kaya
+ang hindi nagbagong poll ay 304 pagkatapos ng isang maliit na aggregate query, at hindi
+nag-iiba ang ETag dahil lang may ibang product na nagbago.
+"""
+import hashlib
+from functools import wraps
+
+from django.db.models import Count, F, Max
+from django.http import Http404, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import require_GET
+
+from .decorators import api_admin_required
+from .models import Category, Product, StockMovement
+from .pagination import keyset_paginate
+from .search import search_products
+from .timeutils import date_range_filter, parse_date
+from .versioning import get_data_state, get_data_version
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+# Pangalan sa API -> (field para sa only(), attribute path sa instance)
+PRODUCT_FIELDS = {
+    'id': ('id', 'id'),
+    'sku': ('sku', 'sku'),
+    'name': ('name', 'name'),
+    'description': ('description', 'description'),
+    'category': ('category', 'category_id'),
+    'category_name': ('category__name', 'category.name'),
+    'unit': ('unit', 'unit'),
+    'quantity': ('quantity', 'quantity'),
+    'reorder_level': ('reorder_level', 'reorder_level'),
+    'price': ('price', 'price'),
+    'average_cost': ('average_cost', 'average_cost'),
+    'created_at': ('created_at', 'created_at'),
+    'updated_at': ('updated_at', 'updated_at'),
+}
+PRODUCT_DEFAULT_FIELDS = ['id', 'sku', 'name', 'category', 'unit', 'quantity', 'price', 'updated_at']
+
+CATEGORY_FIELDS = {
+    'id': ('id', 'id'),
+    'name': ('name', 'name'),
+    'description': ('description', 'description'),
+    'created_at': ('created_at', 'created_at'),
+}
+CATEGORY_DEFAULT_FIELDS = ['id', 'name']
+
+MOVEMENT_FIELDS = {
+    'id': ('id', 'id'),
+    'product': ('product', 'product_id'),
+    'product_sku': ('product__sku', 'product.sku'),
+    'movement_type': ('movement_type', 'movement_type'),
+    'quantity': ('quantity', 'quantity'),
+    'price_at_movement': ('price_at_movement', 'price_at_movement'),
+    'total_value': ('total_value', 'total_value'),
+    'unit_cost': ('unit_cost', 'unit_cost'),
+    'total_cost': ('total_cost', 'total_cost'),
+    'date': ('date', 'date'),
+    'reference': ('reference', 'reference'),
+    'notes': ('notes', 'notes'),
+    'performed_by': ('performed_by__username', 'performed_by.username'),
+}
+MOVEMENT_DEFAULT_FIELDS = ['id', 'product', 'movement_type', 'quantity', 'total_value', 'date']
+
+
+class ApiError(Exception):
+    def __init__(self, message, status=400):
+        self.message = message
+        self.status = status
+        super().__init__(message)
+
+
+def conditional_api(resource_state):
+    """
+    ETag = resource_state(request, ...) + buong URL; 304 kapag tugma, bago pa i-query at i-serialize
+    ang response. Ang resource_state ay nagbabalik ng (tag, last modified epoch seconds o None).
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            try:
+                tag, last_modified = resource_state(request, *args, **kwargs)
+                digest = hashlib.md5(request.get_full_path().encode()).hexdigest()[:12]
+                etag = quote_etag(f'{tag}-{digest}')
+                response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+                if response is None:
+                    response = view_func(request, *args, **kwargs)
+            except ApiError as exc:
+                return JsonResponse({'error': exc.message}, status=exc.status)
+            except Http404:
+                return JsonResponse({'error': 'Not found.'}, status=404)
+            if response.status_code in (200, 304):
+                response['ETag'] = etag
+                if last_modified:
+                    response['Last-Modified'] = http_date(last_modified)
+                # Laging i-revalidate; mura ang 304
+                response['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
+
+
+def api_view(resource_state):
+    def decorator(view_func):
+        return api_admin_required(require_GET(conditional_api(resource_state)(view_func)))
+    return decorator
+
+
+def _updated_state(queryset, fields):
+    # Bilang + pinakahuling updated_at: nagbabago sa edit, bagong row at pagbura
+    state = queryset.aggregate(count=Count('id'), modified=Max('updated_at'))
+    modified = state['modified'].timestamp() if state['modified'] else 0
+    return _with_related_version(f"{state['count']}-{modified}", fields), int(modified) or None
+
+
+def _with_related_version(tag, fields):
+    # Walang updated_at ang Category; kapag hiningi ang pangalan nito, kasama ang data version
+    if 'category_name' in fields:
+        return f'{tag}-v{get_data_version()}'
+    return tag
+
+
+def _requested_fields(request, field_map, defaults):
+    raw = request.GET.get('fields', '')
+    if not raw:
+        return defaults
+    fields = [name.strip() for name in raw.split(',') if name.strip()]
+    unknown = [name for name in fields if name not in field_map]
+    if unknown:
+        raise ApiError(f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(field_map)}.")
+    return fields
+
+
+def _project(queryset, field_map, fields, extra=()):
+    # only() + select_related lang sa mga column na hiningi
+    paths = {field_map[name][0] for name in fields} | set(extra) | {'id'}
+    related = {path.split('__')[0] for path in paths if '__' in path}
+    if related:
+        queryset = queryset.select_related(*related)
+    return queryset.only(*paths)
+
+
+def _resolve(obj, path):
+    for attr in path.split('.'):
+        if obj is None:
+            return None
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _serialize(obj, field_map, fields):
+    return {name: _resolve(obj, field_map[name][1]) for name in fields}
+
+
+def _id_param(request, name):
+    value = request.GET.get(name, '')
+    if not value:
+        return None
+    if not value.isdigit():
+        raise ApiError(f'{name} must be an id.')
+    return int(value)
+
+
+def _page_size(request):
+    try:
+        size = int(request.GET.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise ApiError('limit must be an integer.')
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+def _paginated_response(request, queryset, cursor_field, field_map, fields):
+    page = keyset_paginate(request, queryset, cursor_field, _page_size(request))
+    return JsonResponse({
+        'results': [_serialize(obj, field_map, fields) for obj in page],
+        'next': f'{request.path}?{page.next_query}' if page.next_query else None,
+        'previous': f'{request.path}?{page.previous_query}' if page.previous_query else None,
+    })
+
+
+def _product_queryset(request):
+    products = Product.objects.all()
+    category_id = _id_param(request, 'category')
+    if category_id is not None:
+        products = products.filter(category_id=category_id)
+    if request.GET.get('sku'):
+        products = products.filter(sku=request.GET['sku'])
+    if request.GET.get('low_stock') == '1':
+        products = products.filter(quantity__lte=F('reorder_level'))
+    if request.GET.get('updated_since'):
+        try:
+            since = parse_datetime(request.GET['updated_since'])
+        except ValueError:
+            since = None
+        if since is None:
+            raise ApiError('updated_since must be an ISO 8601 datetime.')
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        products = products.filter(updated_at__gte=since)
+    return products
+
+
+def product_list_state(request):
+    fields = _requested_fields(request, PRODUCT_FIELDS, PRODUCT_DEFAULT_FIELDS)
+    return _updated_state(_product_queryset(request), fields)
+
+
+@api_view(product_list_state)
+def product_list(request):
+    fields = _requested_fields(request, PRODUCT_FIELDS, PRODUCT_DEFAULT_FIELDS)
+    products = _project(_product_queryset(request), PRODUCT_FIELDS, fields, extra=['created_at'])
+    query = request.GET.get('q', '').strip()
+    if query:
+        # Naka-slice na ang search results, kaya isang page lang ayon sa relevance
+        results = search_products(query, products, limit=_page_size(request))
+        return JsonResponse({
+            'results': [_serialize(obj, PRODUCT_FIELDS, fields) for obj in results],
+            'next': None,
+            'previous': None,
+        })
+    return _paginated_response(request, products, 'created_at', PRODUCT_FIELDS, fields)
+
+
+def product_detail_state(request, pk):
+    fields = _requested_fields(request, PRODUCT_FIELDS, list(PRODUCT_FIELDS))
+    modified = Product.objects.filter(pk=pk).values_list('updated_at', flat=True).first()
+    if modified is None:
+        raise Http404
+    return _with_related_version(f'p{pk}-{modified.timestamp()}', fields), int(modified.timestamp())
+
+
+@api_view(product_detail_state)
+def product_detail(request, pk):
+    fields = _requested_fields(request, PRODUCT_FIELDS, list(PRODUCT_FIELDS))
+    product = get_object_or_404(_project(Product.objects.all(), PRODUCT_FIELDS, fields), pk=pk)
+    return JsonResponse(_serialize(product, PRODUCT_FIELDS, fields))
+
+
+def category_list_state(request):
+    # Walang updated_at ang Category at kaunti lang ang rows, kaya global data version pa rin
+    version, modified = get_data_state()
+    return f'v{version}', modified
+
+
+@api_view(category_list_state)
+def category_list(request):
+    fields = _requested_fields(request, CATEGORY_FIELDS, CATEGORY_DEFAULT_FIELDS)
+    # Kaunti lang ang categories, kaya walang pagination
+    categories = _project(Category.objects.order_by('name'), CATEGORY_FIELDS, fields)
+    return JsonResponse({'results': [_serialize(obj, CATEGORY_FIELDS, fields) for obj in categories]})
+
+
+def _movement_queryset(request):
+    movements = StockMovement.objects.all()
+    product_id = _id_param(request, 'product')
+    if product_id is not None:
+        movements = movements.filter(product_id=product_id)
+    if request.GET.get('type') in ('IN', 'OUT'):
+        movements = movements.filter(movement_type=request.GET['type'])
+    return movements.filter(**date_range_filter(
+        'date', parse_date(request.GET.get('date_from', '')), parse_date(request.GET.get('date_to', ''))
+    ))
+
+
+def movement_list_state(request):
+    # Append-only ang ledger at walang updated_at: bilang + pinakamataas na id, walang Last-Modified
+    # (puwedeng backdated ang date ng bagong movement)
+    state = _movement_queryset(request).aggregate(count=Count('id'), last=Max('id'))
+    return f"m{state['count']}-{state['last'] or 0}", None
+
+
+@api_view(movement_list_state)
+def movement_list(request):
+    fields = _requested_fields(request, MOVEMENT_FIELDS, MOVEMENT_DEFAULT_FIELDS)
+    movements = _project(_movement_queryset(request), MOVEMENT_FIELDS, fields, extra=['date'])
+    return _paginated_response(request, movements, 'date', MOVEMENT_FIELDS, fields)
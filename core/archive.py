@@ -0,0 +1,115 @@
+import gzip
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .activity import activity_removed
+from .models import ActivityLog
+
+
+ARCHIVE_CHUNK_SIZE = 5000
+ARCHIVE_FILE_RE = re.compile(r'^activity-(\d{4}-\d{2})\.jsonl\.gz$')
+ARCHIVE_FIELDS = ['id', 'timestamp', 'user_id', 'user__username', 'action', 'model_name',
+                  'object_id', 'object_repr', 'changes', 'ip_address']
+
+
+def archive_dir():
+    return Path(settings.ACTIVITY_LOG_ARCHIVE_DIR)
+
+
+def archive_path(month):
+    return archive_dir() / f'activity-{month}.jsonl.gz'
+
+
+def archived_months():
+    # Read-only: wala pang na-archive kapag wala ang directory; sa _append lang ito ginagawa
+    try:
+        names = os.listdir(archive_dir())
+    except FileNotFoundError:
+        return []
+    return sorted((match.group(1) for match in map(ARCHIVE_FILE_RE.match, names) if match), reverse=True)
+
+
+def _append(month, rows):
+    # Append mode = bagong gzip member; valid pa rin ang file bilang isang gzip stream
+    payload = ''.join(json.dumps(row, default=str, ensure_ascii=False) + '\n' for row in rows)
+    archive_dir().mkdir(parents=True, exist_ok=True)
+    with open(archive_path(month), 'ab') as raw:
+        with gzip.GzipFile(fileobj=raw, mode='ab') as fh:
+            fh.write(payload.encode('utf-8'))
+        # Siguradong nasa disk bago burahin ang rows sa database
+        raw.flush()
+        os.fsync(raw.fileno())
+
+
+def archive_activity_logs(older_than_days=None, chunk_size=ARCHIVE_CHUNK_SIZE, dry_run=False):
+    """
+    Ilipat ang ActivityLog entries na mas matanda sa horizon papunta sa buwanang
+    activity-YYYY-MM.jsonl.gz files, tapos burahin sa hot table nang paisa-isang chunk.
+    """
+    if older_than_days is None:
+        older_than_days = settings.ACTIVITY_LOG_RETENTION_DAYS
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    queryset = ActivityLog.objects.filter(timestamp__lt=cutoff)
+    if dry_run:
+        return queryset.count()
+
+    archived = 0
+    while True:
+        rows = list(queryset.order_by('timestamp', 'id').values(*ARCHIVE_FIELDS)[:chunk_size])
+        if not rows:
+            break
+        by_month = {}
+        for row in rows:
+            row['username'] = row.pop('user__username')
+            row['timestamp'] = row['timestamp'].isoformat()
+            month = timezone.localtime(datetime.fromisoformat(row['timestamp'])).strftime('%Y-%m')
+            by_month.setdefault(month, []).append(row)
+
+        # Isulat muna sa archive bago burahin; kapag nag-crash sa pagitan, dedupe by id sa pagbasa
+        for month, month_rows in by_month.items():
+            _append(month, month_rows)
+        with transaction.atomic():
+            ActivityLog.objects.filter(id__in=[row['id'] for row in rows]).delete()
+        archived += len(rows)
+    if archived:
+        activity_removed()
+    return archived
+
+
+def read_archive(month, action='', date_from=None, date_to=None):
+    """Basahin ang isang archived na buwan bilang mga log-like objects, pinakabago muna."""
+    path = archive_path(month)
+    if not ARCHIVE_FILE_RE.match(path.name) or not path.exists():
+        return []
+
+    records = {}
+    with gzip.open(path, 'rt', encoding='utf-8') as fh:
+        for line in fh:
+            row = json.loads(line)
+            if action and row['action'] != action:
+                continue
+            timestamp = datetime.fromisoformat(row['timestamp'])
+            day = timezone.localtime(timestamp).date()
+            if (date_from and day < date_from) or (date_to and day > date_to):
+                continue
+            records[row['id']] = SimpleNamespace(
+                pk=row['id'],
+                id=row['id'],
+                timestamp=timestamp,
+                user=SimpleNamespace(username=row['username']) if row['username'] else None,
+                action=row['action'],
+                model_name=row['model_name'],
+                object_id=row['object_id'],
+                object_repr=row['object_repr'],
+                changes=row['changes'],
+                ip_address=row['ip_address'],
+            )
+    return sorted(records.values(), key=lambda record: (record.timestamp, record.pk), reverse=True)
@@ -0,0 +1,91 @@
+"""
+Mabilis na auth path: per-process na TTL cache ng naka-resolve na user at ng admin verdict.
+
+Kada request, ang AuthenticationMiddleware ay tumatawag sa backend.get_user() (isang query sa
+auth_user); dito, galing iyon sa memory habang hindi pa lumilipas ang AUTH_USER_CACHE_TTL.
+Ini-invalidate ng signals kapag na-save/na-delete ang user o nag-logout. Ang ibang processes
+ay nakakakita ng pagbabago pagkalipas ng TTL, kaya maikli lang ito.
+"""
+import copy
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+
+
+def _ttl():
+    return getattr(settings, 'AUTH_USER_CACHE_TTL', 30)
+
+
+class UserCache:
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.generation = 0
+
+    def get(self, user_id):
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry
+
+    def set(self, user_id, user=None, verdict=None, generation=None):
+        ttl = _ttl()
+        if ttl <= 0:
+            return
+        with self._lock:
+            # Na-invalidate habang binabasa ang user sa database: huwag i-cache ang lumang kopya
+            if generation is not None and generation != self.generation:
+                return
+            current = self.get(user_id)
+            if current is not None:
+                user = user if user is not None else current[1]
+                verdict = verdict if verdict is not None else current[2]
+            self._entries[user_id] = (time.monotonic() + ttl, user, verdict)
+
+    def invalidate(self, user_id=None):
+        with self._lock:
+            self.generation += 1
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+
+user_cache = UserCache()
+
+
+def is_single_admin(user):
+    """Verdict ng single_admin_required, naka-cache kasama ng user."""
+    entry = user_cache.get(user.pk)
+    if entry is not None and entry[2] is not None:
+        return entry[2]
+    generation = user_cache.generation
+    verdict = user.username == 'admin' or user.is_superuser
+    user_cache.set(user.pk, verdict=verdict, generation=generation)
+    return verdict
+
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend na ang get_user() ay dumadaan muna sa per-process na user cache."""
+
+    def get_user(self, user_id):
+        user_id = self._coerce(user_id)
+        entry = user_cache.get(user_id)
+        if entry is not None and entry[1] is not None:
+            # Kopya kada request, para hindi magbahagi ng mutable na instance ang mga thread
+            return copy.copy(entry[1])
+        generation = user_cache.generation
+        user = super().get_user(user_id)
+        if user is not None:
+            user_cache.set(user_id, user=copy.copy(user), generation=generation)
+        return user
+
+    @staticmethod
+    def _coerce(user_id):
+        # Naka-string ang id sa session; int para tugma sa user.pk na gamit ng signals
+        try:
+            return int(user_id)
+        except (TypeError, ValueError):
+            return user_id
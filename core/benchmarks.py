@@ -0,0 +1,136 @@
+"""
+Benchmark cases ng bawat core URL at ang query budget ng bawat isa. Ginagamit ng test suite
+(core.tests.test_query_budgets, maliit na dataset) at ng optional na `manage.py bench_views`
+(timing sa malalaking seeded dataset).
+"""
+import json
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+
+from . import urls as core_urls
+from .models import Product
+from .seeding import seed_sku_prefix
+
+
+# Mga URL na hindi sinusukat: walang katapusang stream, o tinatapos ang session ng benchmark
+EXCLUDED_URLS = {
+    'dashboard_events': 'server-sent event stream never completes',
+    'logout': 'ends the benchmark session',
+}
+
+# Bawat case: URL name at inaasahang paglaki ng wall time habang lumalaki ang data: 'flat'
+# (index/keyset, halos hindi gumagalaw) o 'linear' (aggregate sa lahat ng products o rollup rows).
+BENCH_CASES = [
+    {'url': 'login', 'scaling': 'flat'},
+    {'url': 'dashboard', 'scaling': 'linear'},
+    {'url': 'product_list', 'scaling': 'flat'},
+    {'label': 'product_list search', 'url': 'product_list', 'query': {'search': 'product_name'},
+     'scaling': 'flat'},
+    {'label': 'product_list low stock', 'url': 'product_list', 'query': {'stock_status': 'low'},
+     'scaling': 'flat'},
+    {'url': 'product_create', 'scaling': 'flat'},
+    {'url': 'product_import', 'scaling': 'flat'},
+    {'url': 'product_detail', 'args': ['product'], 'scaling': 'flat'},
+    {'url': 'product_update', 'args': ['product'], 'scaling': 'flat'},
+    {'url': 'product_delete', 'args': ['product'], 'scaling': 'flat'},
+    {'url': 'stock_in', 'scaling': 'flat'},
+    {'url': 'stock_out', 'scaling': 'flat'},
+    {'url': 'stock_batch_in', 'scaling': 'flat'},
+    {'url': 'stock_batch_out', 'scaling': 'flat'},
+    # Nagsusulat: sa scratch product na hindi sinusukat ng ibang case, para hindi gumalaw ang dataset
+    {'url': 'stock_batch_api', 'method': 'post', 'scaling': 'flat',
+     'body': lambda ctx: {'movement_type': 'IN', 'lines': [{'product_id': ctx['scratch_product'], 'quantity': 1}]}},
+    {'url': 'product_lookup', 'query': {'q': 'sku_prefix'}, 'scaling': 'flat'},
+    {'url': 'product_stock', 'args': ['product'], 'scaling': 'flat'},
+    # API: sa movements, COUNT sa buong filtered ledger para sa ETag
+    {'url': 'api_product_list', 'scaling': 'flat'},
+    {'url': 'api_product_detail', 'args': ['product'], 'scaling': 'flat'},
+    {'url': 'api_category_list', 'scaling': 'flat'},
+    {'url': 'api_movement_list', 'scaling': 'linear'},
+    {'label': 'api_movement_list OUT', 'url': 'api_movement_list', 'query': {'type': 'OUT'},
+     'scaling': 'linear'},
+    {'url': 'activity_log', 'scaling': 'flat'},
+    {'label': 'activity_log STOCK_OUT', 'url': 'activity_log', 'query': {'action': 'STOCK_OUT'},
+     'scaling': 'flat'},
+    {'url': 'inventory_report', 'scaling': 'linear'},
+    {'label': 'inventory_report as_of', 'url': 'inventory_report', 'query': {'as_of': 'month_ago'},
+     'scaling': 'linear'},
+    {'url': 'stock_out_report', 'scaling': 'linear'},
+    {'label': 'stock_out_report last 30 days', 'url': 'stock_out_report',
+     'query': {'date_from': 'month_ago', 'date_to': 'today'}, 'scaling': 'linear'},
+]
+
+# Max na queries kada case label (kasama ang session at user lookups), sa malamig na cache.
+# May kaunting palugit sa kasalukuyang bilang; ang paglaki kasabay ng data (N+1) ay hiwalay na check.
+QUERY_BUDGETS = {
+    'login': 3,
+    'dashboard': 10,
+    'product_list': 5,
+    'product_list search': 5,
+    'product_list low stock': 5,
+    'product_create': 4,
+    'product_import': 3,
+    'product_detail': 6,
+    'product_update': 5,
+    'product_delete': 4,
+    'stock_in': 3,
+    'stock_out': 3,
+    'stock_batch_in': 3,
+    'stock_batch_out': 3,
+    'stock_batch_api': 12,
+    'product_lookup': 4,
+    'product_stock': 4,
+    'api_product_list': 5,
+    'api_product_detail': 5,
+    'api_category_list': 4,
+    'api_movement_list': 5,
+    'api_movement_list OUT': 5,
+    'activity_log': 5,
+    'activity_log STOCK_OUT': 5,
+    'inventory_report': 8,
+    'inventory_report as_of': 8,
+    'stock_out_report': 6,
+    'stock_out_report last 30 days': 6,
+}
+SCRATCH_SKU = 'BENCH-SCRATCH'
+
+
+def bench_cases():
+    return [dict(case, label=case.get('label', case['url'])) for case in BENCH_CASES]
+
+
+def uncovered_urls(cases):
+    covered = {case['url'] for case in cases} | set(EXCLUDED_URLS)
+    return sorted({pattern.name for pattern in core_urls.urlpatterns} - covered)
+
+
+def bench_context(seed):
+    """Mga value para sa args/query ng cases, mula sa seeded dataset ng `seed`."""
+    today = timezone.localdate()
+    product = Product.objects.filter(sku__startswith=seed_sku_prefix(seed)).order_by('sku').first()
+    scratch = Product.objects.get_or_create(sku=SCRATCH_SKU, defaults={'name': 'Benchmark scratch product'})[0]
+    return {
+        'product': product.pk,
+        'product_name': product.name,
+        'scratch_product': scratch.pk,
+        'sku_prefix': seed_sku_prefix(seed),
+        'today': today.isoformat(),
+        'month_ago': (today - timedelta(days=30)).isoformat(),
+    }
+
+
+def send_case(client, case, context):
+    # Malamig na cache kada request: sinusukat ang totoong trabaho ng view
+    cache.clear()
+    url = reverse(case['url'], args=[context[arg] for arg in case.get('args', [])])
+    if case.get('method') == 'post':
+        return client.post(url, json.dumps(case['body'](context)), content_type='application/json')
+    return client.get(url, {key: context.get(value, value) for key, value in case.get('query', {}).items()})
+
+
+def products_for(movements):
+    # Humigit-kumulang 100 movements kada product, gaya ng isang taon ng tindahan
+    return max(50, movements // 100)
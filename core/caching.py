@@ -0,0 +1,168 @@
+"""
+Tag-based na view at fragment cache.
+
+Bawat tag (hal. 'products', 'categories', 'movements', 'activity') ay may version sa cache;
+kasama ang mga version sa cache key, kaya ang invalidation ay isang incr lang at ang lumang
+entries ay hindi na matatamaan (kusa na lang mag-e-expire). Ang signals sa core models ang
+nag-i-invalidate pagka-commit.
+"""
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.contrib import messages
+from django.core.cache import cache
+from django.utils import timezone
+
+from .routers import replica_used
+
+
+TAG_KEY = 'core:tag:{}'
+STATS_KEY = 'core:cache_stats:{}:{}'
+STATS_NAMES_KEY = 'core:cache_stats:names'
+
+# Mga pangalang naka-register na sa process na ito, para isang write lang sa registry
+_known_names = set()
+
+
+def _enabled():
+    return getattr(settings, 'VIEW_CACHE_ENABLED', True)
+
+
+def _timeout(timeout=None):
+    timeout = timeout or getattr(settings, 'VIEW_CACHE_TIMEOUT', 600)
+    if replica_used():
+        # Binasa sa replica na puwedeng nahuhuli sa primary: maikli lang ang buhay sa cache
+        timeout = min(timeout, getattr(settings, 'REPLICA_CACHE_TIMEOUT', 30))
+    return timeout
+
+
+def tag_versions(tags):
+    keys = [TAG_KEY.format(tag) for tag in tags]
+    found = cache.get_many(keys)
+    versions = []
+    for key in keys:
+        version = found.get(key)
+        if version is None:
+            # Oras ang simula para hindi na tumama ang lumang entries kapag na-cull ang tag key
+            cache.add(key, int(time.time() * 1000), timeout=None)
+            version = cache.get(key)
+        versions.append(str(version))
+    return versions
+
+
+def invalidate_tags(*tags):
+    for tag in tags:
+        try:
+            cache.incr(TAG_KEY.format(tag))
+        except ValueError:
+            cache.set(TAG_KEY.format(tag), int(time.time() * 1000), timeout=None)
+
+
+def _register(name):
+    if name in _known_names:
+        return
+    names = cache.get(STATS_NAMES_KEY, set())
+    if name not in names:
+        cache.set(STATS_NAMES_KEY, names | {name}, timeout=None)
+    _known_names.add(name)
+
+
+def _count(name, outcome):
+    _register(name)
+    key = STATS_KEY.format(name, outcome)
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def cache_stats():
+    """{name: {'hits', 'misses', 'hit_rate'}} para sa lahat ng naka-cache na views at fragments."""
+    names = sorted(cache.get(STATS_NAMES_KEY, set()))
+    counts = cache.get_many([STATS_KEY.format(name, outcome) for name in names for outcome in ('hits', 'misses')])
+    stats = {}
+    for name in names:
+        hits = counts.get(STATS_KEY.format(name, 'hits'), 0)
+        misses = counts.get(STATS_KEY.format(name, 'misses'), 0)
+        total = hits + misses
+        stats[name] = {'hits': hits, 'misses': misses, 'hit_rate': round(hits / total, 3) if total else None}
+    return stats
+
+
+def reset_cache_stats():
+    names = cache.get(STATS_NAMES_KEY, set())
+    cache.delete_many([STATS_KEY.format(name, outcome) for name in names for outcome in ('hits', 'misses')])
+
+
+def _view_cache_key(request, name, tags, vary_on=None):
+    if request.method != 'GET' or not request.user.is_authenticated:
+        return None
+    # Ang CSRF token sa page ay galing sa cookie secret, kaya kasama ito sa key
+    csrf_cookie = request.COOKIES.get(settings.CSRF_COOKIE_NAME, '')
+    # May flash message na ipapakita (at kokonsumohin) ang page, kaya huwag i-serve mula cache
+    if len(messages.get_messages(request)):
+        return None
+    digest = hashlib.md5('|'.join([
+        str(request.user.pk), csrf_cookie, request.get_full_path(), timezone.localdate().isoformat(),
+        str(vary_on(request)) if vary_on else '',
+    ]).encode()).hexdigest()
+    return f"core:view:{name}:{'.'.join(tag_versions(tags))}:{digest}"
+
+
+def _cacheable(request, response):
+    # Bagong CSRF secret na hindi pa nasa cookie (hindi tugma sa key): huwag i-cache
+    if request.META.get('CSRF_COOKIE_NEEDS_UPDATE') and not request.COOKIES.get(settings.CSRF_COOKIE_NAME):
+        return False
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and response.get('Content-Type', '').startswith('text/html')
+    )
+
+
+def cached_view(*tags, timeout=None, vary_on=None):
+    """
+    I-cache ang buong HTML response ng view, per user, hanggang ma-invalidate ang isa sa `tags`.
+    Ang `vary_on(request)` ay kasama sa key para sa ibang bagay na nagpapabago sa HTML.
+    Ang CSV/PDF at ibang non-HTML responses ay hindi kina-cache.
+    """
+    def decorator(view_func):
+        name = f'view:{view_func.__name__}'
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            key = _view_cache_key(request, name, tags, vary_on) if _enabled() else None
+            if key is None:
+                return view_func(request, *args, **kwargs)
+            response = cache.get(key)
+            if response is not None:
+                _count(name, 'hits')
+                return response
+            _count(name, 'misses')
+            response = view_func(request, *args, **kwargs)
+            if _cacheable(request, response):
+                cache.set(key, response, _timeout(timeout))
+            return response
+        return wrapper
+    return decorator
+
+
+def cached_fragment(name, tags, vary_on, render, timeout=None):
+    """Rendered na template fragment; `render` ay tinatawag lang kapag miss."""
+    if not _enabled():
+        return render()
+    name = f'fragment:{name}'
+    digest = hashlib.md5('|'.join(str(value) for value in vary_on).encode()).hexdigest()
+    key = f"core:fragment:{name}:{'.'.join(tag_versions(tags))}:{digest}"
+    content = cache.get(key)
+    if content is not None:
+        _count(name, 'hits')
+        return content
+    _count(name, 'misses')
+    content = render()
+    cache.set(key, content, _timeout(timeout))
+    return content
@@ -1,15 +1,45 @@
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.http import JsonResponse
 from django.shortcuts import redirect
 from django.contrib import messages
 
+from .auth import is_single_admin
+
 def single_admin_required(view_func):
     def wrapper_func(request, *args, **kwargs):
         if request.user.is_authenticated:
-            # Check if user is the single admin
-            if request.user.username == 'admin' or request.user.is_superuser:
+            # Check if user is the single admin (naka-cache ang verdict, tingnan ang core.auth)
+            if is_single_admin(request.user):
                 return view_func(request, *args, **kwargs)
             else:
                 messages.error(request, 'You do not have permission to access this page.')
                 return redirect('login')
         else:
             return redirect('login')
-    return wrapper_func
\ No newline at end of file
+
+    # Async views (hal. SSE stream): auser() para hindi ma-block ang event loop
+    async def async_wrapper_func(request, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return redirect('login')
+        if is_single_admin(user):
+            return await view_func(request, *args, **kwargs)
+        await sync_to_async(messages.error)(request, 'You do not have permission to access this page.')
+        return redirect('login')
+
+    if iscoroutinefunction(view_func):
+        return wraps(view_func)(async_wrapper_func)
+    return wrapper_func
+
+def api_admin_required(view_func):
+    # Parehong check ng single_admin_required pero JSON 401/403 imbes na redirect
+    @wraps(view_func)
+    def wrapper_func(request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return JsonResponse({'error': 'Authentication required.'}, status=401)
+        if is_single_admin(request.user):
+            return view_func(request, *args, **kwargs)
+        return JsonResponse({'error': 'You do not have permission to access this resource.'}, status=403)
+    return wrapper_func
@@ -0,0 +1,226 @@
+"""
+Live na dashboard events (server-sent events).
+
+Ang writes ay nagpa-publish ng maliliit na deltas sa shared cache (may sequence number),
+kaya nakikita ng lahat ng worker processes. Sa bawat process, iisang poller task ang bumabasa
+ng bagong events at nagfa-fan-out sa lahat ng nakakonektang dashboards, kaya ang isang event
+ay isang cache read kada process, hindi isang render kada dashboard.
+"""
+import asyncio
+import json
+import logging
+import weakref
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, F, Q, Sum
+
+from .models import Product
+
+
+logger = logging.getLogger(__name__)
+
+EVENT_SEQ_KEY = 'core:events:seq'
+EVENT_KEY = 'core:events:{}'
+EVENT_TIMEOUT = 120
+# Ilang events lang ang hahabulin kapag nahuli ang poller; lampas dito, resync na lang ang client
+MAX_BACKLOG = 200
+# Ilang poll bago laktawan ang sequence na hindi na lumabas (hal. nawala sa cache)
+MAX_GAP_POLLS = 5
+MAX_MOVEMENT_ROWS = 20
+
+
+def live_events_available(request):
+    # Sa WSGI, ang async stream ay kinokolekta muna ni StreamingHttpResponse bago ipadala
+    return getattr(settings, 'LIVE_EVENTS_ENABLED', False) and isinstance(request, ASGIRequest)
+
+
+def publish_event(event_type, data):
+    try:
+        seq = cache.incr(EVENT_SEQ_KEY)
+    except ValueError:
+        cache.add(EVENT_SEQ_KEY, 0, timeout=None)
+        seq = cache.incr(EVENT_SEQ_KEY)
+    cache.set(EVENT_KEY.format(seq), {'seq': seq, 'type': event_type, 'data': data}, EVENT_TIMEOUT)
+    return seq
+
+
+def current_sequence():
+    return cache.get(EVENT_SEQ_KEY, 0)
+
+
+def read_events(after):
+    """Mga event na seq > after, hanggang sa unang wala pa (hal. incr na pero hindi pa naka-set)."""
+    latest = current_sequence()
+    if latest <= after:
+        return latest, []
+    start = max(after + 1, latest - MAX_BACKLOG + 1)
+    keys = [EVENT_KEY.format(seq) for seq in range(start, latest + 1)]
+    found = cache.get_many(keys)
+    events = []
+    for key in keys:
+        if key not in found:
+            break
+        events.append(found[key])
+    return latest, events
+
+
+def _kpis():
+    # Parehong aggregate ng dashboard KPIs; isang query kada commit, hindi kada client
+    return Product.objects.aggregate(
+        total_products=Count('id'),
+        low_stock_products=Count('id', filter=Q(quantity__lte=F('reorder_level'))),
+        out_of_stock=Count('id', filter=Q(quantity=0)),
+        total_stock_value=Sum(F('quantity') * F('price')),
+        total_stock_cost=Sum(F('quantity') * F('average_cost')),
+    )
+
+
+def _stock_status(quantity, reorder_level):
+    if quantity <= 0:
+        return 'out'
+    if quantity <= reorder_level:
+        return 'low'
+    return 'in'
+
+
+def publish_stock_change(movements, products, user=None):
+    """
+    I-publish ang resulta ng stock in/out pagka-commit: bagong movement rows, KPI values,
+    at products na lumipat ng stock status (in/low/out). `products` ay {id: Product} na
+    may quantity pagkatapos ng movement.
+    """
+    if not getattr(settings, 'LIVE_EVENTS_ENABLED', False):
+        return
+    try:
+        after = {pk: product.quantity for pk, product in products.items()}
+        before = dict(after)
+        for movement in movements:
+            delta = movement.quantity if movement.movement_type == 'IN' else -movement.quantity
+            before[movement.product_id] -= delta
+
+        publish_event('movements', {
+            'count': len(movements),
+            'rows': [
+                {
+                    'id': movement.pk,
+                    'product': movement.product_id,
+                    'name': products[movement.product_id].name,
+                    'type': movement.movement_type,
+                    'quantity': movement.quantity,
+                    'unit': products[movement.product_id].unit,
+                    'total_value': movement.total_value,
+                    'user': user.username if user else None,
+                    'date': movement.date,
+                }
+                for movement in movements[:MAX_MOVEMENT_ROWS]
+            ],
+        })
+
+        transitions = []
+        for pk, product in products.items():
+            old = _stock_status(before[pk], product.reorder_level)
+            new = _stock_status(after[pk], product.reorder_level)
+            if old != new:
+                transitions.append({
+                    'id': pk,
+                    'name': product.name,
+                    'sku': product.sku,
+                    'quantity': after[pk],
+                    'unit': product.unit,
+                    'reorder_level': product.reorder_level,
+                    'status': new,
+                })
+        if transitions:
+            publish_event('stock_status', {'products': transitions})
+
+        kpis = _kpis()
+        for key in ('total_stock_value', 'total_stock_cost'):
+            kpis[key] = Decimal(kpis[key] or 0).quantize(Decimal('0.01'))
+        publish_event('kpis', kpis)
+    except Exception:
+        # Hindi dapat pumalya ang stock in/out dahil sa live updates
+        logger.exception('Failed to publish live dashboard events')
+
+
+def format_sse(event):
+    payload = json.dumps(event['data'], cls=DjangoJSONEncoder)
+    return f"id: {event['seq']}\nevent: {event['type']}\ndata: {payload}\n\n"
+
+
+class _Channel:
+    def __init__(self):
+        self.subscribers = set()
+        self.task = None
+        self.last_seq = None
+
+
+class EventBroker:
+    """
+    In-process fan-out: isang poller task kada event loop, isang asyncio.Queue kada client.
+    Iisa ang loop kada process sa ASGI server (uvicorn).
+    """
+
+    def __init__(self, poll_interval=1.0, queue_size=100):
+        self.poll_interval = poll_interval
+        self.queue_size = queue_size
+        self._channels = weakref.WeakKeyDictionary()
+
+    async def subscribe(self):
+        loop = asyncio.get_running_loop()
+        channel = self._channels.get(loop)
+        if channel is None:
+            channel = self._channels[loop] = _Channel()
+        if channel.last_seq is None:
+            channel.last_seq = await sync_to_async(current_sequence, thread_sensitive=False)()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        channel.subscribers.add(queue)
+        if channel.task is None or channel.task.done():
+            channel.task = loop.create_task(self._poll(channel))
+        return queue
+
+    def unsubscribe(self, queue):
+        channel = self._channels.get(asyncio.get_running_loop())
+        if channel is not None:
+            channel.subscribers.discard(queue)
+
+    def _deliver(self, channel, event):
+        for queue in list(channel.subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Mabagal na client: itapon ang backlog at sabihang mag-reload
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({'seq': event['seq'], 'type': 'resync', 'data': {}})
+
+    async def _poll(self, channel):
+        gap_polls = 0
+        while channel.subscribers:
+            try:
+                latest, events = await sync_to_async(read_events, thread_sensitive=False)(channel.last_seq)
+            except Exception:
+                logger.exception('Failed to read live dashboard events')
+                latest, events = channel.last_seq, []
+            if latest < channel.last_seq:
+                # Na-clear ang cache; magsimula ulit sa bagong sequence
+                channel.last_seq = latest
+            for event in events:
+                self._deliver(channel, event)
+                channel.last_seq = event['seq']
+            if channel.last_seq < latest:
+                gap_polls += 1
+                if gap_polls >= MAX_GAP_POLLS:
+                    channel.last_seq += 1
+                    gap_polls = 0
+            else:
+                gap_polls = 0
+            await asyncio.sleep(self.poll_interval)
+        channel.task = None
+
+
+broker = EventBroker(poll_interval=getattr(settings, 'LIVE_EVENTS_POLL_INTERVAL', 1.0))
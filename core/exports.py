@@ -0,0 +1,42 @@
+import csv
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+
+EXPORT_CHUNK_SIZE = 2000
+WRITE_BATCH_SIZE = 500
+
+
+class Echo:
+    # Pseudo-buffer: ibinabalik lang ng csv.writer ang bawat linya para ma-stream agad
+    def write(self, value):
+        return value
+
+
+def _format_value(value):
+    if hasattr(value, 'tzinfo') and value.tzinfo is not None:
+        return timezone.localtime(value).strftime('%Y-%m-%d %H:%M:%S')
+    if value is None:
+        return ''
+    return value
+
+
+def stream_csv(filename, header, queryset, fields):
+    writer = csv.writer(Echo())
+
+    def rows():
+        # BOM para tama ang ₱ at ñ pag binuksan sa Excel
+        yield '\ufeff' + writer.writerow(header)
+        lines = []
+        for row in queryset.values_list(*fields).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            lines.append(writer.writerow([_format_value(value) for value in row]))
+            if len(lines) >= WRITE_BATCH_SIZE:
+                yield ''.join(lines)
+                lines = []
+        if lines:
+            yield ''.join(lines)
+
+    response = StreamingHttpResponse(rows(), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
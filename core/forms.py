@@ -1,6 +1,7 @@
 from django import forms
 from django.contrib.auth.forms import AuthenticationForm
 from .models import Product, Category, StockMovement
+from .numbers import parse_int
 
 class LoginForm(AuthenticationForm):
     username = forms.CharField(widget=forms.TextInput(attrs={
@@ -15,7 +16,8 @@ class LoginForm(AuthenticationForm):
 class ProductForm(forms.ModelForm):
     class Meta:
         model = Product
-        fields = ['name', 'sku', 'category', 'description', 'unit', 'quantity', 'reorder_level', 'price']
+        fields = ['name', 'sku', 'category', 'description', 'unit', 'quantity', 'reorder_level', 'price', 'average_cost']
+        labels = {'average_cost': 'Unit cost'}
         widgets = {
             'name': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'Product Name'}),
             'sku': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'SKU'}),
@@ -25,6 +27,7 @@ class ProductForm(forms.ModelForm):
             'quantity': forms.NumberInput(attrs={'class': 'form-control', 'min': 0}),
             'reorder_level': forms.NumberInput(attrs={'class': 'form-control', 'min': 0}),
             'price': forms.NumberInput(attrs={'class': 'form-control', 'min': 0, 'step': '0.01'}),
+            'average_cost': forms.NumberInput(attrs={'class': 'form-control', 'min': 0, 'step': '0.0001'}),
         }
 
 class CategoryForm(forms.ModelForm):
@@ -37,13 +40,86 @@ class CategoryForm(forms.ModelForm):
         }
 
 class StockMovementForm(forms.ModelForm):
+    # Stock in lang; kapag blangko, naka-cost sa kasalukuyang average ng product
+    unit_cost = forms.DecimalField(required=False, min_value=0, max_digits=12, decimal_places=4,
+                                   widget=forms.NumberInput(attrs={'class': 'form-control', 'min': 0, 'step': '0.01'}))
+
     class Meta:
         model = StockMovement
-        fields = ['product', 'movement_type', 'quantity', 'reference', 'notes']
+        fields = ['product', 'movement_type', 'quantity', 'unit_cost', 'reference', 'notes']
         widgets = {
-            'product': forms.Select(attrs={'class': 'form-control'}),
+            # Hidden id na pinupunan ng typeahead; hindi nire-render ang buong catalogue bilang <option>
+            'product': forms.HiddenInput(),
             'movement_type': forms.Select(attrs={'class': 'form-control'}),
             'quantity': forms.NumberInput(attrs={'class': 'form-control', 'min': 1}),
             'reference': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'Reference (e.g., Invoice #)'}),
             'notes': forms.Textarea(attrs={'class': 'form-control', 'rows': 2, 'placeholder': 'Additional notes'}),
-        }
\ No newline at end of file
+        }
+
+    def selected_product(self):
+        # Para maipakita ulit ang napiling product kapag may validation error
+        value = self['product'].value()
+        if not value:
+            return None
+        return Product.objects.filter(pk=value).only('sku', 'name').first() if str(value).isdigit() else None
+
+# Parehong limit ng StockMovementForm.unit_cost: kasya sa average_cost (max_digits=12, decimal_places=4)
+BATCH_UNIT_COST = forms.DecimalField(min_value=0, max_digits=12, decimal_places=4)
+
+class StockBatchForm(forms.Form):
+    # Isang linya kada item: "SKU, quantity[, unit cost]" (puwede ring tab o space ang separator)
+    lines = forms.CharField(widget=forms.Textarea(attrs={
+        'class': 'form-control font-monospace',
+        'rows': 12,
+        'placeholder': 'GEN-HND-001, 5\nGRC-STH-001, 12',
+    }))
+    reference = forms.CharField(required=False, max_length=100, widget=forms.TextInput(attrs={
+        'class': 'form-control',
+        'placeholder': 'Reference (e.g., Delivery Receipt #)',
+    }))
+    notes = forms.CharField(required=False, widget=forms.Textarea(attrs={
+        'class': 'form-control',
+        'rows': 2,
+        'placeholder': 'Additional notes',
+    }))
+
+    def clean_lines(self):
+        parsed = []
+        errors = []
+        for number, raw in enumerate(self.cleaned_data['lines'].splitlines(), start=1):
+            raw = raw.strip()
+            if not raw:
+                continue
+            parts = raw.replace(',', ' ').replace('\t', ' ').split()
+            # Parehong check ng batch API (is_int): ASCII digits lang at kasya sa IntegerField
+            quantity = parse_int(parts[1]) if len(parts) in (2, 3) else None
+            if not quantity:
+                errors.append(f'Line {number}: expected "SKU, quantity[, unit cost]" but got "{raw}".')
+                continue
+            unit_cost = None
+            if len(parts) == 3:
+                try:
+                    unit_cost = BATCH_UNIT_COST.clean(parts[2])
+                except forms.ValidationError as exc:
+                    errors.append(f'Line {number}: invalid unit cost "{parts[2]}" ({" ".join(exc.messages)})')
+                    continue
+            parsed.append((number, parts[0], quantity, unit_cost))
+        if not parsed and not errors:
+            errors.append('Enter at least one line.')
+
+        # Isang query para sa lahat ng SKU
+        products = dict(Product.objects.filter(
+            sku__in={sku for _, sku, _, _ in parsed}
+        ).values_list('sku', 'id'))
+        lines = []
+        for number, sku, quantity, unit_cost in parsed:
+            if sku not in products:
+                errors.append(f'Line {number}: unknown SKU "{sku}".')
+            else:
+                lines.append((products[sku], quantity, unit_cost))
+        if errors:
+            raise forms.ValidationError(errors)
+        return lines
+
+class ProductImportForm(forms.Form):
+    file = forms.FileField(widget=forms.ClearableFileInput(attrs={'class': 'form-control', 'accept': '.csv,text/csv'}))
@@ -0,0 +1,222 @@
+import csv
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+
+from .caching import invalidate_tags
+from .models import Category, Product
+from .numbers import MAX_INT, parse_int
+from .services import record_stock_batch
+from .versioning import bump_data_version
+
+
+IMPORT_CHUNK_SIZE = 2000
+
+REQUIRED_COLUMNS = {'name', 'sku'}
+# Ang quantity ng existing SKU ay hindi direktang ino-overwrite; adjustment movement ang ginagawa
+UPDATE_COLUMNS = ['name', 'category', 'description', 'unit', 'reorder_level', 'price', 'average_cost']
+ADJUSTMENT_REFERENCE = 'CSV import'
+UNIT_CODES = {code for code, _ in Product.UNIT_CHOICES}
+UNIT_LABELS = {label.lower(): code for code, label in Product.UNIT_CHOICES}
+
+
+class ImportResult:
+    def __init__(self):
+        self.processed = 0
+        self.imported = 0
+        self.categories_created = 0
+        self.adjustments = 0
+        self.malformed = False
+        self.errors = []
+
+    def add_error(self, line, message):
+        self.errors.append({'line': line, 'error': message})
+
+
+def _parse_int(row, name, default):
+    value = (row.get(name) or '').strip()
+    if not value:
+        return default
+    parsed = parse_int(value)
+    if parsed is None:
+        raise ValueError(f'invalid {name} {row.get(name)!r}: expected a whole number from 0 to {MAX_INT}')
+    return parsed
+
+
+def _parse_decimal(row, name):
+    # Limit ayon sa mismong column (max_digits, decimal_places); lampas dito ay InvalidOperation sa pagbasa
+    field = Product._meta.get_field(name)
+    raw = row.get(name)
+    try:
+        value = Decimal((raw or '0').strip().replace(',', '') or '0')
+    except InvalidOperation:
+        raise ValueError(f'invalid {name} {raw!r}')
+    limit = 10 ** (field.max_digits - field.decimal_places)
+    if not value.is_finite() or value < 0 or value.as_tuple().exponent < -field.decimal_places or value >= limit:
+        raise ValueError(
+            f'invalid {name} {raw!r}: must be from 0 to below {limit} '
+            f'with at most {field.decimal_places} decimal places'
+        )
+    return value
+
+
+def _parse_row(row, category_names):
+    name = (row.get('name') or '').strip()
+    sku = (row.get('sku') or '').strip()
+    if not name or not sku:
+        raise ValueError('name and sku are required')
+    if len(name) > 200 or len(sku) > 50:
+        raise ValueError('name or sku is too long')
+
+    unit = (row.get('unit') or 'pcs').strip()
+    unit = unit if unit in UNIT_CODES else UNIT_LABELS.get(unit.lower())
+    if unit is None:
+        raise ValueError(f"unknown unit {row.get('unit')!r}")
+
+    price = _parse_decimal(row, 'price')
+    average_cost = _parse_decimal(row, 'average_cost')
+    quantity = _parse_int(row, 'quantity', 0)
+    reorder_level = _parse_int(row, 'reorder_level', 5)
+
+    category = (row.get('category') or '').strip()
+    if len(category) > 100:
+        raise ValueError('category name is too long')
+    if category:
+        category_names.add(category)
+    return {
+        'name': name,
+        'sku': sku,
+        'category': category,
+        'description': (row.get('description') or '').strip() or None,
+        'unit': unit,
+        'quantity': quantity,
+        'reorder_level': reorder_level,
+        'price': price,
+        'average_cost': average_cost,
+    }
+
+
+def _resolve_categories(names, category_map, result):
+    missing = [name for name in names if name not in category_map]
+    if not missing:
+        return
+    Category.objects.bulk_create([Category(name=name) for name in missing], ignore_conflicts=True)
+    created = dict(Category.objects.filter(name__in=missing).values_list('name', 'id'))
+    result.categories_created += len(created)
+    category_map.update(created)
+
+
+def _flush(rows, category_map, update_fields, set_quantity, result, user=None, ip_address=None):
+    # Huling row ang panalo kapag umulit ang SKU sa iisang chunk
+    by_sku = {}
+    for values in rows:
+        by_sku[values['sku']] = values
+    products = [
+        Product(
+            name=values['name'],
+            sku=values['sku'],
+            category_id=category_map.get(values['category']),
+            description=values['description'],
+            unit=values['unit'],
+            quantity=values['quantity'],
+            reorder_level=values['reorder_level'],
+            price=values['price'],
+            average_cost=values['average_cost'],
+        )
+        for values in by_sku.values()
+    ]
+    with transaction.atomic():
+        existing = {}
+        if set_quantity:
+            # Naka-lock hanggang matapos ang adjustments, kaya tama ang difference
+            existing = dict(
+                Product.objects.select_for_update().filter(sku__in=list(by_sku)).values_list('sku', 'quantity')
+            )
+        Product.objects.bulk_create(
+            products,
+            update_conflicts=True,
+            unique_fields=['sku'],
+            update_fields=update_fields,
+        )
+        if existing:
+            _record_adjustments(by_sku, existing, result, user, ip_address)
+    result.imported += len(products)
+
+
+def _record_adjustments(by_sku, existing, result, user, ip_address):
+    # Bagong quantity sa file ng existing SKU: IN/OUT movement para sa difference, para tugma
+    # pa rin ang ledger, rollup, snapshots at reports sa Product.quantity
+    ids = dict(Product.objects.filter(sku__in=list(existing)).values_list('sku', 'id'))
+    lines = {'IN': [], 'OUT': []}
+    for sku, current in existing.items():
+        difference = by_sku[sku]['quantity'] - current
+        if difference:
+            lines['IN' if difference > 0 else 'OUT'].append((ids[sku], abs(difference)))
+    for movement_type, movement_lines in lines.items():
+        if movement_lines:
+            record_stock_batch(
+                movement_type, movement_lines, user,
+                reference=ADJUSTMENT_REFERENCE, notes='Stock count from product import', ip_address=ip_address,
+            )
+            result.adjustments += len(movement_lines)
+
+
+def import_products(stream, chunk_size=IMPORT_CHUNK_SIZE, user=None, ip_address=None):
+    """
+    Mag-import ng products mula sa CSV (text stream) na may header row.
+
+    Columns: name, sku (required), category, description, unit, quantity, reorder_level, price, average_cost.
+    Upsert by SKU; ang mga row na may mali ay nilalaktawan at inirereport sa dulo. Sa existing SKU,
+    ang quantity ay ina-apply bilang stock adjustment (StockMovement) na naka-record kay `user`.
+    """
+    result = ImportResult()
+    reader = csv.DictReader(stream)
+    try:
+        fieldnames = reader.fieldnames
+    except csv.Error as exc:
+        result.malformed = True
+        result.add_error(reader.line_num or 1, f'Malformed CSV: {exc}')
+        return result
+    columns = {(column or '').strip().lower() for column in fieldnames or []}
+    if not REQUIRED_COLUMNS <= columns:
+        result.add_error(1, 'CSV header must include at least "name" and "sku" columns.')
+        return result
+    reader.fieldnames = [(column or '').strip().lower() for column in reader.fieldnames]
+
+    # Sa existing SKU, ang mga column lang na nasa file ang ina-update (hal. walang quantity = hindi gagalawin)
+    update_fields = [column for column in UPDATE_COLUMNS if column in columns] + ['updated_at']
+
+    set_quantity = 'quantity' in columns
+    flush_options = {'user': user, 'ip_address': ip_address}
+
+    category_map = dict(Category.objects.values_list('name', 'id'))
+    rows = []
+    category_names = set()
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            break
+        except csv.Error as exc:
+            # Hal. NUL byte o sobrang habang field: itigil dito, pero i-import ang mga naunang row
+            result.malformed = True
+            # line_num ay bilang pa ng mga naunang linya; ang sira ay ang susunod
+            result.add_error(reader.line_num + 1, f'Malformed CSV, rows from this line on were not imported: {exc}')
+            break
+        result.processed += 1
+        try:
+            rows.append(_parse_row(row, category_names))
+        except ValueError as exc:
+            result.add_error(reader.line_num, str(exc))
+        if len(rows) >= chunk_size:
+            _resolve_categories(category_names, category_map, result)
+            _flush(rows, category_map, update_fields, set_quantity, result, **flush_options)
+            rows, category_names = [], set()
+    if rows:
+        _resolve_categories(category_names, category_map, result)
+        _flush(rows, category_map, update_fields, set_quantity, result, **flush_options)
+
+    if result.imported:
+        bump_data_version()
+        invalidate_tags('products', 'categories')
+    return result
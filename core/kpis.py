@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from .models import Category, DailyMovementSummary, Product, StockMovement
+from .routers import replica_used
+from .versioning import get_data_version
+
+
+SNAPSHOT_TIMEOUT = 60 * 60
+
+
+def compute_dashboard_snapshot(today=None):
+    today = today or timezone.localdate()
+    start_day = today - timedelta(days=6)
+
+    # Isang query lang para sa lahat ng product KPIs (conditional aggregation)
+    kpis = Product.objects.aggregate(
+        total_products=Count('id'),
+        low_stock_products=Count('id', filter=Q(quantity__lte=F('reorder_level'))),
+        out_of_stock=Count('id', filter=Q(quantity=0)),
+        total_stock_value=Sum(F('quantity') * F('price')),
+        total_stock_cost=Sum(F('quantity') * F('average_cost')),
+    )
+    kpis['total_stock_value'] = kpis['total_stock_value'] or 0
+    kpis['total_stock_cost'] = kpis['total_stock_cost'] or 0
+    kpis['total_categories'] = Category.objects.count()
+
+    # 7-day IN/OUT series galing sa daily rollup, isang GROUP BY lang
+    totals = {}
+    rows = DailyMovementSummary.objects.filter(day__gte=start_day).values(
+        'day', 'movement_type'
+    ).annotate(total=Sum('quantity')).order_by()
+    for row in rows:
+        totals[(row['day'], row['movement_type'])] = row['total'] or 0
+
+    days = [start_day + timedelta(days=i) for i in range(7)]
+    kpis['chart_labels'] = [day.strftime('%b %d') for day in days]
+    kpis['stock_in_data'] = [totals.get((day, 'IN'), 0) for day in days]
+    kpis['stock_out_data'] = [totals.get((day, 'OUT'), 0) for day in days]
+
+    kpis['low_stock_items'] = list(
+        Product.objects.filter(quantity__lte=F('reorder_level')).order_by('quantity')[:5]
+    )
+    kpis['recent_movements'] = list(StockMovement.objects.select_related('product').all()[:5])
+    kpis['top_products'] = list(
+        Product.objects.annotate(stock_value=F('quantity') * F('price')).order_by('-stock_value')[:5]
+    )
+    return kpis
+
+
+def get_dashboard_snapshot():
+    # Kasama ang petsa sa key para mag-roll over ang 7-day chart pagdating ng hatinggabi
+    today = timezone.localdate()
+    key = f'core:dashboard:{get_data_version()}:{today.isoformat()}'
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = compute_dashboard_snapshot(today)
+        # Galing sa replica na puwedeng nahuhuli: huwag itago nang matagal sa bagong version
+        timeout = min(SNAPSHOT_TIMEOUT, settings.REPLICA_CACHE_TIMEOUT) if replica_used() else SNAPSHOT_TIMEOUT
+        cache.set(key, snapshot, timeout)
+    return snapshot
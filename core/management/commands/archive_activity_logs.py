@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.archive import ARCHIVE_CHUNK_SIZE, archive_activity_logs
+
+
+class Command(BaseCommand):
+    help = 'Move activity log entries older than the retention horizon into monthly gzip JSONL archives'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.ACTIVITY_LOG_RETENTION_DAYS,
+                            help='Keep this many days of activity in the database')
+        parser.add_argument('--chunk-size', type=int, default=ARCHIVE_CHUNK_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help='Only count the entries that would be archived')
+
+    def handle(self, *args, **options):
+        if options['days'] < 1 or options['chunk_size'] < 1:
+            raise CommandError('--days and --chunk-size must be at least 1.')
+        count = archive_activity_logs(options['days'], options['chunk_size'], options['dry_run'])
+        if options['dry_run']:
+            self.stdout.write(f'{count} activity log entries are older than {options["days"]} days.')
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'Archived {count} activity log entries to {settings.ACTIVITY_LOG_ARCHIVE_DIR}.'
+            ))
@@ -0,0 +1,119 @@
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.decorators import login_required
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.auth.models import User
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.auth import user_cache
+from core.decorators import single_admin_required
+
+
+SESSION_ENGINES = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+MODEL_BACKEND = 'django.contrib.auth.backends.ModelBackend'
+CACHED_BACKEND = 'core.auth.CachedModelBackend'
+# Ilang request na may query capture (mas mabagal ang debug cursor, kaya hiwalay sa timing)
+QUERY_SAMPLE = 20
+
+
+@login_required
+@single_admin_required
+def _bench_view(request):
+    # Walang inventory work: auth overhead lang ang nasusukat
+    return HttpResponse('ok')
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure per-request auth overhead (session load + login_required + single_admin_required) '
+        'for each session engine, with and without the cached user backend'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000, help='Timed requests per mode')
+        parser.add_argument('--username', default=None,
+                            help='Admin user to authenticate as; a temporary superuser is used if omitted')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1:
+            raise CommandError('--requests must be at least 1.')
+        temporary = options['username'] is None
+        if temporary:
+            user = User.objects.create_superuser(f'bench-auth-{int(time.time() * 1000)}', password=None)
+        else:
+            user = User.objects.filter(username=options['username']).first()
+            if user is None:
+                raise CommandError(f"User {options['username']} does not exist.")
+
+        rows = []
+        try:
+            for engine_name, engine in SESSION_ENGINES.items():
+                for cached in (False, True):
+                    rows.append(self._bench(engine_name, engine, cached, user, options['requests']))
+        finally:
+            user_cache.invalidate()
+            if temporary:
+                user.delete()
+
+        baseline = rows[0]['us']
+        self.stdout.write(f"{'session':<15} {'user cache':<11} {'us/request':>11} {'queries':>8} {'speedup':>8}")
+        for row in rows:
+            self.stdout.write(
+                f"{row['engine']:<15} {('on' if row['cached'] else 'off'):<11} {row['us']:>11.1f} "
+                f"{row['queries']:>8.2f} {baseline / row['us']:>7.2f}x"
+            )
+
+    def _bench(self, engine_name, engine, cached, user, count):
+        backend = CACHED_BACKEND if cached else MODEL_BACKEND
+        with override_settings(
+            SESSION_ENGINE=engine,
+            AUTHENTICATION_BACKENDS=[backend],
+            AUTH_USER_CACHE_TTL=settings.AUTH_USER_CACHE_TTL if cached else 0,
+        ):
+            user_cache.invalidate()
+            session = import_module(engine).SessionStore()
+            session[SESSION_KEY] = str(user.pk)
+            session[BACKEND_SESSION_KEY] = backend
+            session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+            session.save()
+
+            handler = SessionMiddleware(AuthenticationMiddleware(_bench_view))
+            factory = RequestFactory()
+
+            def request_once():
+                request = factory.get('/dashboard/')
+                request.COOKIES[settings.SESSION_COOKIE_NAME] = session.session_key
+                response = handler(request)
+                if response.status_code != 200:
+                    raise CommandError(f'{engine_name}: request was not authenticated ({response.status_code}).')
+
+            # Warm-up: laman ng session cache, user cache, at template/URL imports
+            for _ in range(10):
+                request_once()
+            with CaptureQueriesContext(connection) as queries:
+                for _ in range(QUERY_SAMPLE):
+                    request_once()
+            start = time.perf_counter()
+            for _ in range(count):
+                request_once()
+            elapsed = time.perf_counter() - start
+
+            session.delete()
+        return {
+            'engine': engine_name,
+            'cached': cached,
+            'us': elapsed / count * 1e6,
+            'queries': len(queries.captured_queries) / QUERY_SAMPLE,
+        }
@@ -0,0 +1,180 @@
+import json
+import platform
+import statistics
+import time
+
+import django
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import (
+    CaptureQueriesContext, setup_databases, setup_test_environment, teardown_databases,
+    teardown_test_environment,
+)
+from django.utils import timezone
+
+from core.benchmarks import QUERY_BUDGETS, bench_cases, bench_context, products_for, send_case, uncovered_urls
+from core.seeding import clear_seeded, seed_inventory
+
+
+DEFAULT_SIZES = '1000,100000,1000000'
+
+
+class Command(BaseCommand):
+    help = (
+        'Optional large-data benchmark of every core URL on seeded test databases of increasing '
+        'size: wall time and query count per view, failing when the query count grows with the '
+        'data, exceeds its query budget (core.benchmarks.QUERY_BUDGETS) or scales worse than expected'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                            help=f'Comma-separated movement counts to seed (default {DEFAULT_SIZES})')
+        parser.add_argument('--repeat', type=int, default=3, help='Timed requests per case; the median is kept')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', help='Write the results as JSON to this file')
+        parser.add_argument('--flat-limit', type=float, default=5.0,
+                            help="Max slowdown from the smallest to the largest size for 'flat' views")
+        parser.add_argument('--min-ms', type=float, default=20.0,
+                            help='Ignore scaling checks for views faster than this at the largest size')
+        parser.add_argument('--only', nargs='+', metavar='LABEL', help='Run only these cases')
+
+    def handle(self, *args, **options):
+        try:
+            sizes = sorted({int(size) for size in options['sizes'].split(',') if size.strip()})
+        except ValueError:
+            raise CommandError('--sizes must be a comma-separated list of integers.')
+        if not sizes or sizes[0] < 1:
+            raise CommandError('--sizes must contain positive movement counts.')
+
+        cases = bench_cases()
+        missing = uncovered_urls(cases)
+        if missing:
+            raise CommandError(f"No benchmark case for URL(s): {', '.join(missing)}. Add them to BENCH_CASES.")
+        if options['only']:
+            cases = [case for case in cases if case['label'] in options['only']]
+            if not cases:
+                raise CommandError('No benchmark case matches --only.')
+
+        setup_test_environment()
+        old_config = setup_databases(verbosity=0, interactive=False, aliases={'default'})
+        try:
+            with override_settings(
+                ACTIVITY_LOG_SYNC=True,
+                LIVE_EVENTS_ENABLED=False,
+                VIEW_CACHE_ENABLED=False,
+                AUTH_USER_CACHE_TTL=0,
+                CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                                    'LOCATION': 'bench-views'}},
+            ):
+                results = []
+                for size in sizes:
+                    results.extend(self._run_size(size, cases, options))
+        finally:
+            teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+
+        failures = self._check(results, sizes, options)
+        report = {
+            'generated_at': timezone.now().isoformat(),
+            'django': django.get_version(),
+            'python': platform.python_version(),
+            'database': connection.vendor,
+            'sizes': sizes,
+            'results': results,
+            'failures': failures,
+        }
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as fh:
+                json.dump(report, fh, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+        if failures:
+            for failure in failures:
+                self.stderr.write(f'FAIL {failure}')
+            raise CommandError(f'{len(failures)} benchmark check(s) failed.')
+        self.stdout.write(self.style.SUCCESS('All views within their query budgets and scaling limits.'))
+
+    def _run_size(self, size, cases, options):
+        started = time.perf_counter()
+        clear_seeded(options['seed'])
+        cache.clear()
+        user = User.objects.filter(username='bench-admin').first() or User.objects.create_superuser(
+            'bench-admin', password=None
+        )
+        counts = seed_inventory(products_for(size), size, seed=options['seed'], user=user)
+        self.stdout.write(
+            f"\nSeeded {counts['products']} products / {counts['movements']} movements "
+            f'in {time.perf_counter() - started:.1f}s'
+        )
+
+        context = bench_context(options['seed'])
+        client = Client()
+        client.force_login(user)
+
+        results = []
+        for case in cases:
+            response = send_case(client, case, context)  # warm-up (templates, imports)
+            if response.status_code >= 400:
+                raise CommandError(f"{case['label']}: HTTP {response.status_code} at size {size}.")
+            timings = []
+            for _ in range(max(1, options['repeat'])):
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    response = send_case(client, case, context)
+                    if response.streaming:
+                        b''.join(response.streaming_content)
+                    timings.append((time.perf_counter() - started) * 1000)
+            result = {
+                'label': case['label'],
+                'url': case['url'],
+                'movements': size,
+                'products': counts['products'],
+                'status': response.status_code,
+                'queries': len(queries.captured_queries),
+                'budget': QUERY_BUDGETS[case['label']],
+                'scaling': case['scaling'],
+                'ms': round(statistics.median(timings), 2),
+                'ms_runs': [round(value, 2) for value in timings],
+            }
+            results.append(result)
+            flag = '' if result['queries'] <= result['budget'] else '  OVER BUDGET'
+            self.stdout.write(
+                f"{case['label']:<32} {result['ms']:>9.1f} ms {result['queries']:>4} queries "
+                f"(budget {result['budget']}){flag}"
+            )
+        return results
+
+    def _check(self, results, sizes, options):
+        failures = []
+        by_label = {}
+        for result in results:
+            by_label.setdefault(result['label'], {})[result['movements']] = result
+            if result['queries'] > result['budget']:
+                failures.append(
+                    f"{result['label']} at {result['movements']} movements: "
+                    f"{result['queries']} queries, budget {result['budget']}"
+                )
+        if len(sizes) < 2:
+            return failures
+
+        smallest, largest = sizes[0], sizes[-1]
+        data_ratio = largest / smallest
+        for label, per_size in by_label.items():
+            first, last = per_size[smallest], per_size[largest]
+            # Dapat pareho ang bilang ng queries sa lahat ng laki; kung lumalaki, may N+1
+            if last['queries'] > first['queries']:
+                failures.append(
+                    f"{label}: query count grows with data ({first['queries']} -> {last['queries']}), likely N+1"
+                )
+            if last['ms'] < options['min_ms']:
+                continue
+            ratio = last['ms'] / max(first['ms'], 0.01)
+            limit = options['flat_limit'] if last['scaling'] == 'flat' else data_ratio * 1.5
+            if ratio > limit:
+                failures.append(
+                    f"{label}: {ratio:.1f}x slower from {smallest} to {largest} movements "
+                    f"(limit {limit:.1f}x for '{last['scaling']}')"
+                )
+        return failures
@@ -0,0 +1,36 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from core.caching import cache_stats, invalidate_tags, reset_cache_stats
+
+
+class Command(BaseCommand):
+    help = 'Show hit/miss counters of the view and fragment cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--json', action='store_true', help='Print the counters as JSON')
+        parser.add_argument('--reset', action='store_true', help='Reset the counters after printing')
+        parser.add_argument('--invalidate', nargs='+', metavar='TAG',
+                            help='Invalidate cache tags (e.g. products categories movements activity)')
+
+    def handle(self, *args, **options):
+        if options['invalidate']:
+            invalidate_tags(*options['invalidate'])
+            self.stdout.write(self.style.SUCCESS(f"Invalidated: {', '.join(options['invalidate'])}"))
+
+        stats = cache_stats()
+        if options['json']:
+            self.stdout.write(json.dumps(stats, indent=2))
+        elif not stats:
+            self.stdout.write('No cache activity recorded yet.')
+        else:
+            width = max(len(name) for name in stats)
+            self.stdout.write(f"{'name'.ljust(width)}  {'hits':>8}  {'misses':>8}  {'hit rate':>8}")
+            for name, row in stats.items():
+                rate = f"{row['hit_rate']:.1%}" if row['hit_rate'] is not None else '-'
+                self.stdout.write(f"{name.ljust(width)}  {row['hits']:>8}  {row['misses']:>8}  {rate:>8}")
+
+        if options['reset']:
+            reset_cache_stats()
+            self.stdout.write('Counters reset.')
@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.models import ActivityLog, DailyMovementSummary, StockMovement
+from core.timeutils import date_range_filter
+from core.views import stock_out_queryset
+
+
+def report_queries():
+    today = timezone.localdate()
+    month_ago = today - timedelta(days=30)
+    day_from, day_to = month_ago.isoformat(), today.isoformat()
+
+    # (paglalarawan, queryset, inaasahang index)
+    return [
+        (
+            'stock_out_report detail (date range)',
+            stock_out_queryset(day_from, day_to).order_by('-date', '-id')[:50],
+            'movement_type_date_idx',
+        ),
+        (
+            'product_detail recent movements',
+            StockMovement.objects.filter(product_id=1).order_by('-date')[:10],
+            'movement_product_date_idx',
+        ),
+        (
+            'activity_log filtered by action and date',
+            ActivityLog.objects.filter(
+                action='STOCK_OUT', **date_range_filter('timestamp', month_ago, today)
+            ).order_by('-timestamp', '-id')[:50],
+            'activity_action_ts_idx',
+        ),
+        (
+            'activity_log first page',
+            ActivityLog.objects.order_by('-timestamp', '-id')[:50],
+            'activity_ts_idx',
+        ),
+        (
+            'stock out period totals (rollup)',
+            DailyMovementSummary.objects.filter(movement_type='OUT', day__gte=month_ago, day__lte=today),
+            DailyMovementSummary._meta.indexes[0].name,
+        ),
+    ]
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN the report queries and fail if they do not use their composite indexes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verbose-plans', action='store_true', help='Print the full query plans')
+
+    def handle(self, *args, **options):
+        failures = []
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # Sa maliit na tables mas gusto ng planner ang seq scan; patayin para makita ang index choice
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+            for label, queryset, index_name in report_queries():
+                plan = queryset.explain()
+                if options['verbose_plans']:
+                    self.stdout.write(f'{label}:\n{plan}\n')
+                if index_name in plan:
+                    self.stdout.write(self.style.SUCCESS(f'OK   {label} -> {index_name}'))
+                else:
+                    self.stdout.write(self.style.ERROR(f'FAIL {label} (expected {index_name})'))
+                    failures.append(label)
+
+        if failures:
+            raise CommandError(f'{len(failures)} report queries are not using their indexes.')
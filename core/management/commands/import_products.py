@@ -0,0 +1,35 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from core.importers import IMPORT_CHUNK_SIZE, import_products
+
+
+class Command(BaseCommand):
+    help = 'Import or update products (upsert by SKU) from a CSV file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV file with a header row (name, sku, category, unit, quantity, reorder_level, price, average_cost)')
+        parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE)
+        parser.add_argument('--encoding', default='utf-8-sig')
+        parser.add_argument('--user', help='Username recorded on stock adjustments (default: first superuser)')
+
+    def handle(self, *args, **options):
+        if options['user']:
+            user = User.objects.filter(username=options['user']).first()
+            if user is None:
+                raise CommandError(f"User '{options['user']}' does not exist.")
+        else:
+            user = User.objects.filter(is_superuser=True).first()
+        try:
+            with open(options['path'], newline='', encoding=options['encoding']) as fh:
+                result = import_products(fh, chunk_size=options['chunk_size'], user=user)
+        except (OSError, UnicodeDecodeError) as exc:
+            raise CommandError(str(exc))
+
+        for error in result.errors:
+            self.stderr.write(f"Line {error['line']}: {error['error']}")
+        self.stdout.write(self.style.SUCCESS(
+            f'Processed {result.processed} rows: {result.imported} products imported, '
+            f'{result.categories_created} new categories, {result.adjustments} stock adjustments, '
+            f'{len(result.errors)} errors.'
+        ))
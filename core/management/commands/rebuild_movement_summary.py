@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from core.caching import invalidate_tags
+from core.rollups import rebuild_daily_summaries
+from core.versioning import bump_data_version
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the DailyMovementSummary rollup table from the StockMovement ledger'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        created = rebuild_daily_summaries(batch_size=options['batch_size'])
+        bump_data_version()
+        invalidate_tags('movements')
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {created} daily movement summary rows.'))
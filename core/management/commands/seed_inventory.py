@@ -0,0 +1,72 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import Product
+from core.seeding import SEED_BATCH_SIZE, clear_seeded, seed_inventory, seed_sku_prefix
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate a deterministic synthetic dataset for capacity testing: products, stock movement '
+        'history, activity logs and daily rollups, with quantities consistent with the ledger'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--products', type=int, default=1000)
+        parser.add_argument('--movements', type=int, default=100000)
+        parser.add_argument('--days', type=int, default=365, help='Length of the movement history in days')
+        parser.add_argument('--seed', type=int, default=0, help='Same seed, same dataset; also namespaces the SKUs')
+        parser.add_argument('--user', help='Username recorded as performer (default: first superuser)')
+        parser.add_argument('--batch-size', type=int, default=SEED_BATCH_SIZE)
+        parser.add_argument('--no-activity', action='store_true', help='Skip the activity log rows')
+        parser.add_argument('--clear', action='store_true', help='Delete an existing dataset with this seed first')
+
+    def handle(self, *args, **options):
+        if options['products'] < 1 or options['movements'] < 0 or options['days'] < 1:
+            raise CommandError('--products and --days must be at least 1, --movements at least 0.')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1.')
+
+        if options['user']:
+            user = User.objects.filter(username=options['user']).first()
+            if user is None:
+                raise CommandError(f"User '{options['user']}' does not exist.")
+        else:
+            user = User.objects.filter(is_superuser=True).first()
+
+        prefix = seed_sku_prefix(options['seed'])
+        if Product.objects.filter(sku__startswith=prefix).exists():
+            if not options['clear']:
+                raise CommandError(
+                    f"A dataset with seed {options['seed']} already exists (SKUs {prefix}*). "
+                    'Use --clear to replace it or pick another --seed.'
+                )
+            started = time.perf_counter()
+            removed = clear_seeded(options['seed'])
+            self.stdout.write(f'Removed {removed} seeded products in {time.perf_counter() - started:.1f}s')
+
+        started = time.perf_counter()
+
+        def progress(created, total):
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f'  {created}/{total} movements ({created / max(elapsed, 1e-9):.0f}/s)')
+
+        counts = seed_inventory(
+            options['products'],
+            options['movements'],
+            days=options['days'],
+            seed=options['seed'],
+            user=user,
+            activity=not options['no_activity'],
+            batch_size=options['batch_size'],
+            progress=progress if options['verbosity'] > 1 else None,
+        )
+        elapsed = time.perf_counter() - started
+        rows = sum(counts[name] for name in ('products', 'movements', 'activity_logs', 'daily_summaries'))
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {counts['products']} products, {counts['movements']} movements, "
+            f"{counts['activity_logs']} activity logs and {counts['daily_summaries']} daily summaries "
+            f'in {elapsed:.1f}s ({rows / max(elapsed, 1e-9):.0f} rows/s).'
+        ))
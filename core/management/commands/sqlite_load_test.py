@@ -0,0 +1,148 @@
+import multiprocessing
+import random
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection
+from django.db.models import Sum
+
+from core.activity import writer
+from core.models import ActivityLog, Product, StockMovement
+from core.services import InsufficientStock, record_stock_movement
+from core.sqlite import current_pragmas, is_lock_error, production_mode
+
+
+def _percentile(values, fraction):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def _worker(seed, product_ids, user_id, seconds, results):
+    # Bagong process (fork): sariling connection at sariling activity writer
+    connection.close()
+    rng = random.Random(seed)
+    user = User.objects.filter(pk=user_id).first()
+    tally = {'writes': 0, 'in': {}, 'out': {}, 'rejected': 0, 'lock_errors': 0, 'errors': 0, 'latencies': []}
+    deadline = time.monotonic() + seconds
+    try:
+        while time.monotonic() < deadline:
+            product_id = rng.choice(product_ids)
+            movement_type = rng.choice(['IN', 'OUT', 'OUT'])
+            quantity = rng.randint(1, 5)
+            movement = StockMovement(
+                product_id=product_id,
+                movement_type=movement_type,
+                quantity=quantity,
+                performed_by=user,
+                reference='sqlite-load-test',
+            )
+            started = time.perf_counter()
+            try:
+                record_stock_movement(movement)
+            except InsufficientStock:
+                tally['rejected'] += 1
+            except OperationalError as exc:
+                tally['lock_errors' if is_lock_error(exc) else 'errors'] += 1
+            else:
+                tally['writes'] += 1
+                side = tally['in'] if movement_type == 'IN' else tally['out']
+                side[product_id] = side.get(product_id, 0) + quantity
+            tally['latencies'].append(time.perf_counter() - started)
+        writer.shutdown()
+    finally:
+        connection.close()
+        results.put(tally)
+
+
+class Command(BaseCommand):
+    help = (
+        'Multi-process write load test for SQLite production mode: stock in/out from several '
+        'processes on scratch products, reporting sustained writes/s, latency and lock errors'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=4)
+        parser.add_argument('--seconds', type=float, default=10.0, help='Duration of the load per process')
+        parser.add_argument('--products', type=int, default=10, help='Number of scratch products')
+        parser.add_argument('--initial', type=int, default=500, help='Starting quantity of each scratch product')
+        parser.add_argument('--seed', type=int, default=None)
+        parser.add_argument('--keep', action='store_true', help='Keep the scratch products and their history')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('This load test is for SQLite databases only.')
+        if options['processes'] < 1 or options['products'] < 1:
+            raise CommandError('--processes and --products must be at least 1.')
+
+        mode = 'on' if production_mode() else 'off'
+        pragmas = ', '.join(f'{name}={value}' for name, value in current_pragmas().items())
+        self.stdout.write(f'SQLite production mode: {mode} ({pragmas})')
+
+        rng = random.Random(options['seed'])
+        user = User.objects.filter(is_superuser=True).first()
+        stamp = int(time.time() * 1000)
+        products = Product.objects.bulk_create([
+            Product(name=f'Load Test Product {index}', sku=f'LOAD-{stamp}-{index}',
+                    quantity=options['initial'], price=10)
+            for index in range(options['products'])
+        ])
+        product_ids = [product.pk for product in products]
+
+        # Walang bukas na connection na mamanahin ng forked processes
+        connection.close()
+        context = multiprocessing.get_context('fork')
+        results = context.Queue()
+        processes = [
+            context.Process(
+                target=_worker,
+                args=(rng.random(), product_ids, user.pk if user else None, options['seconds'], results),
+            )
+            for _ in range(options['processes'])
+        ]
+        started = time.perf_counter()
+        for process in processes:
+            process.start()
+        tallies = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - started
+
+        writes = sum(t['writes'] for t in tallies)
+        lock_errors = sum(t['lock_errors'] for t in tallies)
+        errors = sum(t['errors'] for t in tallies)
+        latencies = [value for t in tallies for value in t['latencies']]
+        self.stdout.write(
+            f"{writes} stock movements from {options['processes']} processes in {elapsed:.2f}s "
+            f"({writes / elapsed:.0f} writes/s sustained), {sum(t['rejected'] for t in tallies)} rejected for stock"
+        )
+        self.stdout.write(
+            f'latency p50={_percentile(latencies, 0.5) * 1000:.1f}ms '
+            f'p95={_percentile(latencies, 0.95) * 1000:.1f}ms max={max(latencies, default=0) * 1000:.1f}ms; '
+            f'{lock_errors} lock errors, {errors} other database errors'
+        )
+
+        # Quantity ng bawat product ay dapat tugma sa ledger at sa tallies ng workers
+        drift = []
+        ledger = {}
+        for product_id, movement_type, total in StockMovement.objects.filter(
+            product_id__in=product_ids
+        ).values_list('product_id', 'movement_type').annotate(Sum('quantity')):
+            ledger[(product_id, movement_type)] = total
+        for product in Product.objects.filter(pk__in=product_ids):
+            applied = sum(t['in'].get(product.pk, 0) - t['out'].get(product.pk, 0) for t in tallies)
+            from_ledger = ledger.get((product.pk, 'IN'), 0) - ledger.get((product.pk, 'OUT'), 0)
+            expected = options['initial'] + applied
+            if product.quantity != expected or product.quantity != options['initial'] + from_ledger:
+                drift.append(f'{product.sku}: quantity={product.quantity} expected={expected}')
+
+        if not options['keep']:
+            ActivityLog.objects.filter(model_name='Product', object_id__in=product_ids).delete()
+            Product.objects.filter(pk__in=product_ids).delete()
+        if drift:
+            raise CommandError('Stock drift detected: ' + '; '.join(drift))
+        if lock_errors or errors:
+            raise CommandError(f'{lock_errors + errors} writes failed with database errors.')
+        self.stdout.write(self.style.SUCCESS('No lock errors and no drift.'))
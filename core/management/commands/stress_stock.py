@@ -0,0 +1,101 @@
+import random
+import threading
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection
+from django.db.models import Sum
+
+from core.models import ActivityLog, Product, StockMovement
+from core.services import InsufficientStock, record_stock_movement
+
+
+class Command(BaseCommand):
+    help = (
+        'Hammer the stock service from many threads on a scratch product and verify that '
+        'Product.quantity matches the movement ledger (no lost updates, no oversell)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--operations', type=int, default=200, help='Operations per thread')
+        parser.add_argument('--initial', type=int, default=50, help='Starting quantity of the scratch product')
+        parser.add_argument('--seed', type=int, default=None)
+        parser.add_argument('--keep', action='store_true', help='Keep the scratch product and its history')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        user = User.objects.filter(is_superuser=True).first()
+        product = Product.objects.create(
+            name='Stress Test Product',
+            sku=f'STRESS-{int(time.time() * 1000)}',
+            quantity=options['initial'],
+            price=10,
+        )
+        tallies = []
+        lock = threading.Lock()
+
+        def worker(seed):
+            local_rng = random.Random(seed)
+            tally = {'in': 0, 'out': 0, 'rejected': 0, 'errors': 0}
+            try:
+                for _ in range(options['operations']):
+                    movement_type = local_rng.choice(['IN', 'OUT', 'OUT'])
+                    quantity = local_rng.randint(1, 5)
+                    movement = StockMovement(
+                        product_id=product.pk,
+                        movement_type=movement_type,
+                        quantity=quantity,
+                        performed_by=user,
+                        reference='stress-test',
+                    )
+                    try:
+                        record_stock_movement(movement)
+                    except InsufficientStock:
+                        tally['rejected'] += 1
+                    except OperationalError:
+                        # Hal. "database is locked" sa SQLite; rolled back kaya hindi drift
+                        tally['errors'] += 1
+                    else:
+                        tally['in' if movement_type == 'IN' else 'out'] += quantity
+            finally:
+                connection.close()
+                with lock:
+                    tallies.append(tally)
+
+        threads = [
+            threading.Thread(target=worker, args=(rng.random(),))
+            for _ in range(options['threads'])
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        product.refresh_from_db()
+        ledger = dict(
+            StockMovement.objects.filter(product=product).values_list('movement_type').annotate(Sum('quantity'))
+        )
+        applied_in = sum(t['in'] for t in tallies)
+        applied_out = sum(t['out'] for t in tallies)
+        expected = options['initial'] + applied_in - applied_out
+        from_ledger = options['initial'] + (ledger.get('IN') or 0) - (ledger.get('OUT') or 0)
+
+        total_ops = options['threads'] * options['operations']
+        self.stdout.write(
+            f'{total_ops} operations in {elapsed:.2f}s ({total_ops / elapsed:.0f} ops/s): '
+            f"+{applied_in} / -{applied_out}, {sum(t['rejected'] for t in tallies)} rejected for stock, "
+            f"{sum(t['errors'] for t in tallies)} database errors"
+        )
+        self.stdout.write(f'quantity={product.quantity} expected={expected} ledger={from_ledger}')
+
+        drift = product.quantity != expected or product.quantity != from_ledger or product.quantity < 0
+        if not options['keep']:
+            ActivityLog.objects.filter(model_name='Product', object_id=product.pk).delete()
+            product.delete()
+        if drift:
+            raise CommandError('Stock drift detected under contention.')
+        self.stdout.write(self.style.SUCCESS('No drift: quantity matches the ledger.'))
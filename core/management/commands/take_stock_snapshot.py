@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.snapshots import SNAPSHOT_BATCH_SIZE, latest_snapshot_day, take_snapshot
+from core.timeutils import parse_date
+
+
+class Command(BaseCommand):
+    help = 'Write end-of-day StockSnapshot rows (run at close, e.g. daily from cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help='Day to snapshot (YYYY-MM-DD); defaults to today')
+        parser.add_argument('--force', action='store_true',
+                            help='Ignore STOCK_SNAPSHOT_INTERVAL_DAYS and snapshot anyway')
+        parser.add_argument('--batch-size', type=int, default=SNAPSHOT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        day = timezone.localdate()
+        if options['date']:
+            day = parse_date(options['date'])
+            if day is None:
+                raise CommandError('--date must be in YYYY-MM-DD format.')
+
+        interval = settings.STOCK_SNAPSHOT_INTERVAL_DAYS
+        previous = latest_snapshot_day(on_or_before=day)
+        if not options['force'] and previous is not None and previous != day and (day - previous).days < interval:
+            self.stdout.write(f'Skipped: last snapshot is {previous}, interval is {interval} day(s).')
+            return
+
+        written = take_snapshot(day, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Wrote {written} stock snapshot rows for {day}.'))
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-18 14:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_stockmovement_price_at_movement_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyMovementSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('movement_type', models.CharField(choices=[('IN', 'Stock In'), ('OUT', 'Stock Out')], max_length=3)),
+                ('quantity', models.IntegerField(default=0)),
+                ('total_value', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('movement_count', models.IntegerField(default=0)),
+                ('category', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='daily_summaries', to='core.category')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_summaries', to='core.product')),
+            ],
+            options={
+                'verbose_name_plural': 'Daily movement summaries',
+                'ordering': ['-day'],
+                'indexes': [models.Index(fields=['movement_type', 'day'], name='core_dailym_movemen_28719f_idx'), models.Index(fields=['category', 'day'], name='core_dailym_categor_e52981_idx')],
+                'constraints': [models.UniqueConstraint(fields=('product', 'day', 'movement_type'), name='unique_daily_movement_summary')],
+            },
+        ),
+    ]
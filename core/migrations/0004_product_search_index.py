@@ -0,0 +1,97 @@
+from django.db import migrations
+
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE core_product_fts USING fts5(
+        name, sku, category,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    )
+    """,
+    """
+    INSERT INTO core_product_fts (rowid, name, sku, category)
+    SELECT p.id, p.name, p.sku, COALESCE(c.name, '')
+    FROM core_product p LEFT JOIN core_category c ON c.id = p.category_id
+    """,
+    """
+    CREATE TRIGGER core_product_fts_ai AFTER INSERT ON core_product BEGIN
+        INSERT INTO core_product_fts (rowid, name, sku, category)
+        VALUES (new.id, new.name, new.sku,
+                COALESCE((SELECT name FROM core_category WHERE id = new.category_id), ''));
+    END
+    """,
+    """
+    CREATE TRIGGER core_product_fts_au AFTER UPDATE OF name, sku, category_id ON core_product BEGIN
+        UPDATE core_product_fts
+        SET name = new.name, sku = new.sku,
+            category = COALESCE((SELECT name FROM core_category WHERE id = new.category_id), '')
+        WHERE rowid = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER core_product_fts_ad AFTER DELETE ON core_product BEGIN
+        DELETE FROM core_product_fts WHERE rowid = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER core_category_fts_au AFTER UPDATE OF name ON core_category BEGIN
+        UPDATE core_product_fts SET category = new.name
+        WHERE rowid IN (SELECT id FROM core_product WHERE category_id = new.id);
+    END
+    """,
+]
+
+SQLITE_REVERSE = [
+    'DROP TRIGGER IF EXISTS core_category_fts_au',
+    'DROP TRIGGER IF EXISTS core_product_fts_ad',
+    'DROP TRIGGER IF EXISTS core_product_fts_au',
+    'DROP TRIGGER IF EXISTS core_product_fts_ai',
+    'DROP TABLE IF EXISTS core_product_fts',
+]
+
+# Trigram GIN indexes na tugma sa UPPER(col::text) LIKE UPPER(%s) ng icontains
+POSTGRES_FORWARD = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'CREATE INDEX IF NOT EXISTS core_product_name_trgm ON core_product USING gin (UPPER(name::text) gin_trgm_ops)',
+    'CREATE INDEX IF NOT EXISTS core_product_sku_trgm ON core_product USING gin (UPPER(sku::text) gin_trgm_ops)',
+    'CREATE INDEX IF NOT EXISTS core_category_name_trgm ON core_category USING gin (UPPER(name::text) gin_trgm_ops)',
+]
+
+POSTGRES_REVERSE = [
+    'DROP INDEX IF EXISTS core_category_name_trgm',
+    'DROP INDEX IF EXISTS core_product_sku_trgm',
+    'DROP INDEX IF EXISTS core_product_name_trgm',
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        _run(schema_editor, SQLITE_FORWARD)
+    elif vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_FORWARD)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        _run(schema_editor, SQLITE_REVERSE)
+    elif vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_REVERSE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_dailymovementsummary'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
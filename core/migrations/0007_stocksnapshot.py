@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-18 14:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_activitylog_timestamp_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StockSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('quantity', models.IntegerField(default=0)),
+                ('price', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('total_value', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('category', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='snapshots', to='core.category')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='core.product')),
+            ],
+            options={
+                'ordering': ['-day'],
+                'indexes': [models.Index(fields=['day'], name='core_stocks_day_771db1_idx')],
+                'constraints': [models.UniqueConstraint(fields=('product', 'day'), name='unique_stock_snapshot')],
+            },
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.7 on 2026-10-18 14:18
+
+from importlib import import_module
+
+from django.db import migrations, models
+
+
+search_index = import_module('core.migrations.0004_product_search_index')
+
+
+def drop_search_triggers(apps, schema_editor):
+    # Nire-remake ng SQLite ang core_product sa AddField; hindi makaka-rename kung may trigger na tumutukoy dito
+    if schema_editor.connection.vendor == 'sqlite':
+        search_index._run(schema_editor, search_index.SQLITE_REVERSE[:4])
+
+
+def create_search_triggers(apps, schema_editor):
+    # Pareho pa rin ang ids pagkatapos ng remake, kaya triggers lang ang ibinabalik (hindi ang FTS data)
+    if schema_editor.connection.vendor == 'sqlite':
+        search_index._run(schema_editor, search_index.SQLITE_FORWARD[2:])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_stocksnapshot'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_search_triggers, create_search_triggers),
+        migrations.AddField(
+            model_name='dailymovementsummary',
+            name='total_cost',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=14),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='average_cost',
+            field=models.DecimalField(decimal_places=4, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name='stockmovement',
+            name='total_cost',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=14),
+        ),
+        migrations.AddField(
+            model_name='stockmovement',
+            name='unit_cost',
+            field=models.DecimalField(decimal_places=4, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name='stocksnapshot',
+            name='average_cost',
+            field=models.DecimalField(decimal_places=4, default=0, max_digits=12),
+        ),
+        migrations.RunPython(create_search_triggers, drop_search_triggers),
+    ]
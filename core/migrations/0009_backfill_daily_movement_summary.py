@@ -0,0 +1,53 @@
+from django.db import migrations
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+BATCH_SIZE = 1000
+
+
+def backfill(apps, schema_editor):
+    # Binabasa na ng reports ang rollup; buuin mula sa existing na ledger para hindi zero ang totals
+    # (parehong logic ng core.rollups.rebuild_daily_summaries, pero sa historical models)
+    StockMovement = apps.get_model('core', 'StockMovement')
+    DailyMovementSummary = apps.get_model('core', 'DailyMovementSummary')
+    db = schema_editor.connection.alias
+
+    rows = StockMovement.objects.using(db).annotate(day=TruncDate('date')).values(
+        'product_id', 'product__category_id', 'day', 'movement_type'
+    ).annotate(
+        total_qty=Sum('quantity'),
+        total_val=Sum('total_value'),
+        total_cost=Sum('total_cost'),
+        count=Count('id'),
+    ).order_by()
+
+    DailyMovementSummary.objects.using(db).all().delete()
+    batch = []
+    for row in rows.iterator():
+        batch.append(DailyMovementSummary(
+            product_id=row['product_id'],
+            category_id=row['product__category_id'],
+            day=row['day'],
+            movement_type=row['movement_type'],
+            quantity=row['total_qty'] or 0,
+            total_value=row['total_val'] or 0,
+            total_cost=row['total_cost'] or 0,
+            movement_count=row['count'],
+        ))
+        if len(batch) >= BATCH_SIZE:
+            DailyMovementSummary.objects.using(db).bulk_create(batch)
+            batch = []
+    if batch:
+        DailyMovementSummary.objects.using(db).bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_weighted_average_cost'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -37,11 +37,15 @@ class Product(models.Model):
     quantity = models.IntegerField(default=0)
     reorder_level = models.IntegerField(default=5)
     price = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    average_cost = models.DecimalField(max_digits=12, decimal_places=4, default=0)  # Weighted-average na puhunan kada unit
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at'], name='product_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.sku})"
@@ -80,6 +84,8 @@ class StockMovement(models.Model):
     quantity = models.IntegerField()
     price_at_movement = models.DecimalField(max_digits=10, decimal_places=2, default=0)  # Presyo ng item nung nag-stock out
     total_value = models.DecimalField(max_digits=10, decimal_places=2, default=0)  # Total value (quantity * price)
+    unit_cost = models.DecimalField(max_digits=12, decimal_places=4, default=0)  # IN: purchase cost; OUT: average cost noon
+    total_cost = models.DecimalField(max_digits=14, decimal_places=2, default=0)  # quantity * unit_cost (COGS sa OUT)
     date = models.DateTimeField(default=timezone.now)
     reference = models.CharField(max_length=100, blank=True, null=True)
     notes = models.TextField(blank=True, null=True)
@@ -87,13 +93,19 @@ class StockMovement(models.Model):
     
     class Meta:
         ordering = ['-date']
+        indexes = [
+            models.Index(fields=['movement_type', 'date'], name='movement_type_date_idx'),
+            models.Index(fields=['product', 'date'], name='movement_product_date_idx'),
+            models.Index(fields=['date'], name='movement_date_idx'),
+        ]
     
     def __str__(self):
         return f"{self.movement_type} - {self.product.name} - {self.quantity}"
     
     def save(self, *args, **kwargs):
-        # Auto-compute total value bago i-save
+        # Auto-compute total value at cost bago i-save
         self.total_value = self.quantity * self.price_at_movement
+        self.total_cost = round(self.quantity * self.unit_cost, 2)
         super().save(*args, **kwargs)
 
 
@@ -115,10 +127,63 @@ class ActivityLog(models.Model):
     object_repr = models.CharField(max_length=200, blank=True)
     changes = models.TextField(blank=True, null=True)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)  # Sinet sa oras ng aksyon, hindi sa oras ng buffered write
     
     class Meta:
         ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['action', 'timestamp'], name='activity_action_ts_idx'),
+            models.Index(fields=['timestamp'], name='activity_ts_idx'),
+        ]
     
     def __str__(self):
-        return f"{self.timestamp} - {self.user} - {self.action}"
\ No newline at end of file
+        return f"{self.timestamp} - {self.user} - {self.action}"
+
+class DailyMovementSummary(models.Model):
+    # Rollup ng StockMovement kada araw (Asia/Manila) para hindi na i-scan ang buong ledger sa reports
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='daily_summaries')
+    category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, related_name='daily_summaries')
+    day = models.DateField()
+    movement_type = models.CharField(max_length=3, choices=StockMovement.MOVEMENT_TYPES)
+    quantity = models.IntegerField(default=0)
+    total_value = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    total_cost = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    movement_count = models.IntegerField(default=0)
+    
+    class Meta:
+        ordering = ['-day']
+        verbose_name_plural = "Daily movement summaries"
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'day', 'movement_type'], name='unique_daily_movement_summary'),
+        ]
+        indexes = [
+            models.Index(fields=['movement_type', 'day']),
+            models.Index(fields=['category', 'day']),
+        ]
+    
+    def __str__(self):
+        return f"{self.day} - {self.movement_type} - {self.product_id} - {self.quantity}"
+
+
+class StockSnapshot(models.Model):
+    # End-of-day na quantity at value ng bawat product, para sa "as of" inventory report
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='snapshots')
+    category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, related_name='snapshots')
+    day = models.DateField()
+    quantity = models.IntegerField(default=0)
+    price = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    total_value = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    average_cost = models.DecimalField(max_digits=12, decimal_places=4, default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-day']
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'day'], name='unique_stock_snapshot'),
+        ]
+        indexes = [
+            models.Index(fields=['day']),
+        ]
+    
+    def __str__(self):
+        return f"{self.day} - {self.product_id} - {self.quantity}"
@@ -0,0 +1,16 @@
+# Saklaw ng IntegerField/AutoField; lampas dito ay OverflowError sa SQLite at DataError sa Postgres
+MAX_INT = 2 ** 31 - 1
+
+
+def is_int(value):
+    # Sa JSON, true/false ay bool na subclass ng int sa Python
+    return isinstance(value, int) and not isinstance(value, bool) and abs(value) <= MAX_INT
+
+
+def parse_int(text):
+    """Non-negative na integer mula sa text (ASCII digits lang, hindi hal. '²'); None kapag hindi."""
+    text = text.strip()
+    if not (text.isascii() and text.isdigit()):
+        return None
+    value = int(text)
+    return value if value <= MAX_INT else None
@@ -0,0 +1,103 @@
+import base64
+from datetime import datetime
+
+from django.db.models import Q
+
+
+class KeysetPage:
+    # Seek pagination sa (-field, -pk): walang OFFSET at walang COUNT(*)
+    def __init__(self, object_list, field, query_params, has_next, has_previous):
+        self.object_list = object_list
+        self.field = field
+        self.query_params = query_params
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __bool__(self):
+        return bool(self.object_list)
+
+    @property
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+    def _query(self, direction, obj):
+        params = self.query_params.copy()
+        params.pop('after', None)
+        params.pop('before', None)
+        params[direction] = encode_cursor(getattr(obj, self.field), obj.pk)
+        return params.urlencode()
+
+    @property
+    def next_query(self):
+        return self._query('after', self.object_list[-1]) if self.has_next and self.object_list else ''
+
+    @property
+    def previous_query(self):
+        return self._query('before', self.object_list[0]) if self.has_previous and self.object_list else ''
+
+
+def encode_cursor(value, pk):
+    raw = f'{value.isoformat()}|{pk}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        value, pk = raw.rsplit('|', 1)
+        return datetime.fromisoformat(value), int(pk)
+    except (ValueError, TypeError):
+        return None
+
+
+def keyset_paginate(request, queryset, field, page_size):
+    after = decode_cursor(request.GET.get('after', ''))
+    before = decode_cursor(request.GET.get('before', ''))
+
+    if after:
+        value, pk = after
+        rows = list(queryset.filter(
+            Q(**{f'{field}__lt': value}) | Q(**{field: value, 'pk__lt': pk})
+        ).order_by(f'-{field}', '-pk')[:page_size + 1])
+        has_next, has_previous = len(rows) > page_size, True
+        rows = rows[:page_size]
+    elif before:
+        # Pabalik: kunin ang mas bago sa ascending order tapos baligtarin
+        value, pk = before
+        rows = list(queryset.filter(
+            Q(**{f'{field}__gt': value}) | Q(**{field: value, 'pk__gt': pk})
+        ).order_by(field, 'pk')[:page_size + 1])
+        has_next, has_previous = True, len(rows) > page_size
+        rows = rows[:page_size][::-1]
+    else:
+        rows = list(queryset.order_by(f'-{field}', '-pk')[:page_size + 1])
+        has_next, has_previous = len(rows) > page_size, False
+        rows = rows[:page_size]
+
+    return KeysetPage(rows, field, request.GET, has_next, has_previous)
+
+
+def keyset_paginate_list(request, records, field, page_size):
+    # Parehong cursors gaya ng keyset_paginate, para sa listahang naka-sort na sa (-field, -pk)
+    after = decode_cursor(request.GET.get('after', ''))
+    before = decode_cursor(request.GET.get('before', ''))
+
+    if after:
+        rows = [obj for obj in records if (getattr(obj, field), obj.pk) < after]
+        has_next, has_previous = len(rows) > page_size, True
+        rows = rows[:page_size]
+    elif before:
+        rows = [obj for obj in records if (getattr(obj, field), obj.pk) > before]
+        has_next, has_previous = True, len(rows) > page_size
+        rows = rows[-page_size:]
+    else:
+        has_next, has_previous = len(records) > page_size, False
+        rows = records[:page_size]
+
+    return KeysetPage(rows, field, request.GET, has_next, has_previous)
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+from django.http import FileResponse
+from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .versioning import get_data_version
+
+
+logger = logging.getLogger(__name__)
+
+# Kapag mas matanda dito ang lock file, ituring na patay na ang worker na may hawak
+STALE_LOCK_SECONDS = 10 * 60
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'REPORT_PDF_WORKERS', 2),
+    thread_name_prefix='report-pdf',
+)
+_pending = set()
+_failed = {}
+_lock = threading.Lock()
+
+
+def _report_dir():
+    path = Path(settings.REPORT_PDF_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def report_pdf_path(report_name, params, version=None, day=None):
+    if version is None:
+        version = get_data_version()
+    if day is None:
+        day = timezone.localdate()
+    params_key = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()[:16]
+    # Kasama ang petsa (gaya ng KPI cache key): ang today/MTD/YTD totals ay nagbabago pagdating
+    # ng hatinggabi kahit walang write, kaya hindi dapat ibigay ang PDF kahapon
+    return _report_dir() / f'{report_name}-{params_key}-v{version}-{day:%Y%m%d}.pdf'
+
+
+def _acquire_lock(lock_path):
+    try:
+        fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            if time.time() - lock_path.stat().st_mtime < STALE_LOCK_SECONDS:
+                return False
+            lock_path.unlink()
+        except FileNotFoundError:
+            pass
+        return _acquire_lock(lock_path)
+    os.close(fd)
+    return True
+
+
+def _render_pdf(report_name, params, build_context, pdf_path, lock_path):
+    try:
+        from xhtml2pdf import pisa
+
+        close_old_connections()
+        context = build_context(**params)
+        context['generated_at'] = timezone.localtime()
+        html = render_to_string(f'reports/pdf/{report_name}.html', context)
+
+        tmp_path = pdf_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as fh:
+            result = pisa.CreatePDF(html, dest=fh, encoding='utf-8')
+        if result.err:
+            tmp_path.unlink(missing_ok=True)
+            raise RuntimeError(f'xhtml2pdf reported {result.err} error(s)')
+        os.replace(tmp_path, pdf_path)
+
+        # Burahin ang mga lumang version ng parehong report at filters
+        prefix = pdf_path.name.rsplit('-v', 1)[0]
+        for old_path in pdf_path.parent.glob(f'{prefix}-v*.pdf'):
+            if old_path != pdf_path:
+                old_path.unlink(missing_ok=True)
+    except Exception as exc:
+        logger.exception('PDF rendering failed for %s', pdf_path.name)
+        with _lock:
+            _failed[pdf_path] = str(exc)
+    finally:
+        lock_path.unlink(missing_ok=True)
+        with _lock:
+            _pending.discard(pdf_path)
+        connections.close_all()
+
+
+def request_report_pdf(report_name, params, build_context):
+    """Ibalik ang path ng naka-cache na PDF, o i-queue ang rendering at ibalik ang None."""
+    pdf_path = report_pdf_path(report_name, params)
+    if pdf_path.exists():
+        return pdf_path, None
+
+    with _lock:
+        if pdf_path in _failed:
+            return None, _failed.pop(pdf_path)
+        if pdf_path in _pending:
+            return None, None
+        # Lock file para isang worker process lang ang mag-render ng parehong PDF
+        lock_path = pdf_path.with_suffix('.lock')
+        if not _acquire_lock(lock_path):
+            return None, None
+        _pending.add(pdf_path)
+    _executor.submit(_render_pdf, report_name, params, build_context, pdf_path, lock_path)
+    return None, None
+
+
+def report_pdf_response(request, report_name, params, build_context):
+    pdf_path, error = request_report_pdf(report_name, params, build_context)
+    if pdf_path is not None:
+        filename = f"{report_name.replace('_', '-')}-{timezone.localdate():%Y%m%d}.pdf"
+        return FileResponse(open(pdf_path, 'rb'), as_attachment=True, filename=filename,
+                            content_type='application/pdf')
+
+    context = {
+        'report_name': report_name.replace('_', ' ').title(),
+        'error': error,
+    }
+    return render(request, 'reports/pdf_pending.html', context, status=500 if error else 202)
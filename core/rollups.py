@@ -0,0 +1,131 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import DailyMovementSummary, StockMovement
+
+
+REBUILD_BATCH_SIZE = 1000
+
+
+def record_movement(movement, category_id=None):
+    # Tawagin sa loob ng parehong transaction ng movement insert
+    if category_id is None:
+        category_id = movement.product.category_id
+    lookup = {
+        'product_id': movement.product_id,
+        'day': timezone.localdate(movement.date),
+        'movement_type': movement.movement_type,
+    }
+    changes = {
+        'category_id': category_id,
+        'quantity': F('quantity') + movement.quantity,
+        'total_value': F('total_value') + movement.total_value,
+        'total_cost': F('total_cost') + movement.total_cost,
+        'movement_count': F('movement_count') + 1,
+    }
+    if DailyMovementSummary.objects.filter(**lookup).update(**changes):
+        return
+    try:
+        with transaction.atomic():
+            DailyMovementSummary.objects.create(
+                category_id=category_id,
+                quantity=movement.quantity,
+                total_value=movement.total_value,
+                total_cost=movement.total_cost,
+                movement_count=1,
+                **lookup
+            )
+    except IntegrityError:
+        # May ibang request na naunang gumawa ng row para sa araw na ito
+        DailyMovementSummary.objects.filter(**lookup).update(**changes)
+
+
+def record_movements(movements, category_ids):
+    # Batch na bersyon ng record_movement: isang SELECT ... FOR UPDATE, tapos bulk_update/bulk_create
+    totals = {}
+    for movement in movements:
+        key = (movement.product_id, timezone.localdate(movement.date), movement.movement_type)
+        quantity, value, cost, count = totals.get(key, (0, 0, 0, 0))
+        totals[key] = (
+            quantity + movement.quantity,
+            value + movement.total_value,
+            cost + movement.total_cost,
+            count + 1,
+        )
+    if not totals:
+        return
+
+    days = {day for _, day, _ in totals}
+    existing = {
+        (row.product_id, row.day, row.movement_type): row
+        for row in DailyMovementSummary.objects.select_for_update().filter(
+            product_id__in={product_id for product_id, _, _ in totals},
+            day__in=days,
+            movement_type__in={movement_type for _, _, movement_type in totals},
+        )
+    }
+
+    to_update, to_create = [], []
+    for key, (quantity, value, cost, count) in totals.items():
+        product_id, day, movement_type = key
+        row = existing.get(key)
+        if row is None:
+            to_create.append(DailyMovementSummary(
+                product_id=product_id,
+                category_id=category_ids.get(product_id),
+                day=day,
+                movement_type=movement_type,
+                quantity=quantity,
+                total_value=value,
+                total_cost=cost,
+                movement_count=count,
+            ))
+        else:
+            row.category_id = category_ids.get(product_id)
+            row.quantity += quantity
+            row.total_value += value
+            row.total_cost += cost
+            row.movement_count += count
+            to_update.append(row)
+
+    DailyMovementSummary.objects.bulk_update(
+        to_update, ['category', 'quantity', 'total_value', 'total_cost', 'movement_count'], batch_size=REBUILD_BATCH_SIZE
+    )
+    DailyMovementSummary.objects.bulk_create(to_create, batch_size=REBUILD_BATCH_SIZE)
+
+
+def rebuild_daily_summaries(batch_size=REBUILD_BATCH_SIZE):
+    rows = StockMovement.objects.annotate(day=TruncDate('date')).values(
+        'product_id', 'product__category_id', 'day', 'movement_type'
+    ).annotate(
+        total_qty=Sum('quantity'),
+        total_val=Sum('total_value'),
+        total_cost=Sum('total_cost'),
+        count=Count('id'),
+    ).order_by()
+
+    created = 0
+    with transaction.atomic():
+        DailyMovementSummary.objects.all().delete()
+        batch = []
+        for row in rows.iterator():
+            batch.append(DailyMovementSummary(
+                product_id=row['product_id'],
+                category_id=row['product__category_id'],
+                day=row['day'],
+                movement_type=row['movement_type'],
+                quantity=row['total_qty'] or 0,
+                total_value=row['total_val'] or 0,
+                total_cost=row['total_cost'] or 0,
+                movement_count=row['count'],
+            ))
+            if len(batch) >= batch_size:
+                DailyMovementSummary.objects.bulk_create(batch)
+                created += len(batch)
+                batch = []
+        if batch:
+            DailyMovementSummary.objects.bulk_create(batch)
+            created += len(batch)
+    return created
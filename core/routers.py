@@ -0,0 +1,94 @@
+"""
+Optional na read replica para sa reports.
+
+Ang mga view na naka-@use_replica (reports, activity log, dashboard aggregates at ang CSV
+exports nila) ay nagbabasa sa 'replica' alias (REPLICA_DATABASE_URL). Kapag may write sa loob
+ng request, naka-pin na sa primary ang natitirang reads. Kapag walang replica na naka-configure,
+lahat ay sa primary pa rin.
+"""
+from contextvars import ContextVar
+from functools import wraps
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+REPLICA_DB_ALIAS = 'replica'
+
+
+class _ReplicaScope:
+    def __init__(self):
+        self.pinned = False
+        self.used = False
+
+
+_scope = ContextVar('replica_scope', default=None)
+
+
+def replica_configured():
+    return REPLICA_DB_ALIAS in connections.settings
+
+
+def replica_used():
+    """True kapag may read sa kasalukuyang request na napunta sa replica (posibleng may lag)."""
+    scope = _scope.get()
+    return scope is not None and scope.used
+
+
+def _in_scope(scope, content):
+    # Ang streaming body (hal. CSV export) ay binabasa pagkatapos bumalik ng view
+    iterator = iter(content)
+    while True:
+        token = _scope.set(scope)
+        try:
+            chunk = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _scope.reset(token)
+        yield chunk
+
+
+def use_replica(view_func):
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        scope = _ReplicaScope()
+        token = _scope.set(scope)
+        try:
+            response = view_func(request, *args, **kwargs)
+        finally:
+            _scope.reset(token)
+        if response.streaming:
+            response.streaming_content = _in_scope(scope, response.streaming_content)
+        return response
+    return wrapper
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        scope = _scope.get()
+        if scope is None:
+            return None
+        # Pagkatapos ng write, o nasa loob ng transaction: primary para makita ang sariling writes
+        if scope.pinned or not replica_configured() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        scope.used = True
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        scope = _scope.get()
+        if scope is not None:
+            scope.pinned = True
+        # Laging primary, kahit ang instance ay nabasa mula sa replica
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Ang replica ay kopya ng primary; hindi dito tumatakbo ang migrations
+        if db == REPLICA_DB_ALIAS:
+            return False
+        return None
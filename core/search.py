@@ -0,0 +1,115 @@
+import hashlib
+import re
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q
+from django.db.models.functions import Greatest
+
+from .models import Product
+from .versioning import get_data_version
+
+
+# Ilang pinaka-relevant na resulta lang ang kinukuha sa index kada search
+SEARCH_RESULT_LIMIT = 200
+
+# Typeahead: kaunting resulta lang, at maikling cache para sa sunod-sunod na keystrokes
+LOOKUP_RESULT_LIMIT = 15
+LOOKUP_CACHE_TIMEOUT = 60
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def search_tokens(query):
+    return TOKEN_RE.findall(query.lower())
+
+
+def _sqlite_match_expression(tokens):
+    # Bawat salita ay prefix match, implicit AND: "gen"* "hnd"*
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def _sqlite_search(queryset, tokens, limit):
+    # Join sa FTS5 virtual table; walang ORM API para dito kaya extra()
+    return queryset.extra(
+        tables=['core_product_fts'],
+        where=['core_product_fts.rowid = core_product.id', 'core_product_fts MATCH %s'],
+        params=[_sqlite_match_expression(tokens)],
+        select={'search_rank': 'core_product_fts.rank'},
+        order_by=['search_rank'],
+    )[:limit]
+
+
+def _postgres_search(queryset, query, limit):
+    from django.contrib.postgres.search import TrigramSimilarity
+
+    # icontains dito ay tumatama sa UPPER(col::text) gin_trgm_ops indexes
+    return queryset.filter(
+        Q(name__icontains=query) |
+        Q(sku__icontains=query) |
+        Q(category__name__icontains=query)
+    ).annotate(
+        search_rank=Greatest(
+            TrigramSimilarity('name', query),
+            TrigramSimilarity('sku', query),
+        )
+    ).order_by('-search_rank', '-pk')[:limit]
+
+
+def _fallback_search(queryset, query, limit):
+    return queryset.filter(
+        Q(name__icontains=query) |
+        Q(sku__icontains=query) |
+        Q(category__name__icontains=query)
+    )[:limit]
+
+
+def search_products(query, queryset=None, limit=SEARCH_RESULT_LIMIT):
+    # Dapat huling i-apply: naka-slice na ang ibinabalik na queryset
+    if queryset is None:
+        queryset = Product.objects.all()
+    query = query.strip()
+    if not query:
+        return queryset
+
+    if connection.vendor == 'sqlite':
+        tokens = search_tokens(query)
+        if not tokens:
+            return queryset.none()
+        return _sqlite_search(queryset, tokens, limit)
+    if connection.vendor == 'postgresql':
+        return _postgres_search(queryset, query, limit)
+    return _fallback_search(queryset, query, limit)
+
+
+def lookup_products(query, limit=LOOKUP_RESULT_LIMIT):
+    """
+    Typeahead lookup: SKU prefix muna (range scan sa unique sku index), tapos name/category
+    matches mula sa search index. Ibinabalik ang [{'id', 'sku', 'name'}]; naka-cache kada data version.
+    """
+    query = query.strip()
+    if not query:
+        return []
+    digest = hashlib.md5(query.lower().encode()).hexdigest()
+    key = f'core:lookup:{get_data_version()}:{limit}:{digest}'
+    results = cache.get(key)
+    if results is not None:
+        return results
+
+    prefix = query.upper()
+    # sku >= 'ABC' AND sku < 'ABC\uffff' ay gumagamit ng index, hindi tulad ng LIKE ... ESCAPE sa SQLite
+    by_sku = list(
+        Product.objects.filter(sku__gte=prefix, sku__lt=prefix + '\uffff')
+        .order_by('sku').values('id', 'sku', 'name')[:limit]
+    )
+    results = by_sku
+    if len(results) < limit:
+        seen = {row['id'] for row in results}
+        matches = search_products(query, Product.objects.only('id', 'sku', 'name'), limit=limit)
+        results += [
+            {'id': product.id, 'sku': product.sku, 'name': product.name}
+            for product in matches if product.id not in seen
+        ][:limit - len(results)]
+
+    cache.set(key, results, LOOKUP_CACHE_TIMEOUT)
+    return results
@@ -0,0 +1,241 @@
+"""
+Deterministic na synthetic dataset para sa benchmarks at capacity testing.
+
+Lahat ay bulk_create nang naka-batch. Ang movements ay ginagawa nang sunod-sunod sa oras, kaya
+hindi bumababa sa zero ang stock at ang Product.quantity at average_cost sa dulo ay tugma sa
+ledger. Kasabay nito binubuo ang activity logs at ang daily rollup rows ng mga bagong product,
+kaya hindi na kailangang i-scan ulit ang buong ledger.
+"""
+import random
+from bisect import bisect_left
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from itertools import accumulate
+
+from django.db import transaction
+from django.utils import timezone
+
+from .caching import invalidate_tags
+from .models import ActivityLog, Category, DailyMovementSummary, Product, StockMovement, StockSnapshot
+from .services import COST_PLACES, weighted_average_cost
+from .versioning import bump_data_version
+
+
+SEED_BATCH_SIZE = 5000
+
+# Oras ng tindahan (local time) kung kailan may galaw ng stock
+STORE_OPENS, STORE_HOURS = 8, 10
+
+# Category: (SKU code, mga item, mga unit, presyo min/max, max quantity kada movement, reorder level)
+CATALOG = {
+    'GENERATOR': ('GEN', ['Inverter Generator', 'Gasoline Generator', 'Diesel Generator', 'Portable Generator'],
+                  ['pcs'], (12000, 65000), 3, 2),
+    'GRASS CUTTER': ('GRC', ['Grass Cutter', 'Brush Cutter', 'Hedge Trimmer', 'Lawn Mower'],
+                     ['pcs'], (4500, 18000), 4, 2),
+    'GRINDER': ('GRD', ['Angle Grinder', 'Bench Grinder', 'Die Grinder', 'Mini Grinder'],
+                ['pcs'], (1500, 9000), 6, 3),
+    'DRILL': ('DRL', ['Hammer Drill', 'Cordless Drill', 'Impact Drill', 'Rotary Hammer', 'Magnetic Drill'],
+              ['pcs', 'set'], (1200, 14000), 6, 3),
+    'SAW': ('SAW', ['Circular Saw', 'Jigsaw', 'Chainsaw', 'Miter Saw', 'Reciprocating Saw'],
+            ['pcs'], (2500, 22000), 4, 2),
+    'WELDER': ('WEL', ['Inverter Welder', 'MIG Welder', 'TIG Welder', 'Arc Welder'],
+               ['pcs'], (6000, 38000), 2, 1),
+    'COMPRESSOR': ('CMP', ['Air Compressor', 'Oil-less Compressor', 'Belt-drive Compressor'],
+                   ['pcs'], (5000, 30000), 3, 2),
+    'WATER PUMP': ('PUM', ['Water Pump', 'Jetmatic Pump', 'Submersible Pump', 'Booster Pump'],
+                   ['pcs'], (1800, 16000), 4, 2),
+    'ACCESSORIES': ('ACC', ['Cutting Disc', 'Grinding Disc', 'Drill Bit Set', 'Saw Blade', 'Welding Rod',
+                            'Air Hose', 'Carbon Brush', 'Spark Plug'],
+                    ['pcs', 'box', 'pack', 'set'], (45, 1800), 40, 20),
+}
+CATEGORY_NAMES = list(CATALOG)
+
+BRANDS = [
+    ('Honda', 'HND'), ('Yamaha', 'YAM'), ('Stihl', 'STH'), ('Echo', 'ECH'), ('Bosch', 'BOS'),
+    ('Makita', 'MAK'), ('Dewalt', 'DEW'), ('Skil', 'SKL'), ('Lincoln', 'LIN'), ('Miller', 'MIL'),
+    ('Hitachi', 'HIT'), ('Ingco', 'ING'), ('Total', 'TOT'), ('Lotus', 'LOT'), ('Fujihama', 'FUJ'),
+]
+
+
+def seed_sku_prefix(seed):
+    return f'S{seed}-'
+
+
+def _product(rng, index, category, prefix):
+    code, items, units, (low, high), _, reorder = CATALOG[category.name]
+    brand, brand_code = rng.choice(BRANDS)
+    model = f"{rng.choice('ABCDEFGHJKLMNPRSTUVWXZ')}{rng.choice('ABCDEFGHJKLMNPRSTUVWXZ')}{rng.randint(100, 9999)}"
+    return Product(
+        name=f'{brand} {model} {rng.choice(items)}',
+        sku=f'{prefix}{code}-{brand_code}-{index + 1:07d}',
+        category=category,
+        unit=rng.choice(units),
+        reorder_level=reorder,
+        # Presyong nagtatapos sa 50 o 00, gaya ng sa tindahan
+        price=Decimal(rng.randint(low // 50, high // 50) * 50),
+    )
+
+
+def seed_inventory(products, movements, days=365, seed=0, user=None, activity=True,
+                   batch_size=SEED_BATCH_SIZE, progress=None):
+    """
+    Gumawa ng `products` products at `movements` stock movements sa nakaraang `days` araw (bukod
+    ngayon), kasama ang activity logs kapag `activity`. Pareho ang resulta sa parehong `seed`.
+    Ang `progress(created, total)` ay tinatawag pagkatapos ng bawat batch ng movements.
+    Ibinabalik ang bilang ng rows kada table.
+    """
+    if products < 1:
+        raise ValueError('At least one product is required.')
+    rng = random.Random(seed)
+    first_day = timezone.localdate() - timedelta(days=days)
+    opening = timezone.make_aware(datetime.combine(first_day, time(STORE_OPENS)))
+
+    Category.objects.bulk_create([Category(name=name) for name in CATEGORY_NAMES], ignore_conflicts=True)
+    categories = list(Category.objects.filter(name__in=CATEGORY_NAMES).order_by('name'))
+
+    prefix = seed_sku_prefix(seed)
+    items = [_product(rng, index, categories[index % len(categories)], prefix) for index in range(products)]
+    with transaction.atomic():
+        Product.objects.bulk_create(items, batch_size=batch_size)
+        # auto_now_add: ibalik ang petsa ng pagkakagawa sa simula ng history
+        Product.objects.filter(sku__startswith=prefix).update(created_at=opening, updated_at=opening)
+    items = list(Product.objects.filter(sku__startswith=prefix).select_related('category').order_by('sku'))
+
+    logs = []
+    if activity:
+        logs = [
+            ActivityLog(user=user, action='CREATE', model_name='Product', object_id=product.pk,
+                        object_repr=product.name, changes=f'Created product {product.sku}', timestamp=opening)
+            for product in items
+        ]
+
+    # Mabentang products: ilang items ang may karamihan ng galaw (Pareto-like na bigat)
+    cum_weights = list(accumulate(1 / (rank + 1) ** 0.8 for rank in range(len(items))))
+    order = list(range(len(items)))
+    rng.shuffle(order)
+    max_quantity = [CATALOG[product.category.name][4] for product in items]
+
+    on_hand = [0] * len(items)
+    average = [Decimal('0')] * len(items)
+    rollup = {}
+    batch = []
+    created = logged = 0
+    slot = days * STORE_HOURS * 3600 / max(movements, 1)
+    for position in range(movements):
+        # Stratified na oras: sunod-sunod at pantay sa loob ng oras ng tindahan
+        seconds = (position + rng.random()) * slot
+        day, within = divmod(seconds, STORE_HOURS * 3600)
+        date = opening + timedelta(days=int(day), seconds=within)
+        index = order[bisect_left(cum_weights, rng.random() * cum_weights[-1])]
+        product = items[index]
+        quantity = rng.randint(1, max_quantity[index])
+        if on_hand[index] >= quantity and rng.random() < 0.6:
+            movement_type = 'OUT'
+            price = product.price
+            unit_cost = average[index]
+            on_hand[index] -= quantity
+            reference = f'SI-{position + 1:08d}'
+        else:
+            movement_type = 'IN'
+            # Bumibili nang mas marami kapag kulang na ang stock
+            if on_hand[index] <= product.reorder_level:
+                quantity += rng.randint(0, max_quantity[index] * 2)
+            price = Decimal('0')
+            unit_cost = (product.price * Decimal(rng.randint(55, 85)) / 100).quantize(COST_PLACES)
+            average[index] = weighted_average_cost(on_hand[index], average[index], quantity, unit_cost)
+            on_hand[index] += quantity
+            reference = f'PO-{position + 1:08d}'
+        total_value = quantity * price
+        total_cost = round(quantity * unit_cost, 2)
+        batch.append(StockMovement(
+            product_id=product.pk,
+            movement_type=movement_type,
+            quantity=quantity,
+            price_at_movement=price,
+            total_value=total_value,
+            unit_cost=unit_cost,
+            total_cost=total_cost,
+            date=date,
+            reference=reference,
+            performed_by=user,
+        ))
+
+        key = (index, first_day + timedelta(days=int(day)), movement_type)
+        totals = rollup.get(key)
+        if totals is None:
+            rollup[key] = [quantity, total_value, total_cost, 1]
+        else:
+            totals[0] += quantity
+            totals[1] += total_value
+            totals[2] += total_cost
+            totals[3] += 1
+
+        if activity:
+            if movement_type == 'OUT':
+                action, changes = 'STOCK_OUT', f'Removed {quantity} {product.unit} worth ₱{total_value}'
+            else:
+                action, changes = 'STOCK_IN', f'Added {quantity} {product.unit}'
+            logs.append(ActivityLog(user=user, action=action, model_name='Product', object_id=product.pk,
+                                    object_repr=product.name, changes=changes, timestamp=date))
+
+        if len(batch) >= batch_size:
+            logged += _flush(batch, logs)
+            created += len(batch)
+            batch, logs = [], []
+            if progress:
+                progress(created, movements)
+    logged += _flush(batch, logs)
+    created += len(batch)
+    if progress and batch:
+        progress(created, movements)
+
+    for index, product in enumerate(items):
+        product.quantity = on_hand[index]
+        product.average_cost = average[index]
+    Product.objects.bulk_update(items, ['quantity', 'average_cost'], batch_size=batch_size)
+
+    # Bago ang mga product, kaya walang existing na rollup rows na kailangang pagsamahin
+    summaries = [
+        DailyMovementSummary(
+            product_id=items[index].pk, category_id=items[index].category_id, day=day,
+            movement_type=movement_type, quantity=quantity, total_value=value, total_cost=cost,
+            movement_count=count,
+        )
+        for (index, day, movement_type), (quantity, value, cost, count) in rollup.items()
+    ]
+    DailyMovementSummary.objects.bulk_create(summaries, batch_size=batch_size)
+
+    bump_data_version()
+    invalidate_tags('products', 'categories', 'movements', 'activity', 'activity_actions')
+    return {
+        'categories': len(categories),
+        'products': len(items),
+        'movements': created,
+        'activity_logs': logged,
+        'daily_summaries': len(summaries),
+    }
+
+
+def _flush(movements, logs):
+    with transaction.atomic():
+        StockMovement.objects.bulk_create(movements)
+        ActivityLog.objects.bulk_create(logs)
+    return len(logs)
+
+
+def clear_seeded(seed):
+    """Burahin ang products (kasama ang movements, rollups at snapshots) at activity logs ng isang seed."""
+    seeded = Product.objects.filter(sku__startswith=seed_sku_prefix(seed))
+    count = seeded.count()
+    # Isang DELETE kada table na may subquery; ang cascade ng ORM ay magpapatakbo ng post_delete
+    # (version bump at cache invalidation) kada movement
+    seeded_ids = seeded.values('pk')
+    with transaction.atomic():
+        for model in (StockMovement, DailyMovementSummary, StockSnapshot):
+            related = model.objects.filter(product_id__in=seeded_ids)
+            related._raw_delete(related.db)
+        ActivityLog.objects.filter(model_name='Product', object_id__in=seeded_ids).delete()
+        seeded._raw_delete(seeded.db)
+    bump_data_version()
+    invalidate_tags('products', 'categories', 'movements', 'activity', 'activity_actions')
+    return count
@@ -0,0 +1,250 @@
+from decimal import Decimal
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Case, DecimalField, F, IntegerField, Q, Value, When
+from django.utils import timezone
+
+from .activity import log_activity
+from .caching import invalidate_tags
+from .events import publish_stock_change
+from .models import Product, StockMovement
+from .rollups import record_movement, record_movements
+from .sqlite import serialized_write
+from .versioning import bump_data_version
+
+
+# Ilang produkto kada UPDATE statement sa batch (para sa SQL parameter limits)
+BATCH_UPDATE_CHUNK = 250
+
+COST_PLACES = Decimal('0.0001')
+
+
+def weighted_average_cost(quantity, average_cost, added_quantity, unit_cost):
+    # Bagong average pagkatapos ng stock in: (q * avg + n * cost) / (q + n)
+    total = quantity + added_quantity
+    if total <= 0:
+        return Decimal(unit_cost).quantize(COST_PLACES)
+    return ((quantity * average_cost + added_quantity * unit_cost) / total).quantize(COST_PLACES)
+
+
+class InsufficientStock(Exception):
+    def __init__(self, product, requested):
+        self.product = product
+        self.requested = requested
+        super().__init__(f'Not enough stock for {product.name}: requested {requested}, available {product.quantity}')
+
+
+class BatchStockError(Exception):
+    def __init__(self, errors):
+        # errors: listahan ng {'line': n, 'error': '...'}
+        self.errors = errors
+        super().__init__(f'{len(errors)} batch line(s) could not be applied')
+
+
+@serialized_write
+def record_stock_movement(movement, ip_address=None):
+    """
+    I-apply ang isang hindi pa naka-save na StockMovement (IN o OUT) sa isang transaction.
+
+    Ang quantity ay binabago gamit ang iisang conditional UPDATE
+    (quantity = quantity - n WHERE quantity >= n), kaya walang lost update o oversell
+    kahit sabay-sabay ang mga cashier. Sa stock in na may unit_cost, binabasa muna ang naka-lock
+    na row para sa bagong weighted-average cost; ang stock out ay naka-cost sa kasalukuyang average.
+    """
+    quantity = movement.quantity
+    with transaction.atomic():
+        products = Product.objects.filter(pk=movement.product_id)
+        if movement.movement_type == 'OUT':
+            updated = products.filter(quantity__gte=quantity).update(
+                quantity=F('quantity') - quantity,
+                updated_at=timezone.now(),
+            )
+        else:
+            changes = {}
+            if movement.unit_cost:
+                # I-lock muna ang row at sa Python (Decimal) kalkulahin ang average; sa SQL, integer
+                # division ang / ng SQLite kapag buo ang mga numero (hal. 350 / 15 = 23)
+                current = products.select_for_update().values('quantity', 'average_cost').first()
+                if current is not None:
+                    changes['average_cost'] = weighted_average_cost(
+                        current['quantity'], current['average_cost'], quantity, movement.unit_cost
+                    )
+            updated = products.update(
+                quantity=F('quantity') + quantity,
+                updated_at=timezone.now(),
+                **changes
+            )
+
+        # Naka-lock na ang row dahil sa UPDATE, kaya consistent ang price at quantity na mababasa
+        product = Product.objects.only(
+            'name', 'sku', 'unit', 'price', 'average_cost', 'quantity', 'category_id', 'reorder_level'
+        ).get(pk=movement.product_id)
+        if not updated:
+            raise InsufficientStock(product, quantity)
+
+        if movement.movement_type == 'OUT':
+            movement.price_at_movement = product.price
+            movement.unit_cost = product.average_cost
+        elif not movement.unit_cost:
+            # Walang cost na binigay: naka-cost sa average para hindi gumalaw ang valuation
+            movement.unit_cost = product.average_cost
+        movement.product = product
+        movement.save()
+        record_movement(movement, category_id=product.category_id)
+
+        if movement.movement_type == 'OUT':
+            action = 'STOCK_OUT'
+            changes = f"Removed {quantity} {product.unit} worth ₱{movement.total_value}"
+        else:
+            action = 'STOCK_IN'
+            changes = f"Added {quantity} {product.unit}"
+        log_activity(
+            user=movement.performed_by,
+            action=action,
+            model_name='Product',
+            object_id=product.id,
+            object_repr=product.name,
+            changes=changes,
+            ip_address=ip_address,
+        )
+        transaction.on_commit(
+            lambda: publish_stock_change([movement], {product.id: product}, movement.performed_by)
+        )
+    return movement
+
+
+def _apply_quantity_deltas(movement_type, deltas, now, average_costs=None):
+    # Isang UPDATE kada chunk: quantity = quantity -/+ CASE id WHEN .. THEN n END
+    product_ids = list(deltas)
+    average_costs = average_costs or {}
+    for start in range(0, len(product_ids), BATCH_UPDATE_CHUNK):
+        chunk = product_ids[start:start + BATCH_UPDATE_CHUNK]
+        delta = Case(
+            *[When(pk=pk, then=Value(deltas[pk])) for pk in chunk],
+            output_field=IntegerField(),
+        )
+        if movement_type == 'OUT':
+            # Guard pa rin kada row kahit na-check na, para sa sabay na single stock outs
+            guard = reduce(or_, [Q(pk=pk, quantity__gte=deltas[pk]) for pk in chunk])
+            updated = Product.objects.filter(guard).update(quantity=F('quantity') - delta, updated_at=now)
+        else:
+            changes = {}
+            costed = [pk for pk in chunk if pk in average_costs]
+            if costed:
+                changes['average_cost'] = Case(
+                    *[When(pk=pk, then=Value(average_costs[pk])) for pk in costed],
+                    default=F('average_cost'),
+                    output_field=DecimalField(max_digits=12, decimal_places=4),
+                )
+            updated = Product.objects.filter(pk__in=chunk).update(
+                quantity=F('quantity') + delta, updated_at=now, **changes
+            )
+        if updated != len(chunk):
+            return False
+    return True
+
+
+@serialized_write
+def record_stock_batch(movement_type, lines, user, reference=None, notes=None, ip_address=None):
+    """
+    I-apply ang maraming (product_id, quantity[, unit_cost]) lines bilang isang delivery o dispatch.
+
+    Lahat ng lines ay vina-validate muna; kapag may mali, BatchStockError at walang nasusulat.
+    Kung hindi, bulk_create ang movements at iilang UPDATE lang para sa quantities, lahat sa
+    iisang transaction; ang activity logs ay dumadaan sa buffered writer pagka-commit.
+    """
+    errors = []
+    deltas = {}
+    parsed = []
+    for number, (product_id, quantity, *rest) in enumerate(lines, start=1):
+        unit_cost = rest[0] if rest else None
+        parsed.append((product_id, quantity, unit_cost))
+        if quantity is None or quantity < 1:
+            errors.append({'line': number, 'error': 'Quantity must be at least 1.'})
+            continue
+        if unit_cost is not None and unit_cost < 0:
+            errors.append({'line': number, 'error': 'Unit cost must not be negative.'})
+            continue
+        deltas[product_id] = deltas.get(product_id, 0) + quantity
+    if not lines:
+        errors.append({'line': 0, 'error': 'No lines to apply.'})
+    if errors:
+        raise BatchStockError(errors)
+
+    now = timezone.now()
+    with transaction.atomic():
+        products = Product.objects.select_for_update().only(
+            'name', 'sku', 'unit', 'price', 'average_cost', 'quantity', 'category_id', 'reorder_level'
+        ).in_bulk(list(deltas))
+        for number, (product_id, quantity, unit_cost) in enumerate(parsed, start=1):
+            product = products.get(product_id)
+            if product is None:
+                errors.append({'line': number, 'error': f'Product {product_id} does not exist.'})
+            elif movement_type == 'OUT' and product.quantity < deltas[product_id]:
+                errors.append({
+                    'line': number,
+                    'error': f'Not enough stock for {product.name}: requested {deltas[product_id]}, '
+                             f'available {product.quantity} {product.unit}.',
+                })
+        if errors:
+            raise BatchStockError(errors)
+
+        # Naka-lock ang rows, kaya ligtas kalkulahin dito ang bagong average kada line, sunod-sunod
+        running = {pk: (product.quantity, product.average_cost) for pk, product in products.items()}
+        average_costs = {}
+        line_costs = []
+        for product_id, quantity, unit_cost in parsed:
+            on_hand, average = running[product_id]
+            if movement_type == 'IN' and unit_cost is not None:
+                average = weighted_average_cost(on_hand, average, quantity, unit_cost)
+                average_costs[product_id] = average
+            line_costs.append(unit_cost if movement_type == 'IN' and unit_cost is not None else average)
+            running[product_id] = (on_hand + quantity if movement_type == 'IN' else on_hand - quantity, average)
+
+        if not _apply_quantity_deltas(movement_type, deltas, now, average_costs):
+            raise BatchStockError([{'line': 0, 'error': 'Stock changed while applying the batch. Please try again.'}])
+
+        movements = []
+        for (product_id, quantity, _), unit_cost in zip(parsed, line_costs):
+            product = products[product_id]
+            price = product.price if movement_type == 'OUT' else 0
+            movements.append(StockMovement(
+                product_id=product_id,
+                movement_type=movement_type,
+                quantity=quantity,
+                price_at_movement=price,
+                total_value=quantity * price,
+                unit_cost=unit_cost,
+                total_cost=round(quantity * unit_cost, 2),
+                date=now,
+                reference=reference,
+                notes=notes,
+                performed_by=user,
+            ))
+            if movement_type == 'OUT':
+                action = 'STOCK_OUT'
+                changes = f"Removed {quantity} {product.unit} worth ₱{quantity * price:.2f}"
+            else:
+                action = 'STOCK_IN'
+                changes = f"Added {quantity} {product.unit}"
+            log_activity(
+                user=user,
+                action=action,
+                model_name='Product',
+                object_id=product_id,
+                object_repr=product.name,
+                changes=changes,
+                ip_address=ip_address,
+            )
+
+        StockMovement.objects.bulk_create(movements, batch_size=BATCH_UPDATE_CHUNK)
+        record_movements(movements, {pk: product.category_id for pk, product in products.items()})
+        # Walang post_save sa bulk_create, kaya manual ang version bump at cache invalidation
+        transaction.on_commit(bump_data_version)
+        transaction.on_commit(lambda: invalidate_tags('movements', 'products'))
+        for pk, (on_hand, _) in running.items():
+            products[pk].quantity = on_hand
+        transaction.on_commit(lambda: publish_stock_change(movements, products, user))
+    return movements
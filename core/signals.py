@@ -0,0 +1,71 @@
+from django.contrib.auth.models import User
+from django.contrib.auth.signals import user_logged_out
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .activity import activity_written
+from .auth import user_cache
+from .caching import invalidate_tags
+from .models import ActivityLog, Category, Product, StockMovement
+from .sqlite import apply_pragmas, production_mode
+from .versioning import bump_data_version
+
+
+# Mga cache tag na apektado ng bawat model (tingnan ang core.caching)
+MODEL_CACHE_TAGS = {
+    Category: ('categories', 'products'),
+    Product: ('products',),
+    StockMovement: ('movements', 'products'),
+}
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=StockMovement)
+@receiver(post_delete, sender=StockMovement)
+def inventory_changed(sender, **kwargs):
+    # I-bump lang pag committed na, para hindi ma-cache ang data ng rolled-back na transaction
+    transaction.on_commit(bump_data_version)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=StockMovement)
+@receiver(post_delete, sender=StockMovement)
+def invalidate_cached_pages(sender, **kwargs):
+    tags = MODEL_CACHE_TAGS[sender]
+    transaction.on_commit(lambda: invalidate_tags(*tags))
+
+
+@receiver(post_save, sender=ActivityLog)
+def activity_changed(sender, instance, **kwargs):
+    # Buffered writes (bulk_create) at ang archiver ay nag-i-invalidate mismo; walang post_delete
+    # receiver para manatiling fast delete ang archiving
+    transaction.on_commit(lambda: activity_written([instance]))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+    # Agad at pagka-commit: para hindi ma-cache ulit ang lumang row habang nasa transaction
+    user_cache.invalidate(instance.pk)
+    transaction.on_commit(lambda: user_cache.invalidate(instance.pk))
+
+
+@receiver(user_logged_out)
+def user_logged_out_handler(sender, request, user, **kwargs):
+    if user is not None:
+        user_cache.invalidate(user.pk)
+
+
+@receiver(connection_created)
+def configure_sqlite(sender, connection, **kwargs):
+    # WAL, busy_timeout, synchronous=NORMAL, mmap at cache size (SQLITE_PRAGMAS)
+    if production_mode(connection):
+        apply_pragmas(connection)
@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+from django.db.models import Max, Q, Sum
+from django.utils import timezone
+
+from .models import DailyMovementSummary, Product, StockSnapshot
+from .timeutils import local_day_start
+
+
+SNAPSHOT_BATCH_SIZE = 1000
+
+
+def _net_movements(after, until=None, product_ids=None):
+    # IN - OUT kada product mula sa daily rollup, para sa mga araw na after < day <= until
+    rows = DailyMovementSummary.objects.filter(day__gt=after)
+    if until is not None:
+        rows = rows.filter(day__lte=until)
+    if product_ids is not None:
+        rows = rows.filter(product_id__in=product_ids)
+    totals = rows.values('product_id').annotate(
+        stock_in=Sum('quantity', filter=Q(movement_type='IN')),
+        stock_out=Sum('quantity', filter=Q(movement_type='OUT')),
+    ).order_by()
+    return {row['product_id']: (row['stock_in'] or 0) - (row['stock_out'] or 0) for row in totals}
+
+
+def take_snapshot(day=None, batch_size=SNAPSHOT_BATCH_SIZE):
+    """
+    Isulat ang end-of-day quantity ng bawat product para sa `day` (default: ngayon).
+
+    Quantity = kasalukuyang quantity bawas ang net movements pagkatapos ng araw na iyon,
+    kaya puwede ring i-backfill ang nakaraang araw. Current price at average cost ang itinatala.
+    """
+    day = day or timezone.localdate()
+    later = _net_movements(after=day)
+    products = Product.objects.filter(created_at__lt=local_day_start(day + timedelta(days=1))).values_list(
+        'id', 'category_id', 'quantity', 'price', 'average_cost'
+    ).order_by()
+
+    written = 0
+    batch = []
+    for product_id, category_id, quantity, price, average_cost in products.iterator(chunk_size=batch_size):
+        quantity -= later.get(product_id, 0)
+        batch.append(StockSnapshot(
+            product_id=product_id,
+            category_id=category_id,
+            day=day,
+            quantity=quantity,
+            price=price,
+            total_value=quantity * price,
+            average_cost=average_cost,
+        ))
+        if len(batch) >= batch_size:
+            written += _write_snapshots(batch)
+            batch = []
+    if batch:
+        written += _write_snapshots(batch)
+    return written
+
+
+def _write_snapshots(batch):
+    # Upsert para ligtas na ulitin ang snapshot ng parehong araw
+    StockSnapshot.objects.bulk_create(
+        batch,
+        update_conflicts=True,
+        unique_fields=['product', 'day'],
+        update_fields=['category', 'quantity', 'price', 'total_value', 'average_cost'],
+    )
+    return len(batch)
+
+
+def latest_snapshot_day(on_or_before=None):
+    snapshots = StockSnapshot.objects.all()
+    if on_or_before is not None:
+        snapshots = snapshots.filter(day__lte=on_or_before)
+    return snapshots.aggregate(day=Max('day'))['day']
+
+
+def stock_as_of(day):
+    """
+    Mga Product (na may category) na ang quantity at price ay kung ano sila sa pagsara ng `day`.
+
+    Pinakamalapit na snapshot sa o bago ang `day`, plus replay ng rollup rows pagkatapos nito;
+    ang products na wala sa snapshot (bago o walang snapshot) ay binabalik mula sa current quantity.
+    Hindi ito sine-save; para lang sa report.
+    """
+    products = list(Product.objects.select_related('category').filter(
+        created_at__lt=local_day_start(day + timedelta(days=1))
+    ).order_by('name'))
+
+    base_day = latest_snapshot_day(on_or_before=day)
+    snapshots = {}
+    forward = {}
+    if base_day is not None:
+        snapshots = {
+            row['product_id']: row
+            for row in StockSnapshot.objects.filter(day=base_day).values(
+                'product_id', 'quantity', 'price', 'average_cost'
+            )
+        }
+        forward = _net_movements(after=base_day, until=day)
+
+    missing = [product.id for product in products if product.id not in snapshots]
+    backward = _net_movements(after=day, product_ids=missing) if missing else {}
+
+    for product in products:
+        snapshot = snapshots.get(product.id)
+        if snapshot is not None:
+            product.quantity = snapshot['quantity'] + forward.get(product.id, 0)
+            product.price = snapshot['price']
+            product.average_cost = snapshot['average_cost']
+        else:
+            product.quantity -= backward.get(product.id, 0)
+    return products
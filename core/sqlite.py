@@ -0,0 +1,106 @@
+"""
+SQLite production mode.
+
+Sa ilang gunicorn workers na sabay nagsusulat, ang default na SQLite setup (rollback journal,
+DEFERRED transactions) ay nauuwi sa "database is locked". Dito:
+
+- WAL at tuned na pragmas sa bawat bagong connection (connection_created, tingnan ang signals);
+- BEGIN IMMEDIATE para sa write transactions (DATABASES OPTIONS transaction_mode), kaya ang
+  write lock ay kinukuha sa simula at naghihintay sa busy_timeout, hindi pumapalya sa gitna;
+- serialized_write: iisang writer kada process at bounded retry kapag locked pa rin.
+
+Persistent ang journal_mode=WAL sa mismong database file, kaya kapag nabuksan na sa production
+mode ay WAL pa rin ito kahit i-off ang setting (may -wal at -shm files sa tabi nito).
+"""
+import random
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.db import OperationalError, connection
+from django.db.models import Model
+
+
+LOCK_ERRORS = ('database is locked', 'database table is locked', 'database is busy')
+
+# Sa loob ng isang process, isa-isa ang write transactions; ang ibang processes ay
+# pinagsisilbihan ng busy_timeout ng SQLite
+_write_lock = threading.RLock()
+
+
+def production_mode(conn=None):
+    conn = conn or connection
+    return conn.vendor == 'sqlite' and getattr(settings, 'SQLITE_PRODUCTION_MODE', False)
+
+
+def apply_pragmas(conn):
+    with conn.cursor() as cursor:
+        for name, value in getattr(settings, 'SQLITE_PRAGMAS', {}).items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+
+
+def current_pragmas(conn=None):
+    conn = conn or connection
+    values = {}
+    with conn.cursor() as cursor:
+        for name in getattr(settings, 'SQLITE_PRAGMAS', {}):
+            cursor.execute(f'PRAGMA {name}')
+            row = cursor.fetchone()
+            values[name] = row[0] if row else None
+    return values
+
+
+def is_lock_error(exc):
+    message = str(exc).lower()
+    return any(text in message for text in LOCK_ERRORS)
+
+
+def _unsaved_instances(func, args, kwargs):
+    # Mga bagong model instance na isusulat: arguments, lists nito (bulk_create), o ang self ng obj.save
+    candidates = [getattr(func, '__self__', None), *args, *kwargs.values()]
+    instances = []
+    for value in candidates:
+        if isinstance(value, (list, tuple)):
+            instances.extend(item for item in value if isinstance(item, Model))
+        elif isinstance(value, Model):
+            instances.append(value)
+    return [
+        (obj, {field.attname: getattr(obj, field.attname) for field in obj._meta.concrete_fields})
+        for obj in instances if obj._state.adding
+    ]
+
+
+def _restore_unsaved(snapshot):
+    # Na-rollback ang attempt: ibalik ang pk, _state.adding at mga field na binago ng attempt,
+    # para INSERT ulit (hindi UPDATE ng row na wala) at hindi ma-reuse ang lumang computed values
+    for obj, values in snapshot:
+        obj.__dict__.update(values)
+        obj._state.adding = True
+        obj._state.db = None
+
+
+def serialized_write(func):
+    """
+    Patakbuhin ang write transaction nang naka-serialize sa process at i-retry (exponential
+    backoff na may jitter) kapag "database is locked". Sa loob ng mas malaking atomic block ay
+    direktang tinatawag, dahil ang outer transaction ang dapat mag-retry.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not production_mode() or connection.in_atomic_block:
+            return func(*args, **kwargs)
+        retries = getattr(settings, 'SQLITE_WRITE_RETRIES', 5)
+        delay = getattr(settings, 'SQLITE_RETRY_DELAY', 0.05)
+        snapshot = _unsaved_instances(func, args, kwargs)
+        for attempt in range(retries + 1):
+            if attempt:
+                _restore_unsaved(snapshot)
+            try:
+                with _write_lock:
+                    return func(*args, **kwargs)
+            except OperationalError as exc:
+                if attempt == retries or not is_lock_error(exc):
+                    raise
+            time.sleep(min(delay * 2 ** attempt, 2.0) * random.uniform(0.5, 1.5))
+    return wrapper
@@ -1 +1,43 @@
- 
+from django import template
+
+from core.caching import cached_fragment
+
+
+register = template.Library()
+
+
+class CachedFragmentNode(template.Node):
+    def __init__(self, nodelist, name, tags, vary_on):
+        self.nodelist = nodelist
+        self.name = name
+        self.tags = tags
+        self.vary_on = vary_on
+
+    def render(self, context):
+        vary_on = [value.resolve(context) for value in self.vary_on]
+        return cached_fragment(self.name, self.tags, vary_on, lambda: self.nodelist.render(context))
+
+
+@register.tag
+def cachetagged(parser, token):
+    """
+    {% cachetagged "name" "tag" ... [vary value ...] %} ... {% endcachetagged %}
+
+    Naka-cache ang laman hanggang ma-invalidate ang isa sa mga tag (tingnan ang core.caching).
+    """
+    bits = token.split_contents()
+    if len(bits) < 3:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' needs a fragment name and at least one tag.")
+    vary_on = []
+    if 'vary' in bits:
+        index = bits.index('vary')
+        vary_on = [parser.compile_filter(bit) for bit in bits[index + 1:]]
+        bits = bits[:index]
+    literals = []
+    for bit in bits[1:]:
+        if len(bit) < 2 or bit[0] != bit[-1] or bit[0] not in '"\'':
+            raise template.TemplateSyntaxError(f"'{bits[0]}' name and tags must be quoted strings.")
+        literals.append(bit[1:-1])
+    nodelist = parser.parse(('endcachetagged',))
+    parser.delete_first_token()
+    return CachedFragmentNode(nodelist, literals[0], literals[1:], vary_on)
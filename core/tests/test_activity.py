@@ -0,0 +1,66 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import OperationalError
+from django.test import TestCase
+from django.utils import timezone
+
+from core.activity import ActivityLogWriter
+from core.models import ActivityLog
+
+from .utils import InventoryTestMixin, isolated
+
+
+@isolated
+class ActivityLogWriterTests(InventoryTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = self.make_admin()
+        spill_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spill_dir.cleanup)
+        self.spill_file = os.path.join(spill_dir.name, 'unwritten-activity.jsonl')
+        self.writer = ActivityLogWriter(batch_size=10, max_retries=2, spill_file=self.spill_file)
+
+    def entries(self, count):
+        return [
+            ActivityLog(user=self.user, action='UPDATE', model_name='Product', object_id=index,
+                        changes=f'Change {index}', timestamp=timezone.now())
+            for index in range(count)
+        ]
+
+    def failing_bulk_create(self):
+        return mock.patch.object(ActivityLog.objects, 'bulk_create', side_effect=OperationalError('database is locked'))
+
+    def test_failed_batch_is_requeued_and_written_on_retry(self):
+        entries = self.entries(3)
+        with self.failing_bulk_create(), self.assertLogs('core.activity', 'WARNING'):
+            self.assertFalse(self.writer._write(entries))
+        self.assertEqual(self.writer._buffer, entries)
+        self.assertTrue(all(entry.pk is None for entry in entries))
+
+        self.assertTrue(self.writer._write(self.writer._take()))
+        self.assertEqual(ActivityLog.objects.count(), 3)
+
+    def test_batch_falls_back_to_row_writes_after_max_retries(self):
+        entries = self.entries(3)
+        with self.failing_bulk_create(), self.assertLogs('core.activity', 'WARNING'):
+            self.writer._write(entries)
+            self.writer._write(self.writer._take())
+        self.assertEqual(self.writer._buffer, [])
+        self.assertEqual(ActivityLog.objects.count(), 3)
+        self.assertFalse(os.path.exists(self.spill_file))
+
+    def test_unwritable_rows_are_spilled_and_can_be_loaded(self):
+        failing_save = mock.patch.object(ActivityLog, 'save', side_effect=OperationalError('disk I/O error'))
+        with self.failing_bulk_create(), failing_save, self.assertLogs('core.activity', 'ERROR') as logs:
+            self.writer._write(self.entries(2), retry=False)
+        self.assertIn('Spilled 2 activity log entries', logs.output[-1])
+        self.assertFalse(ActivityLog.objects.exists())
+
+        call_command('loaddata', self.spill_file, verbosity=0)
+        self.assertEqual(
+            sorted(ActivityLog.objects.values_list('object_id', 'changes', 'user')),
+            [(0, 'Change 0', self.user.pk), (1, 'Change 1', self.user.pk)],
+        )
@@ -0,0 +1,178 @@
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+
+from core.models import ActivityLog, Category, Product, StockMovement
+
+from .utils import InventoryTestMixin, isolated
+
+
+@isolated
+class StockBatchApiTests(InventoryTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.make_admin())
+        self.drill = self.make_product('DRL-1', quantity=5, price='1800.00')
+        self.grinder = self.make_product('GRD-1', quantity=1, price='3200.00')
+
+    def post(self, payload):
+        return self.client.post(reverse('stock_batch_api'), json.dumps(payload), content_type='application/json')
+
+    def test_applies_lines_by_sku_and_product_id(self):
+        response = self.post({
+            'movement_type': 'OUT',
+            'reference': 'SALE-1',
+            'lines': [{'sku': 'DRL-1', 'quantity': 2}, {'product_id': self.grinder.pk, 'quantity': 1}],
+        })
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertEqual((body['lines'], body['total_quantity']), (2, 3))
+        self.assertEqual(
+            sorted(StockMovement.objects.filter(pk__in=body['movement_ids']).values_list('reference', flat=True)),
+            ['SALE-1', 'SALE-1'],
+        )
+        self.assertEqual(dict(Product.objects.values_list('sku', 'quantity')), {'DRL-1': 3, 'GRD-1': 0})
+        self.assertEqual(ActivityLog.objects.filter(action='STOCK_OUT').count(), 2)
+
+    def test_insufficient_stock_is_a_conflict_and_writes_nothing(self):
+        response = self.post({
+            'movement_type': 'OUT',
+            'lines': [{'sku': 'DRL-1', 'quantity': 1}, {'sku': 'GRD-1', 'quantity': 2}],
+        })
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual([error['line'] for error in response.json()['errors']], [2])
+        self.assertFalse(StockMovement.objects.exists())
+        self.assertEqual(Product.objects.get(sku='DRL-1').quantity, 5)
+
+    def test_invalid_lines_are_rejected_per_line(self):
+        response = self.post({
+            'movement_type': 'IN',
+            'lines': [{'sku': 'DRL-1', 'quantity': 1}, {'sku': 'DRL-1', 'quantity': '2'}, 'x'],
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error['line'] for error in response.json()['errors']], [2, 3])
+        response = self.post({
+            'movement_type': 'IN',
+            'lines': [{'sku': 'NOPE', 'quantity': 1}, {'sku': 'DRL-1', 'quantity': 2}],
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error['line'] for error in response.json()['errors']], [1])
+        self.assertFalse(StockMovement.objects.exists())
+
+    def test_rejects_bad_envelope(self):
+        self.assertEqual(self.post({'movement_type': 'MOVE', 'lines': []}).status_code, 400)
+        response = self.client.post(reverse('stock_batch_api'), 'not json', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_requires_login(self):
+        self.client.logout()
+        response = self.post({'movement_type': 'IN', 'lines': [{'sku': 'DRL-1', 'quantity': 1}]})
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(StockMovement.objects.exists())
+
+    def test_non_object_payloads_are_bad_requests(self):
+        for body in ('[]', '1', '"IN"', 'null'):
+            response = self.client.post(reverse('stock_batch_api'), body, content_type='application/json')
+            self.assertEqual(response.status_code, 400, body)
+            self.assertEqual(response.json()['errors'][0]['line'], 0)
+
+    def test_line_field_types_are_validated_before_any_query(self):
+        lines = [
+            {'product_id': 'abc', 'quantity': 1},
+            {'product_id': True, 'quantity': 1},
+            {'product_id': 2 ** 70, 'quantity': 1},
+            {'sku': 42, 'quantity': 1},
+            {'sku': 'DRL-1', 'quantity': 1.5},
+            {'sku': 'DRL-1', 'quantity': 0},
+            {'sku': 'DRL-1', 'quantity': 1, 'unit_cost': 'ten'},
+            {'sku': 'DRL-1', 'quantity': 1, 'unit_cost': '1.23456'},
+            {'sku': 'DRL-1', 'quantity': 1, 'unit_cost': -5},
+            {'sku': 'DRL-1', 'quantity': 1, 'unit_cost': {'amount': 1}},
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post({'movement_type': 'IN', 'lines': lines})
+        # Session at user lookup lang; walang product query bago pumasa ang validation
+        self.assertFalse([query for query in queries.captured_queries if 'core_product' in query['sql']])
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()['errors']
+        self.assertEqual([error['line'] for error in errors], list(range(1, len(lines) + 1)))
+        self.assertTrue(all(set(error) == {'line', 'error'} for error in errors))
+
+    def test_reference_and_notes_must_be_strings(self):
+        response = self.post({'movement_type': 'IN', 'reference': ['PO-1'], 'lines': [{'sku': 'DRL-1', 'quantity': 1}]})
+        self.assertEqual(response.status_code, 400)
+        response = self.post({'movement_type': 'IN', 'reference': 'P' * 101, 'lines': [{'sku': 'DRL-1', 'quantity': 1}]})
+        self.assertEqual(response.status_code, 400)
+
+    def test_numeric_string_unit_cost_is_accepted(self):
+        response = self.post({'movement_type': 'IN', 'lines': [{'sku': 'DRL-1', 'quantity': 5, 'unit_cost': '900.50'}]})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(StockMovement.objects.get().unit_cost, Decimal('900.50'))
+
+
+@isolated
+class ConditionalApiTests(InventoryTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.make_admin())
+        self.drill = self.make_product('DRL-1', quantity=5)
+        self.saw = self.make_product('SAW-1', quantity=2, category=Category.objects.create(name='Saws'))
+
+    def touch(self, product, **changes):
+        # Tiyak na mas bagong updated_at kaysa sa naunang response
+        product.updated_at += timedelta(seconds=5)
+        Product.objects.filter(pk=product.pk).update(updated_at=product.updated_at, **changes)
+
+    def revalidate(self, url, response):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+
+    def test_detail_etag_and_last_modified_follow_the_product(self):
+        url = reverse('api_product_detail', args=[self.drill.pk])
+        first = self.client.get(url)
+        self.assertEqual(first['Last-Modified'], http_date(int(self.drill.updated_at.timestamp())))
+
+        self.touch(self.saw, quantity=1)
+        self.assertEqual(self.revalidate(url, first).status_code, 304)
+
+        self.touch(self.drill, quantity=4)
+        second = self.revalidate(url, first)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json()['quantity'], 4)
+        self.assertEqual(second['Last-Modified'], http_date(int(self.drill.updated_at.timestamp())))
+
+    def test_list_etag_follows_only_the_filtered_products(self):
+        url = reverse('api_product_list') + f'?category={self.drill.category_id}'
+        first = self.client.get(url)
+        self.assertEqual([row['sku'] for row in first.json()['results']], ['DRL-1'])
+
+        self.touch(self.saw, quantity=1)
+        self.assertEqual(self.revalidate(url, first).status_code, 304)
+
+        self.touch(self.drill, quantity=4)
+        second = self.revalidate(url, first)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second['Last-Modified'], http_date(int(self.drill.updated_at.timestamp())))
+
+        self.drill.delete()
+        self.assertEqual(self.revalidate(url, second).status_code, 200)
+
+    def test_movement_list_etag_changes_on_new_movements(self):
+        url = reverse('api_movement_list')
+        first = self.client.get(url)
+        self.assertNotIn('Last-Modified', first)
+        self.assertEqual(self.revalidate(url, first).status_code, 304)
+
+        StockMovement.objects.create(product=self.drill, movement_type='IN', quantity=1, date=timezone.now())
+        self.assertEqual(self.revalidate(url, first).status_code, 200)
+
+    def test_missing_product_is_a_json_404(self):
+        response = self.client.get(reverse('api_product_detail', args=[999999]))
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {'error': 'Not found.'})
@@ -0,0 +1,40 @@
+import os
+import tempfile
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from core.archive import archive_activity_logs, archived_months
+from core.models import ActivityLog
+
+from .utils import InventoryTestMixin, isolated
+
+
+@isolated
+class ArchiveTests(InventoryTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.archive_dir = os.path.join(root.name, 'activity')
+        settings_override = override_settings(ACTIVITY_LOG_ARCHIVE_DIR=self.archive_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_reading_does_not_create_the_archive_directory(self):
+        self.assertEqual(archived_months(), [])
+        self.client.force_login(self.make_admin())
+        response = self.client.get(reverse('activity_log'))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(os.path.exists(self.archive_dir))
+
+    def test_archiving_creates_the_directory_and_lists_the_month(self):
+        timestamp = timezone.now() - timedelta(days=400)
+        ActivityLog.objects.create(action='LOGIN', model_name='User', timestamp=timestamp)
+        ActivityLog.objects.filter(action='LOGIN').update(timestamp=timestamp)
+
+        self.assertEqual(archive_activity_logs(older_than_days=180), 1)
+        self.assertEqual(archived_months(), [timezone.localtime(timestamp).strftime('%Y-%m')])
+        self.assertFalse(ActivityLog.objects.exists())
@@ -0,0 +1,60 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.events import publish_event
+
+from .utils import InventoryTestMixin, isolated
+
+
+# Pagkatapos ng isolated, na naka-False ang live events
+@override_settings(LIVE_EVENTS_ENABLED=True)
+@isolated
+class LiveEventsTests(InventoryTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = self.make_admin()
+
+    def test_wsgi_dashboard_has_no_event_stream(self):
+        # Sa WSGI, maiipon lang ang stream sa memory at hawak ang worker; walang EventSource at 204
+        self.client.force_login(self.user)
+        self.assertNotContains(self.client.get(reverse('dashboard')), 'EventSource')
+        response = self.client.get(reverse('dashboard_events'))
+        self.assertEqual(response.status_code, 204)
+
+    async def test_asgi_streams_published_events(self):
+        await self.async_client.aforce_login(self.user)
+        page = await self.async_client.get(reverse('dashboard'))
+        self.assertContains(page, 'EventSource')
+
+        response = await self.async_client.get(reverse('dashboard_events'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        try:
+            self.assertEqual(await anext(stream), b'retry: 5000\n\n')
+            await asyncio.to_thread(publish_event, 'kpi', {'total_products': 1})
+            chunk = await asyncio.wait_for(anext(stream), timeout=5)
+            self.assertIn(b'event: kpi', chunk)
+        finally:
+            await stream.aclose()
+
+    async def test_cached_dashboard_is_separate_for_wsgi_and_asgi(self):
+        # Parehong user at CSRF cookie, kaya ang live events lang ang pinagkaiba ng cache key
+        self.client.cookies[settings.CSRF_COOKIE_NAME] = 'x' * 32
+        self.async_client.cookies[settings.CSRF_COOKIE_NAME] = 'x' * 32
+        await self.client.aforce_login(self.user)
+        page = await sync_to_async(self.client.get)(reverse('dashboard'))
+        self.assertNotContains(page, 'EventSource')
+
+        await self.async_client.aforce_login(self.user)
+        self.assertContains(await self.async_client.get(reverse('dashboard')), 'EventSource')
+
+    @override_settings(LIVE_EVENTS_ENABLED=False)
+    async def test_asgi_respects_the_setting(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse('dashboard_events'))
+        self.assertEqual(response.status_code, 204)
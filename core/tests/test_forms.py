@@ -0,0 +1,57 @@
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+
+from core.forms import StockBatchForm
+from core.models import StockMovement
+
+from .utils import InventoryTestMixin, isolated
+
+
+@isolated
+class StockBatchFormTests(InventoryTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.product = self.make_product('DRL-1', quantity=5, average_cost='10')
+
+    def errors_for(self, lines):
+        form = StockBatchForm({'lines': lines})
+        self.assertFalse(form.is_valid())
+        return form.errors['lines']
+
+    def test_valid_lines_resolve_skus(self):
+        form = StockBatchForm({'lines': 'DRL-1, 2\nDRL-1 3 12.5'})
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data['lines'], [(self.product.pk, 2, None), (self.product.pk, 3, Decimal('12.5'))])
+
+    def test_unit_cost_must_fit_the_cost_column(self):
+        for cost in ('1e12', '123456789012', '100000000', '1.123456', '-1', 'NaN', 'abc'):
+            with self.subTest(cost):
+                [error] = self.errors_for(f'DRL-1, 1, {cost}')
+                self.assertTrue(error.startswith(f'Line 1: invalid unit cost "{cost}"'), error)
+
+    def test_quantity_must_be_an_ascii_integer_in_range(self):
+        for quantity in ('²', '٣', '0', '-1', '1.5', '2147483648', '99999999999'):
+            with self.subTest(quantity):
+                [error] = self.errors_for(f'DRL-1, {quantity}')
+                self.assertTrue(error.startswith('Line 1: expected'), error)
+        form = StockBatchForm({'lines': 'DRL-1, 2147483647'})
+        self.assertTrue(form.is_valid(), form.errors)
+
+    def test_unicode_digit_quantity_is_a_form_error(self):
+        self.client.force_login(self.make_admin())
+        response = self.client.post(reverse('stock_batch_in'), {'lines': 'DRL-1, ²'})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'expected')
+        self.assertFalse(StockMovement.objects.exists())
+
+    def test_oversized_cost_is_a_form_error_not_a_write(self):
+        self.client.force_login(self.make_admin())
+        response = self.client.post(reverse('stock_batch_in'), {'lines': 'DRL-1, 1, 1e12'})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'invalid unit cost')
+        self.assertFalse(StockMovement.objects.exists())
+        self.product.refresh_from_db()
+        self.assertEqual((self.product.quantity, self.product.average_cost), (5, Decimal('10')))
+        self.assertEqual(self.client.get(reverse('product_list')).status_code, 200)
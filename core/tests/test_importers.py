@@ -0,0 +1,134 @@
+import csv
+import io
+from decimal import Decimal
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.models import Sum
+from django.test import TestCase
+from django.urls import reverse
+
+from core.importers import ADJUSTMENT_REFERENCE, import_products
+from core.models import ActivityLog, Category, DailyMovementSummary, Product, StockMovement
+
+from .utils import InventoryTestMixin, isolated
+
+
+def csv_stream(text):
+    return io.StringIO(text)
+
+
+@isolated
+class ImportProductsTests(InventoryTestMixin, TestCase):
+    def test_creates_products_and_missing_categories(self):
+        result = import_products(csv_stream(
+            'name,sku,category,unit,quantity,reorder_level,price\n'
+            'Makita Drill,DRL-1,DRILL,Pieces,4,2,"1,800.50"\n'
+            'Bosch Grinder,GRD-1,GRINDER,pcs,,,3200\n'
+        ))
+        self.assertEqual((result.processed, result.imported, result.errors), (2, 2, []))
+        self.assertEqual(result.categories_created, 2)
+        drill = Product.objects.get(sku='DRL-1')
+        self.assertEqual((drill.unit, drill.quantity, drill.price), ('pcs', 4, Decimal('1800.50')))
+        self.assertEqual(drill.category.name, 'DRILL')
+        grinder = Product.objects.get(sku='GRD-1')
+        self.assertEqual((grinder.quantity, grinder.reorder_level), (0, 5))
+
+    def test_existing_sku_updates_only_columns_in_the_file(self):
+        self.make_product('DRL-1', quantity=7, price='100.00', reorder_level=3, description='Keep me')
+        result = import_products(csv_stream('sku,name,price\nDRL-1,Renamed Drill,250\n'))
+        self.assertEqual((result.imported, result.errors), (1, []))
+        product = Product.objects.get(sku='DRL-1')
+        self.assertEqual((product.name, product.price), ('Renamed Drill', Decimal('250.00')))
+        self.assertEqual((product.quantity, product.reorder_level, product.description), (7, 3, 'Keep me'))
+        self.assertEqual(Product.objects.count(), 1)
+
+    def test_bad_rows_are_skipped_and_reported_by_line(self):
+        result = import_products(csv_stream(
+            'name,sku,unit,price\n'
+            'Good,OK-1,pcs,10\n'
+            ',NO-NAME,pcs,10\n'
+            'Bad unit,BAD-UNIT,crates,10\n'
+            'Bad price,BAD-PRICE,pcs,abc\n'
+        ))
+        self.assertEqual(result.imported, 1)
+        self.assertEqual([error['line'] for error in result.errors], [3, 4, 5])
+        self.assertEqual(list(Product.objects.values_list('sku', flat=True)), ['OK-1'])
+
+    def test_values_beyond_the_column_limits_are_row_errors(self):
+        result = import_products(csv_stream(
+            'name,sku,price,average_cost,quantity,reorder_level\n'
+            'Good,OK-1,99999999.99,99999999.9999,2147483647,0\n'
+            'Big price,BIG-PRICE,12345678901,0,1,1\n'
+            'Big cost,BIG-COST,10,123456789012,1,1\n'
+            'Fine cost,FINE-COST,10,1.123456,1,1\n'
+            'Big quantity,BIG-QTY,10,0,99999999999,1\n'
+            'Big reorder,BIG-REORDER,10,0,1,2147483648\n'
+            'Negative,NEG-QTY,10,0,-1,1\n'
+            'Infinite,INF-PRICE,Infinity,0,1,1\n'
+        ))
+        self.assertEqual(result.imported, 1)
+        self.assertEqual([error['line'] for error in result.errors], [3, 4, 5, 6, 7, 8, 9])
+        self.assertIn('price', result.errors[0]['error'])
+        self.assertIn('quantity', result.errors[3]['error'])
+        self.assertEqual(list(Product.objects.values_list('sku', flat=True)), ['OK-1'])
+        # Nababasa pa rin ang na-import na product
+        product = Product.objects.get(sku='OK-1')
+        self.assertEqual((product.price, product.average_cost), (Decimal('99999999.99'), Decimal('99999999.9999')))
+
+    def test_duplicate_sku_in_file_keeps_the_last_row(self):
+        result = import_products(csv_stream('name,sku,price\nFirst,DUP-1,10\nSecond,DUP-1,20\n'), chunk_size=10)
+        self.assertEqual(result.errors, [])
+        product = Product.objects.get(sku='DUP-1')
+        self.assertEqual((product.name, product.price), ('Second', Decimal('20.00')))
+
+    def test_missing_required_header_imports_nothing(self):
+        result = import_products(csv_stream('name,price\nDrill,10\n'))
+        self.assertEqual(result.imported, 0)
+        self.assertEqual(result.errors[0]['line'], 1)
+        self.assertFalse(Product.objects.exists())
+        self.assertFalse(Category.objects.exists())
+
+    def test_new_quantity_for_existing_sku_is_a_stock_adjustment(self):
+        user = self.make_admin()
+        self.make_product('UP-1', quantity=10, average_cost='40')
+        self.make_product('DOWN-1', quantity=10)
+        self.make_product('SAME-1', quantity=10)
+        result = import_products(csv_stream(
+            'name,sku,quantity\nUp,UP-1,15\nDown,DOWN-1,4\nSame,SAME-1,10\nNew,NEW-1,7\n'
+        ), user=user)
+        self.assertEqual((result.imported, result.adjustments, result.errors), (4, 2, []))
+        self.assertEqual(
+            dict(Product.objects.values_list('sku', 'quantity')),
+            {'UP-1': 15, 'DOWN-1': 4, 'SAME-1': 10, 'NEW-1': 7},
+        )
+        movements = StockMovement.objects.filter(reference=ADJUSTMENT_REFERENCE)
+        self.assertEqual(
+            sorted(movements.values_list('product__sku', 'movement_type', 'quantity')),
+            [('DOWN-1', 'OUT', 6), ('UP-1', 'IN', 5)],
+        )
+        # Naka-cost sa average, kaya hindi gumalaw ang valuation
+        self.assertEqual(movements.get(product__sku='UP-1').unit_cost, Decimal('40'))
+        self.assertEqual(set(movements.values_list('performed_by', flat=True)), {user.pk})
+        rollup = dict(DailyMovementSummary.objects.values_list('movement_type').annotate(Sum('quantity')))
+        self.assertEqual(rollup, {'IN': 5, 'OUT': 6})
+        self.assertEqual(ActivityLog.objects.filter(action__in=['STOCK_IN', 'STOCK_OUT']).count(), 2)
+
+    def test_malformed_csv_is_reported_not_raised(self):
+        field_limit = csv.field_size_limit()
+        result = import_products(csv_stream(
+            'name,sku\nGood,OK-1\n"' + 'x' * (field_limit + 1) + '",BIG-1\nLater,OK-2\n'
+        ))
+        self.assertTrue(result.malformed)
+        self.assertEqual(result.errors[0]['line'], 3)
+        self.assertEqual(list(Product.objects.values_list('sku', flat=True)), ['OK-1'])
+
+    def test_malformed_upload_is_a_form_error(self):
+        self.client.force_login(self.make_admin())
+        upload = SimpleUploadedFile(
+            'products.csv', ('name,sku\n"' + 'x' * (csv.field_size_limit() + 1) + '",BIG-1\n').encode(),
+            content_type='text/csv',
+        )
+        response = self.client.post(reverse('product_import'), {'file': upload})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context['form'].errors['file'])
+        self.assertFalse(Product.objects.exists())
@@ -0,0 +1,63 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.benchmarks import QUERY_BUDGETS, bench_cases, bench_context, send_case, uncovered_urls
+from core.management.commands.bench_views import Command as BenchViewsCommand
+from core.seeding import seed_inventory
+
+from .utils import InventoryTestMixin, isolated
+
+
+@override_settings(VIEW_CACHE_ENABLED=False, AUTH_USER_CACHE_TTL=0)
+@isolated
+class QueryBudgetTests(InventoryTestMixin, TestCase):
+    """
+    Query budgets ng bawat benchmark case sa maliit na seeded dataset. Ang timing sa malalaking
+    dataset ay nasa optional na `manage.py bench_views`.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_superuser('bench-admin', password=None)
+        self.client.force_login(self.user)
+
+    def measure(self, seed):
+        context = bench_context(seed)
+        counts = {}
+        for case in bench_cases():
+            send_case(self.client, case, context)  # warm-up, gaya ng sa bench_views
+            with CaptureQueriesContext(connection) as queries:
+                response = send_case(self.client, case, context)
+            self.assertLess(response.status_code, 400, case['label'])
+            counts[case['label']] = len(queries.captured_queries)
+        return counts
+
+    def test_every_url_has_a_budgeted_case(self):
+        self.assertEqual(uncovered_urls(bench_cases()), [])
+        self.assertEqual(set(QUERY_BUDGETS), {case['label'] for case in bench_cases()})
+
+    def test_views_stay_within_budget_and_do_not_grow_with_data(self):
+        seed_inventory(20, 200, days=30, seed=0, user=self.user)
+        small = self.measure(0)
+        for label, count in small.items():
+            with self.subTest(label):
+                self.assertLessEqual(count, QUERY_BUDGETS[label])
+
+        # Mas maraming products at movements: parehong bilang ng queries, kung hindi ay may N+1
+        seed_inventory(150, 3000, days=90, seed=1, user=self.user)
+        cases = {case['label']: case for case in bench_cases()}
+        context = bench_context(0)
+        for label, count in small.items():
+            with self.subTest(label):
+                send_case(self.client, cases[label], context)
+                with self.assertNumQueries(count):
+                    send_case(self.client, cases[label], context)
+
+    def test_bench_views_fails_a_case_over_budget(self):
+        budget = QUERY_BUDGETS['login']
+        result = {'label': 'login', 'movements': 1000, 'queries': budget + 1, 'ms': 1.0, 'scaling': 'flat',
+                  'budget': budget}
+        failures = BenchViewsCommand()._check([result], [1000], {'min_ms': 20.0, 'flat_limit': 5.0})
+        self.assertEqual(failures, [f'login at 1000 movements: {budget + 1} queries, budget {budget}'])
@@ -0,0 +1,195 @@
+import random
+import threading
+from decimal import Decimal
+from unittest import mock
+
+from django.db import OperationalError, connection
+from django.db.models import Sum
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from core.models import ActivityLog, DailyMovementSummary, Product, StockMovement
+from core.rollups import record_movement
+from core.services import BatchStockError, InsufficientStock, record_stock_batch, record_stock_movement
+
+from .utils import InventoryTestMixin, isolated
+
+
+@isolated
+class RecordStockMovementTests(InventoryTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = self.make_admin()
+        self.product = self.make_product(quantity=10, price='150.00', average_cost='80')
+
+    def test_stock_in_updates_quantity_ledger_rollup_and_log(self):
+        movement = record_stock_movement(
+            StockMovement(product_id=self.product.pk, movement_type='IN', quantity=5, performed_by=self.user)
+        )
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.quantity, 15)
+        self.assertIsNotNone(movement.pk)
+        # Walang unit_cost: naka-cost sa kasalukuyang average, kaya hindi gumalaw ang valuation
+        self.assertEqual(movement.unit_cost, Decimal('80'))
+        self.assertEqual(self.product.average_cost, Decimal('80'))
+        summary = DailyMovementSummary.objects.get(product=self.product, movement_type='IN')
+        self.assertEqual((summary.quantity, summary.movement_count), (5, 1))
+        self.assertTrue(ActivityLog.objects.filter(action='STOCK_IN', object_id=self.product.pk).exists())
+
+    def test_stock_in_with_cost_keeps_a_fractional_average(self):
+        product = self.make_product('SKU-2', quantity=10, average_cost='10')
+        movement = record_stock_movement(StockMovement(
+            product_id=product.pk, movement_type='IN', quantity=5, unit_cost=Decimal('50'), performed_by=self.user,
+        ))
+        product.refresh_from_db()
+        self.assertEqual(product.quantity, 15)
+        # (10 * 10 + 5 * 50) / 15; hindi 23 o 23.0000
+        self.assertEqual(product.average_cost, Decimal('23.3333'))
+        self.assertEqual(movement.unit_cost, Decimal('50'))
+        self.assertEqual(movement.total_cost, Decimal('250.00'))
+
+    def test_stock_out_is_priced_and_costed_at_current_values(self):
+        movement = record_stock_movement(
+            StockMovement(product_id=self.product.pk, movement_type='OUT', quantity=4, performed_by=self.user)
+        )
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.quantity, 6)
+        self.assertEqual(movement.price_at_movement, Decimal('150.00'))
+        self.assertEqual(movement.total_value, Decimal('600.00'))
+        self.assertEqual(movement.unit_cost, Decimal('80'))
+        self.assertEqual(movement.total_cost, Decimal('320.00'))
+
+    def test_stock_out_beyond_quantity_is_rejected_without_writes(self):
+        with self.assertRaises(InsufficientStock):
+            record_stock_movement(
+                StockMovement(product_id=self.product.pk, movement_type='OUT', quantity=11, performed_by=self.user)
+            )
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.quantity, 10)
+        self.assertFalse(StockMovement.objects.exists())
+        self.assertFalse(DailyMovementSummary.objects.exists())
+
+
+@isolated
+class RecordStockBatchTests(InventoryTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = self.make_admin()
+        self.first = self.make_product('SKU-1', quantity=10, price='50.00', average_cost='10')
+        self.second = self.make_product('SKU-2', quantity=2, price='75.00', average_cost='20')
+
+    def test_batch_in_applies_every_line(self):
+        movements = record_stock_batch('IN', [(self.first.pk, 5, Decimal('50')), (self.second.pk, 3)], self.user)
+        self.assertEqual(len(movements), 2)
+        self.first.refresh_from_db()
+        self.second.refresh_from_db()
+        self.assertEqual((self.first.quantity, self.second.quantity), (15, 5))
+        # (10 * 10 + 5 * 50) / 15
+        self.assertEqual(self.first.average_cost, Decimal('23.3333'))
+        self.assertEqual(self.second.average_cost, Decimal('20'))
+        self.assertEqual(ActivityLog.objects.filter(action='STOCK_IN').count(), 2)
+
+    def test_batch_out_is_all_or_nothing(self):
+        with self.assertRaises(BatchStockError) as raised:
+            record_stock_batch('OUT', [(self.first.pk, 4), (self.second.pk, 3)], self.user)
+        self.assertEqual([error['line'] for error in raised.exception.errors], [2])
+        self.first.refresh_from_db()
+        self.second.refresh_from_db()
+        self.assertEqual((self.first.quantity, self.second.quantity), (10, 2))
+        self.assertFalse(StockMovement.objects.exists())
+
+    def test_repeated_product_lines_are_checked_together(self):
+        with self.assertRaises(BatchStockError):
+            record_stock_batch('OUT', [(self.second.pk, 1), (self.second.pk, 2)], self.user)
+        self.second.refresh_from_db()
+        self.assertEqual(self.second.quantity, 2)
+
+    def test_invalid_lines_are_reported_per_line(self):
+        with self.assertRaises(BatchStockError) as raised:
+            record_stock_batch('IN', [(self.first.pk, 0), (self.second.pk, 1, Decimal('-1')), (999999, 1)], self.user)
+        self.assertEqual([error['line'] for error in raised.exception.errors], [1, 2])
+
+
+# serialized_write (in-process lock at retry) ay para lang sa production mode
+@override_settings(SQLITE_PRODUCTION_MODE=True, SQLITE_RETRY_DELAY=0)
+@isolated
+class SerializedWriteRetryTests(InventoryTestMixin, TransactionTestCase):
+    def test_retry_after_lock_error_starts_from_the_unsaved_movement(self):
+        user = self.make_admin()
+        product = self.make_product(quantity=10, average_cost='80')
+        calls = []
+
+        def locked_once(movement, **kwargs):
+            calls.append(movement.pk)
+            if len(calls) == 1:
+                raise OperationalError('database is locked')
+            return record_movement(movement, **kwargs)
+
+        def other_writer(seconds):
+            # Habang naghihintay bago mag-retry, may ibang nagbago ng average
+            Product.objects.filter(pk=product.pk).update(average_cost=Decimal('90'))
+
+        movement = StockMovement(product_id=product.pk, movement_type='IN', quantity=5, performed_by=user)
+        with mock.patch('core.services.record_movement', side_effect=locked_once), \
+                mock.patch('core.sqlite.time.sleep', side_effect=other_writer):
+            record_stock_movement(movement)
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(StockMovement.objects.get().pk, movement.pk)
+        self.assertFalse(movement._state.adding)
+        # Hindi na-reuse ang unit_cost na kinuha sa unang attempt (80)
+        self.assertEqual(movement.unit_cost, Decimal('90'))
+        product.refresh_from_db()
+        self.assertEqual((product.quantity, product.average_cost), (15, Decimal('90')))
+
+
+@override_settings(SQLITE_PRODUCTION_MODE=True)
+@isolated
+class ConcurrentStockOutTests(InventoryTestMixin, TransactionTestCase):
+    THREADS = 8
+    OPERATIONS = 25
+    INITIAL = 30
+
+    def test_concurrent_stock_outs_never_oversell(self):
+        user = self.make_admin()
+        product = self.make_product(quantity=self.INITIAL)
+        removed = []
+        failures = []
+        lock = threading.Lock()
+
+        def worker(seed):
+            rng = random.Random(seed)
+            taken = 0
+            try:
+                for _ in range(self.OPERATIONS):
+                    quantity = rng.randint(1, 3)
+                    try:
+                        record_stock_movement(StockMovement(
+                            product_id=product.pk, movement_type='OUT', quantity=quantity, performed_by=user,
+                        ))
+                    except InsufficientStock:
+                        continue
+                    taken += quantity
+            except OperationalError as exc:
+                with lock:
+                    failures.append(str(exc))
+            finally:
+                connection.close()
+                with lock:
+                    removed.append(taken)
+
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(failures, [])
+        product.refresh_from_db()
+        ledger = StockMovement.objects.filter(product=product, movement_type='OUT').aggregate(
+            total=Sum('quantity')
+        )['total'] or 0
+        self.assertGreaterEqual(product.quantity, 0)
+        self.assertEqual(ledger, sum(removed))
+        self.assertEqual(product.quantity, self.INITIAL - ledger)
+        # Mas marami ang hiniling kaysa sa stock, kaya dapat naubos o halos naubos
+        self.assertLessEqual(product.quantity, 2)
@@ -0,0 +1,41 @@
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+
+from core.models import Category, Product
+
+
+# Hiwalay sa dev cache at walang background threads: sync na activity log, walang live events.
+# Plain na static storage para hindi kailangan ang collectstatic manifest sa pag-render ng pages.
+isolated = override_settings(
+    ACTIVITY_LOG_SYNC=True,
+    LIVE_EVENTS_ENABLED=False,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'core-tests'}},
+    STORAGES={
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    },
+)
+
+
+class InventoryTestMixin:
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def make_admin(self, username='admin'):
+        return User.objects.create_user(username, password='secret', is_superuser=True, is_staff=True)
+
+    def make_product(self, sku='SKU-1', quantity=0, price='100.00', average_cost='0', **kwargs):
+        if 'category' not in kwargs:
+            kwargs['category'] = Category.objects.get_or_create(name='Tools')[0]
+        return Product.objects.create(
+            name=kwargs.pop('name', f'Product {sku}'),
+            sku=sku,
+            quantity=quantity,
+            price=Decimal(price),
+            average_cost=Decimal(average_cost),
+            **kwargs
+        )
@@ -0,0 +1,30 @@
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+
+
+def parse_date(value):
+    # 'YYYY-MM-DD' galing sa filter forms; None kapag blangko o mali
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        return None
+
+
+def local_day_start(day):
+    # Simula ng araw sa Asia/Manila (current timezone), bilang aware datetime
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def local_day_range(day):
+    return local_day_start(day), local_day_start(day + timedelta(days=1))
+
+
+def date_range_filter(field, date_from=None, date_to=None):
+    """Half-open [date_from 00:00, date_to + 1 day 00:00) para magamit ang index sa field."""
+    lookups = {}
+    if date_from:
+        lookups[f'{field}__gte'] = local_day_start(date_from)
+    if date_to:
+        lookups[f'{field}__lt'] = local_day_start(date_to + timedelta(days=1))
+    return lookups
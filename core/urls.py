@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import api, views
 
 urlpatterns = [
     # Authentication
@@ -9,10 +9,12 @@ urlpatterns = [
     
     # Dashboard
     path('dashboard/', views.dashboard, name='dashboard'),
+    path('dashboard/events/', views.dashboard_events, name='dashboard_events'),
     
     # Products
     path('products/', views.product_list, name='product_list'),
     path('products/create/', views.product_create, name='product_create'),
+    path('products/import/', views.product_import, name='product_import'),
     path('products/<int:pk>/', views.product_detail, name='product_detail'),
     path('products/<int:pk>/update/', views.product_update, name='product_update'),
     path('products/<int:pk>/delete/', views.product_delete, name='product_delete'),
@@ -20,6 +22,17 @@ urlpatterns = [
     # Stock Management
     path('stock/in/', views.stock_in, name='stock_in'),
     path('stock/out/', views.stock_out, name='stock_out'),
+    path('stock/batch/in/', views.stock_batch, {'movement_type': 'IN'}, name='stock_batch_in'),
+    path('stock/batch/out/', views.stock_batch, {'movement_type': 'OUT'}, name='stock_batch_out'),
+    path('api/stock/batch/', views.stock_batch_api, name='stock_batch_api'),
+    path('api/products/lookup/', views.product_lookup, name='product_lookup'),
+    path('api/products/<int:pk>/stock/', views.product_stock, name='product_stock'),
+    
+    # Read-only JSON API
+    path('api/v1/products/', api.product_list, name='api_product_list'),
+    path('api/v1/products/<int:pk>/', api.product_detail, name='api_product_detail'),
+    path('api/v1/categories/', api.category_list, name='api_category_list'),
+    path('api/v1/movements/', api.movement_list, name='api_movement_list'),
     
     # Reports
     path('reports/activity-log/', views.activity_log, name='activity_log'),
@@ -0,0 +1,34 @@
+import time
+
+from django.core.cache import cache
+
+
+DATA_VERSION_KEY = 'core:data_version'
+DATA_MODIFIED_KEY = 'core:data_modified'
+
+
+def get_data_version():
+    # Global na version ng inventory data; tumataas tuwing may write sa Product/StockMovement
+    version = cache.get(DATA_VERSION_KEY)
+    if version is None:
+        cache.add(DATA_VERSION_KEY, 1, timeout=None)
+        version = cache.get(DATA_VERSION_KEY, 1)
+    return version
+
+
+def get_data_state():
+    """(version, last modified epoch seconds o None) sa iisang cache round trip, para sa conditional GET."""
+    state = cache.get_many([DATA_VERSION_KEY, DATA_MODIFIED_KEY])
+    if DATA_VERSION_KEY not in state:
+        return get_data_version(), None
+    return state[DATA_VERSION_KEY], state.get(DATA_MODIFIED_KEY)
+
+
+def bump_data_version():
+    cache.set(DATA_MODIFIED_KEY, int(time.time()), timeout=None)
+    try:
+        return cache.incr(DATA_VERSION_KEY)
+    except ValueError:
+        # Wala pang version sa cache (bagong start o na-clear)
+        cache.set(DATA_VERSION_KEY, 2, timeout=None)
+        return 2
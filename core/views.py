@@ -1,14 +1,40 @@
+import asyncio
+import io
+import json
+from decimal import Decimal, InvalidOperation
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import login, logout, authenticate
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_POST
 from django.db.models import Sum, Count, Q, F
 from django.utils import timezone
-from datetime import timedelta, datetime
 from django import forms
-from .models import Product, Category, StockMovement, ActivityLog
-from .forms import LoginForm, ProductForm, CategoryForm, StockMovementForm
+from .models import Product, Category, StockMovement, ActivityLog, DailyMovementSummary
+from .forms import LoginForm, ProductForm, CategoryForm, StockMovementForm, StockBatchForm, ProductImportForm
+from .activity import log_activity
+from .archive import archived_months, read_archive
+from .caching import cached_view
 from .decorators import single_admin_required
+from .events import broker, format_sse, live_events_available
+from .pagination import KeysetPage, keyset_paginate, keyset_paginate_list
+from .exports import stream_csv
+from .importers import import_products
+from .kpis import get_dashboard_snapshot
+from .numbers import is_int
+from .pdf import report_pdf_response
+from .routers import use_replica
+from .search import lookup_products, search_products
+from .services import BatchStockError, InsufficientStock, record_stock_batch, record_stock_movement
+from .snapshots import stock_as_of
+from .timeutils import date_range_filter, parse_date
+
+
+PRODUCTS_PER_PAGE = 25
+LOGS_PER_PAGE = 50
+MOVEMENTS_PER_PAGE = 50
 
 
 def login_view(request):
@@ -24,7 +50,7 @@ def login_view(request):
             if user is not None:
                 login(request, user)
                 
-                ActivityLog.objects.create(
+                log_activity(
                     user=user,
                     action='LOGIN',
                     model_name='User',
@@ -47,7 +73,7 @@ def login_view(request):
 @single_admin_required
 def logout_view(request):
     if request.user.is_authenticated:
-        ActivityLog.objects.create(
+        log_activity(
             user=request.user,
             action='LOGOUT',
             model_name='User',
@@ -62,71 +88,58 @@ def logout_view(request):
 
 @login_required
 @single_admin_required
+@use_replica
+# Iba ang HTML sa ASGI (may EventSource) at WSGI, kaya hiwalay na cache entry
+@cached_view('products', 'categories', 'movements', 'activity', timeout=60, vary_on=live_events_available)
 def dashboard(request):
-    total_products = Product.objects.count()
-    total_categories = Category.objects.count()
-    low_stock_products = Product.objects.filter(quantity__lte=F('reorder_level')).count()
-    out_of_stock = Product.objects.filter(quantity=0).count()
-    total_stock_value = Product.objects.aggregate(total=Sum(F('quantity') * F('price')))['total'] or 0
-    
-    recent_activities = ActivityLog.objects.all()[:10]
-    low_stock_items = Product.objects.filter(quantity__lte=F('reorder_level')).order_by('quantity')[:5]
-    recent_movements = StockMovement.objects.select_related('product').all()[:5]
-    
-    top_products = Product.objects.annotate(
-        stock_value=F('quantity') * F('price')
-    ).order_by('-stock_value')[:5]
-    
-    last_7_days = []
-    stock_in_data = []
-    stock_out_data = []
-    
-    for i in range(6, -1, -1):
-        date = timezone.now().date() - timedelta(days=i)
-        last_7_days.append(date.strftime('%b %d'))
-        
-        stock_in = StockMovement.objects.filter(
-            movement_type='IN',
-            date__date=date
-        ).aggregate(total=Sum('quantity'))['total'] or 0
-        stock_in_data.append(stock_in)
-        
-        stock_out = StockMovement.objects.filter(
-            movement_type='OUT',
-            date__date=date
-        ).aggregate(total=Sum('quantity'))['total'] or 0
-        stock_out_data.append(stock_out)
+    snapshot = get_dashboard_snapshot()
+    recent_activities = ActivityLog.objects.select_related('user').all()[:10]
     
-    context = {
-        'total_products': total_products,
-        'total_categories': total_categories,
-        'low_stock_products': low_stock_products,
-        'out_of_stock': out_of_stock,
-        'total_stock_value': total_stock_value,
-        'recent_activities': recent_activities,
-        'low_stock_items': low_stock_items,
-        'recent_movements': recent_movements,
-        'top_products': top_products,
-        'chart_labels': last_7_days,
-        'stock_in_data': stock_in_data,
-        'stock_out_data': stock_out_data,
-    }
+    context = dict(snapshot, recent_activities=recent_activities, live_events=live_events_available(request))
     return render(request, 'dashboard.html', context)
 
 
+# Comment line lang, para hindi ma-timeout ng proxies ang idle na stream
+SSE_HEARTBEAT_SECONDS = 15
+
+
+@login_required
+@single_admin_required
+async def dashboard_events(request):
+    """Server-sent events para sa dashboard: KPI, bagong movements, at low-stock transitions."""
+    if not live_events_available(request):
+        # 204: hindi na magre-reconnect ang EventSource
+        return HttpResponse(status=204)
+    queue = await broker.subscribe()
+
+    async def stream():
+        try:
+            yield 'retry: 5000\n\n'
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ': ping\n\n'
+                    continue
+                yield format_sse(event)
+        finally:
+            broker.unsubscribe(queue)
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Huwag i-buffer ng nginx
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
 @login_required
 @single_admin_required
+@cached_view('products', 'categories')
 def product_list(request):
     products = Product.objects.select_related('category').all()
     categories = Category.objects.all()
     
     search_query = request.GET.get('search', '')
-    if search_query:
-        products = products.filter(
-            Q(name__icontains=search_query) | 
-            Q(sku__icontains=search_query) |
-            Q(category__name__icontains=search_query)
-        )
     
     category_filter = request.GET.get('category', '')
     if category_filter:
@@ -140,6 +153,12 @@ def product_list(request):
     elif stock_status == 'in':
         products = products.filter(quantity__gt=F('reorder_level'))
     
+    if search_query.strip():
+        # Naka-rank ayon sa relevance, kaya top results lang at walang keyset pages
+        products = KeysetPage(list(search_products(search_query, products)), 'created_at', request.GET, False, False)
+    else:
+        products = keyset_paginate(request, products, 'created_at', PRODUCTS_PER_PAGE)
+    
     context = {
         'products': products,
         'categories': categories,
@@ -152,6 +171,41 @@ def product_list(request):
 
 @login_required
 @single_admin_required
+def product_import(request):
+    result = None
+    if request.method == 'POST':
+        form = ProductImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            upload = form.cleaned_data['file']
+            # I-stream ang upload; hindi binabasa nang buo sa memory
+            stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+            try:
+                result = import_products(stream, user=request.user, ip_address=request.META.get('REMOTE_ADDR'))
+            except UnicodeDecodeError:
+                messages.error(request, 'The file must be a UTF-8 encoded CSV.')
+            else:
+                if result.malformed:
+                    form.add_error('file', 'The file is not a valid CSV; see the errors below.')
+                log_activity(
+                    user=request.user,
+                    action='CREATE',
+                    model_name='Product',
+                    object_repr=upload.name[:200],
+                    changes=f"Imported {result.imported} products, {result.adjustments} stock adjustments "
+                            f"({len(result.errors)} errors)",
+                    ip_address=request.META.get('REMOTE_ADDR')
+                )
+                if result.imported:
+                    messages.success(request, f'Imported {result.imported} products.')
+    else:
+        form = ProductImportForm()
+    
+    return render(request, 'inventory/product_import.html', {'form': form, 'result': result})
+
+
+@login_required
+@single_admin_required
+@cached_view('products', 'categories', 'movements')
 def product_detail(request, pk):
     product = get_object_or_404(Product, pk=pk)
     stock_movements = StockMovement.objects.filter(product=product)[:10]
@@ -171,7 +225,7 @@ def product_create(request):
         if form.is_valid():
             product = form.save()
             
-            ActivityLog.objects.create(
+            log_activity(
                 user=request.user,
                 action='CREATE',
                 model_name='Product',
@@ -198,7 +252,7 @@ def product_update(request, pk):
         if form.is_valid():
             form.save()
             
-            ActivityLog.objects.create(
+            log_activity(
                 user=request.user,
                 action='UPDATE',
                 model_name='Product',
@@ -223,7 +277,7 @@ def product_delete(request, pk):
     if request.method == 'POST':
         product_name = product.name
         
-        ActivityLog.objects.create(
+        log_activity(
             user=request.user,
             action='DELETE',
             model_name='Product',
@@ -248,21 +302,8 @@ def stock_in(request):
             movement = form.save(commit=False)
             movement.movement_type = 'IN'
             movement.performed_by = request.user
-            movement.save()
-            
+            movement = record_stock_movement(movement, ip_address=request.META.get('REMOTE_ADDR'))
             product = movement.product
-            product.quantity += movement.quantity
-            product.save()
-            
-            ActivityLog.objects.create(
-                user=request.user,
-                action='STOCK_IN',
-                model_name='Product',
-                object_id=product.id,
-                object_repr=product.name,
-                changes=f"Added {movement.quantity} {product.unit}",
-                ip_address=request.META.get('REMOTE_ADDR')
-            )
             
             messages.success(request, f'Stock in completed for {product.name}')
             return redirect('product_list')
@@ -281,29 +322,14 @@ def stock_out(request):
         if form.is_valid():
             movement = form.save(commit=False)
             movement.movement_type = 'OUT'
-            
-            product = movement.product
-            if product.quantity < movement.quantity:
-                messages.error(request, f'Not enough stock! Available: {product.quantity} {product.unit}')
-                return render(request, 'inventory/stock_form.html', {'form': form, 'title': 'Stock Out'})
-            
-            movement.price_at_movement = product.price
-            movement.total_value = movement.quantity * product.price
             movement.performed_by = request.user
-            movement.save()
             
-            product.quantity -= movement.quantity
-            product.save()
-            
-            ActivityLog.objects.create(
-                user=request.user,
-                action='STOCK_OUT',
-                model_name='Product',
-                object_id=product.id,
-                object_repr=product.name,
-                changes=f"Removed {movement.quantity} {product.unit} worth ₱{movement.total_value}",
-                ip_address=request.META.get('REMOTE_ADDR')
-            )
+            try:
+                movement = record_stock_movement(movement, ip_address=request.META.get('REMOTE_ADDR'))
+            except InsufficientStock as exc:
+                messages.error(request, f'Not enough stock! Available: {exc.product.quantity} {exc.product.unit}')
+                return render(request, 'inventory/stock_form.html', {'form': form, 'title': 'Stock Out'})
+            product = movement.product
             
             messages.success(request, f'Stock out completed for {product.name} (₱{movement.total_value})')
             return redirect('product_list')
@@ -316,6 +342,166 @@ def stock_out(request):
 
 @login_required
 @single_admin_required
+def product_lookup(request):
+    return JsonResponse({'results': lookup_products(request.GET.get('q', ''))})
+
+
+@login_required
+@single_admin_required
+def product_stock(request, pk):
+    # Live na unit at stock para sa napiling product lang; hindi naka-cache
+    product = get_object_or_404(Product.objects.only('sku', 'name', 'unit', 'quantity', 'average_cost'), pk=pk)
+    return JsonResponse({
+        'id': product.id,
+        'sku': product.sku,
+        'name': product.name,
+        'unit': product.unit,
+        'unit_label': product.get_unit_display(),
+        'quantity': product.quantity,
+        'average_cost': str(product.average_cost),
+    })
+
+
+@login_required
+@single_admin_required
+def stock_batch(request, movement_type):
+    title = 'Batch Stock In' if movement_type == 'IN' else 'Batch Stock Out'
+    
+    if request.method == 'POST':
+        form = StockBatchForm(request.POST)
+        if form.is_valid():
+            try:
+                movements = record_stock_batch(
+                    movement_type,
+                    form.cleaned_data['lines'],
+                    request.user,
+                    reference=form.cleaned_data['reference'] or None,
+                    notes=form.cleaned_data['notes'] or None,
+                    ip_address=request.META.get('REMOTE_ADDR'),
+                )
+            except BatchStockError as exc:
+                for error in exc.errors:
+                    form.add_error('lines', f"Line {error['line']}: {error['error']}" if error['line'] else error['error'])
+            else:
+                total_qty = sum(movement.quantity for movement in movements)
+                messages.success(request, f'{title} completed: {len(movements)} lines, {total_qty} items')
+                return redirect('product_list')
+    else:
+        form = StockBatchForm()
+    
+    return render(request, 'inventory/stock_batch_form.html', {
+        'form': form,
+        'title': title,
+        'movement_type': movement_type,
+    })
+
+
+def _parse_decimal(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        return None
+    try:
+        value = Decimal(str(value).strip())
+    except InvalidOperation:
+        return None
+    # Kasya sa average_cost/unit_cost: max_digits=12, decimal_places=4
+    if not value.is_finite() or value.as_tuple().exponent < -4 or abs(value) >= 10 ** 8:
+        return None
+    return value
+
+
+@login_required
+@single_admin_required
+@require_POST
+def stock_batch_api(request):
+    try:
+        payload = json.loads(request.body)
+    except (TypeError, ValueError):
+        return JsonResponse({'errors': [{'line': 0, 'error': 'Request body must be JSON.'}]}, status=400)
+    if not isinstance(payload, dict):
+        return JsonResponse({'errors': [{'line': 0, 'error': 'Request body must be a JSON object.'}]}, status=400)
+    
+    movement_type = payload.get('movement_type')
+    raw_lines = payload.get('lines')
+    if movement_type not in ('IN', 'OUT') or not isinstance(raw_lines, list):
+        return JsonResponse({
+            'errors': [{'line': 0, 'error': 'Expected "movement_type" (IN or OUT) and a "lines" list.'}],
+        }, status=400)
+    reference = payload.get('reference')
+    notes = payload.get('notes')
+    if not isinstance(reference, (str, type(None))) or not isinstance(notes, (str, type(None))):
+        return JsonResponse({'errors': [{'line': 0, 'error': '"reference" and "notes" must be strings.'}]}, status=400)
+    if reference and len(reference) > 100:
+        return JsonResponse({'errors': [{'line': 0, 'error': '"reference" must be at most 100 characters.'}]}, status=400)
+    
+    # Types muna ng bawat line, bago ang anumang query
+    parsed = []
+    errors = []
+    for number, line in enumerate(raw_lines, start=1):
+        error = None
+        if not isinstance(line, dict):
+            error = 'Each line must be an object.'
+        else:
+            sku = line.get('sku')
+            product_id = line.get('product_id')
+            quantity = line.get('quantity')
+            unit_cost = line.get('unit_cost')
+            if sku is not None and (not isinstance(sku, str) or not sku.strip()):
+                error = 'SKU must be a non-empty string.'
+            elif sku is None and not is_int(product_id):
+                error = 'Each line needs a "sku" or an integer "product_id".'
+            elif not is_int(quantity) or quantity < 1:
+                error = 'Quantity must be an integer of at least 1.'
+            elif unit_cost is not None:
+                unit_cost = _parse_decimal(unit_cost)
+                if unit_cost is None:
+                    error = 'Unit cost must be a number with at most 4 decimal places.'
+                elif unit_cost < 0:
+                    error = 'Unit cost must not be negative.'
+        if error:
+            errors.append({'line': number, 'error': error})
+        else:
+            parsed.append((number, sku, product_id, quantity, unit_cost))
+    if errors:
+        return JsonResponse({'errors': errors}, status=400)
+    
+    # Puwedeng "sku" o "product_id" ang bawat line; isang query lang para sa lahat ng SKU
+    skus = {sku for _, sku, _, _, _ in parsed if sku is not None}
+    sku_map = dict(Product.objects.filter(sku__in=skus).values_list('sku', 'id')) if skus else {}
+    lines = []
+    for number, sku, product_id, quantity, unit_cost in parsed:
+        if sku is not None:
+            product_id = sku_map.get(sku)
+            if product_id is None:
+                errors.append({'line': number, 'error': f'Unknown product {sku!r}.'})
+                continue
+        lines.append((product_id, quantity, unit_cost))
+    if errors:
+        return JsonResponse({'errors': errors}, status=400)
+    
+    try:
+        movements = record_stock_batch(
+            movement_type,
+            lines,
+            request.user,
+            reference=reference or None,
+            notes=notes or None,
+            ip_address=request.META.get('REMOTE_ADDR'),
+        )
+    except BatchStockError as exc:
+        return JsonResponse({'errors': exc.errors}, status=409)
+    
+    return JsonResponse({
+        'movement_type': movement_type,
+        'lines': len(movements),
+        'total_quantity': sum(movement.quantity for movement in movements),
+        'movement_ids': [movement.pk for movement in movements],
+    }, status=201)
+
+
+@login_required
+@single_admin_required
+@use_replica
+@cached_view('activity')
 def activity_log(request):
     logs = ActivityLog.objects.select_related('user').all()
     
@@ -326,125 +512,207 @@ def activity_log(request):
     date_from = request.GET.get('date_from', '')
     date_to = request.GET.get('date_to', '')
     
-    if date_from:
-        logs = logs.filter(timestamp__date__gte=datetime.strptime(date_from, '%Y-%m-%d').date())
-    if date_to:
-        logs = logs.filter(timestamp__date__lte=datetime.strptime(date_to, '%Y-%m-%d').date())
+    logs = logs.filter(**date_range_filter('timestamp', parse_date(date_from), parse_date(date_to)))
+    
+    # Archived na buwan: binabasa on demand mula sa compressed JSONL, hindi sa hot table
+    months = archived_months()
+    archive_month = request.GET.get('archive', '')
+    if archive_month not in months:
+        archive_month = ''
+    
+    if request.GET.get('export') == 'csv' and not archive_month:
+        return stream_csv(
+            f"activity-log-{timezone.localdate():%Y%m%d}.csv",
+            ['Timestamp', 'User', 'Action', 'Model', 'Object ID', 'Item', 'Changes', 'IP Address'],
+            logs,
+            ['timestamp', 'user__username', 'action', 'model_name', 'object_id', 'object_repr', 'changes', 'ip_address'],
+        )
+    
+    if archive_month:
+        records = read_archive(archive_month, action_filter, parse_date(date_from), parse_date(date_to))
+        page = keyset_paginate_list(request, records, 'timestamp', LOGS_PER_PAGE)
+    else:
+        page = keyset_paginate(request, logs, 'timestamp', LOGS_PER_PAGE)
     
-    actions = ActivityLog.objects.values_list('action', flat=True).distinct()
+    # order_by: kung hindi, kasama ang Meta ordering (timestamp) sa DISTINCT at bawat log ay lalabas
+    actions = ActivityLog.objects.order_by('action').values_list('action', flat=True).distinct()
     
     context = {
-        'logs': logs,
+        'logs': page,
         'actions': actions,
         'action_filter': action_filter,
         'date_from': date_from,
         'date_to': date_to,
+        'archive_months': months,
+        'archive_month': archive_month,
     }
     return render(request, 'reports/activity_log.html', context)
 
 
-@login_required
-@single_admin_required
-def inventory_report(request):
-    products = Product.objects.select_related('category').all()
-    total_inventory_value = products.aggregate(total=Sum(F('quantity') * F('price')))['total'] or 0
-    total_items = products.aggregate(total=Sum('quantity'))['total'] or 0
+def inventory_report_context(as_of=None):
+    today = timezone.localdate()
+    if as_of is not None and as_of >= today:
+        as_of = None
+    
+    if as_of:
+        # Stock sa pagsara ng as_of: pinakamalapit na snapshot + replay ng rollup mula roon
+        products = stock_as_of(as_of)
+        product_count = len(products)
+        total_items = sum(product.quantity for product in products)
+        total_inventory_value = sum(product.quantity * product.price for product in products)
+        total_inventory_cost = sum(product.quantity * product.average_cost for product in products)
+        today = as_of
+    else:
+        products = Product.objects.select_related('category').all()
+        product_totals = Product.objects.aggregate(
+            product_count=Count('id'),
+            total_items=Sum('quantity'),
+            total_value=Sum(F('quantity') * F('price')),
+            total_cost=Sum(F('quantity') * F('average_cost')),
+        )
+        product_count = product_totals['product_count']
+        total_inventory_value = product_totals['total_value'] or 0
+        total_inventory_cost = product_totals['total_cost'] or 0
+        total_items = product_totals['total_items'] or 0
     
-    today = timezone.now().date()
     first_day_of_month = today.replace(day=1)
     first_day_of_year = today.replace(month=1, day=1)
     
-    stock_out_today = StockMovement.objects.filter(
-        movement_type='OUT',
-        date__date=today
-    ).aggregate(total=Sum('total_value'))['total'] or 0
-    
-    stock_out_this_month = StockMovement.objects.filter(
-        movement_type='OUT',
-        date__date__gte=first_day_of_month
-    ).aggregate(total=Sum('total_value'))['total'] or 0
-    
-    stock_out_this_year = StockMovement.objects.filter(
-        movement_type='OUT',
-        date__date__gte=first_day_of_year
-    ).aggregate(total=Sum('total_value'))['total'] or 0
-    
-    stock_out_all_time = StockMovement.objects.filter(
-        movement_type='OUT'
-    ).aggregate(total=Sum('total_value'))['total'] or 0
-    
+    # Period totals galing sa daily rollup, hindi sa buong StockMovement table
+    stock_out_totals = DailyMovementSummary.objects.filter(movement_type='OUT', day__lte=today).aggregate(
+        today=Sum('total_value', filter=Q(day=today)),
+        this_month=Sum('total_value', filter=Q(day__gte=first_day_of_month)),
+        this_year=Sum('total_value', filter=Q(day__gte=first_day_of_year)),
+        all_time=Sum('total_value'),
+        cogs_this_month=Sum('total_cost', filter=Q(day__gte=first_day_of_month)),
+        cogs_this_year=Sum('total_cost', filter=Q(day__gte=first_day_of_year)),
+        cogs_all_time=Sum('total_cost'),
+    )
+    stock_out_today = stock_out_totals['today'] or 0
+    stock_out_this_month = stock_out_totals['this_month'] or 0
+    stock_out_this_year = stock_out_totals['this_year'] or 0
+    stock_out_all_time = stock_out_totals['all_time'] or 0
+    cogs_this_month = stock_out_totals['cogs_this_month'] or 0
+    cogs_this_year = stock_out_totals['cogs_this_year'] or 0
+    cogs_all_time = stock_out_totals['cogs_all_time'] or 0
+    
+    # Isang GROUP BY sa rollup imbes na isang aggregate kada category
     stock_out_by_category = []
-    for category in Category.objects.all():
-        category_stock_out = StockMovement.objects.filter(
-            movement_type='OUT',
-            product__category=category
-        ).aggregate(
-            total_qty=Sum('quantity'),
-            total_val=Sum('total_value')
-        )
-        
-        if category_stock_out['total_val'] and category_stock_out['total_val'] > 0:
-            stock_out_by_category.append({
-                'category': category.name,
-                'quantity': category_stock_out['total_qty'] or 0,
-                'value': category_stock_out['total_val'] or 0,
-            })
+    for item in DailyMovementSummary.objects.filter(
+        movement_type='OUT',
+        category__isnull=False,
+        day__lte=today,
+    ).values('category__name').annotate(
+        total_qty=Sum('quantity'),
+        total_val=Sum('total_value')
+    ).filter(total_val__gt=0).order_by('category__name'):
+        stock_out_by_category.append({
+            'category': item['category__name'],
+            'quantity': item['total_qty'] or 0,
+            'value': item['total_val'] or 0,
+        })
     
     recent_stock_outs = StockMovement.objects.filter(
-        movement_type='OUT'
+        movement_type='OUT',
+        **date_range_filter('date', date_to=today)
     ).select_related('product', 'performed_by').order_by('-date')[:10]
     
     category_summary = []
-    for category in Category.objects.all():
-        category_products = products.filter(category=category)
-        total_qty = category_products.aggregate(total=Sum('quantity'))['total'] or 0
-        total_cat_value = category_products.aggregate(total=Sum(F('quantity') * F('price')))['total'] or 0
-        product_count = category_products.count()
-        
-        if product_count > 0 or total_qty > 0:
+    if as_of:
+        by_category = {}
+        for product in products:
+            if product.category is None:
+                continue
+            summary = by_category.setdefault(product.category_id, {
+                'category': {'id': product.category_id, 'name': product.category.name},
+                'product_count': 0,
+                'total_quantity': 0,
+                'total_value': 0,
+                'total_cost': 0,
+            })
+            summary['product_count'] += 1
+            summary['total_quantity'] += product.quantity
+            summary['total_value'] += product.quantity * product.price
+            summary['total_cost'] += product.quantity * product.average_cost
+        category_summary = sorted(by_category.values(), key=lambda summary: summary['category']['name'])
+    else:
+        for item in Product.objects.filter(category__isnull=False).values(
+            'category', 'category__name'
+        ).annotate(
+            product_count=Count('id'),
+            total_quantity=Sum('quantity'),
+            total_value=Sum(F('quantity') * F('price')),
+            total_cost=Sum(F('quantity') * F('average_cost')),
+        ).order_by('category__name'):
             category_summary.append({
-                'category': category,
-                'product_count': product_count,
-                'total_quantity': total_qty,
-                'total_value': total_cat_value,
+                'category': {'id': item['category'], 'name': item['category__name']},
+                'product_count': item['product_count'],
+                'total_quantity': item['total_quantity'] or 0,
+                'total_value': item['total_value'] or 0,
+                'total_cost': item['total_cost'] or 0,
             })
     
     context = {
         'products': products,
+        'product_count': product_count,
         'total_inventory_value': total_inventory_value,
+        'total_value': total_inventory_value,
+        'total_inventory_cost': total_inventory_cost,
         'total_items': total_items,
         'category_summary': category_summary,
         'stock_out_today': stock_out_today,
         'stock_out_this_month': stock_out_this_month,
         'stock_out_this_year': stock_out_this_year,
         'stock_out_all_time': stock_out_all_time,
+        'cogs_this_month': cogs_this_month,
+        'cogs_this_year': cogs_this_year,
+        'cogs_all_time': cogs_all_time,
+        'gross_margin_this_month': stock_out_this_month - cogs_this_month,
         'stock_out_by_category': stock_out_by_category,
         'recent_stock_outs': recent_stock_outs,
         'today': today,
+        'as_of': as_of,
         'current_month': today.strftime('%B %Y'),
         'current_year': today.year,
     }
-    return render(request, 'reports/inventory_report.html', context)
+    return context
 
 
 @login_required
 @single_admin_required
-def stock_out_report(request):
-    stock_outs = StockMovement.objects.filter(movement_type='OUT').select_related('product', 'performed_by')
+@use_replica
+@cached_view('products', 'categories', 'movements')
+def inventory_report(request):
+    as_of = parse_date(request.GET.get('as_of', ''))
     
-    date_from = request.GET.get('date_from', '')
-    date_to = request.GET.get('date_to', '')
+    if request.GET.get('format') == 'pdf':
+        params = {'as_of': as_of} if as_of else {}
+        return report_pdf_response(request, 'inventory_report', params, inventory_report_context)
     
-    if date_from:
-        stock_outs = stock_outs.filter(date__date__gte=datetime.strptime(date_from, '%Y-%m-%d').date())
-    if date_to:
-        stock_outs = stock_outs.filter(date__date__lte=datetime.strptime(date_to, '%Y-%m-%d').date())
+    return render(request, 'reports/inventory_report.html', inventory_report_context(as_of))
+
+
+def stock_out_queryset(date_from='', date_to=''):
+    stock_outs = StockMovement.objects.filter(movement_type='OUT').select_related('product', 'performed_by')
+    return stock_outs.filter(**date_range_filter('date', parse_date(date_from), parse_date(date_to)))
+
+
+def stock_out_report_context(date_from='', date_to=''):
+    stock_outs = stock_out_queryset(date_from, date_to)
+    
+    # Totals at summary galing sa daily rollup (parehong day filters)
+    summaries = DailyMovementSummary.objects.filter(movement_type='OUT')
+    if parse_date(date_from):
+        summaries = summaries.filter(day__gte=parse_date(date_from))
+    if parse_date(date_to):
+        summaries = summaries.filter(day__lte=parse_date(date_to))
     
-    total_quantity = stock_outs.aggregate(total=Sum('quantity'))['total'] or 0
-    total_value = stock_outs.aggregate(total=Sum('total_value'))['total'] or 0
+    totals = summaries.aggregate(total_qty=Sum('quantity'), total_val=Sum('total_value'))
+    total_quantity = totals['total_qty'] or 0
+    total_value = totals['total_val'] or 0
     
     product_summary = []
-    for item in stock_outs.values('product__name', 'product__sku').annotate(
+    for item in summaries.values('product__name', 'product__sku').annotate(
         total_qty=Sum('quantity'),
         total_val=Sum('total_value')
     ).order_by('-total_val'):
@@ -463,4 +731,30 @@ def stock_out_report(request):
         'date_from': date_from,
         'date_to': date_to,
     }
-    return render(request, 'reports/stock_out_report.html', context)
\ No newline at end of file
+    return context
+
+
+@login_required
+@single_admin_required
+@use_replica
+@cached_view('products', 'movements')
+def stock_out_report(request):
+    date_from = request.GET.get('date_from', '')
+    date_to = request.GET.get('date_to', '')
+    
+    if request.GET.get('export') == 'csv':
+        return stream_csv(
+            f"stock-out-report-{timezone.localdate():%Y%m%d}.csv",
+            ['Date', 'Product', 'SKU', 'Quantity', 'Unit', 'Unit Price', 'Total Value', 'Reference', 'Performed By'],
+            stock_out_queryset(date_from, date_to).order_by('-date', '-id'),
+            ['date', 'product__name', 'product__sku', 'quantity', 'product__unit', 'price_at_movement',
+             'total_value', 'reference', 'performed_by__username'],
+        )
+    
+    if request.GET.get('format') == 'pdf':
+        params = {'date_from': date_from, 'date_to': date_to}
+        return report_pdf_response(request, 'stock_out_report', params, stock_out_report_context)
+    
+    context = stock_out_report_context(date_from, date_to)
+    context['stock_outs'] = keyset_paginate(request, context['stock_outs'], 'date', MOVEMENTS_PER_PAGE)
+    return render(request, 'reports/stock_out_report.html', context)
@@ -1,11 +0,0 @@
-<<<<<<< HEAD
-
-
-
-cd C:\Users\admin\diskarteng_pinoy_inventory
-=======
-
-
-
-cd C:\Users\admin\diskarteng_pinoy_inventory
->>>>>>> 634131f0d28304ffc716afc7bc8862b73380b9a2
@@ -68,6 +68,96 @@ DATABASES = {
     )
 }
 
+# SQLite production mode (core.sqlite): WAL at tuned pragmas kada connection, BEGIN IMMEDIATE
+# para sa write transactions, at bounded retry kapag "database is locked".
+# Default ay naka-on lang kapag may DATABASE_URL (deployed na DB). Persistent ang WAL: isinusulat
+# ito sa header ng file (bytes 18/19) at nananatili kahit i-off ang mode, kaya hindi ito ina-apply
+# sa naka-commit na dev db.sqlite3. Pabalikin gamit ang `PRAGMA journal_mode = DELETE`.
+SQLITE_PRODUCTION_MODE = os.environ.get(
+    'SQLITE_PRODUCTION_MODE', 'True' if os.environ.get('DATABASE_URL') else 'False'
+) == 'True'
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', '5000')),
+    'synchronous': 'NORMAL',
+    'mmap_size': 256 * 1024 * 1024,
+    # Negatibo = KiB, kaya 64 MB na page cache kada connection
+    'cache_size': -64000,
+}
+SQLITE_WRITE_RETRIES = 5
+SQLITE_RETRY_DELAY = 0.05
+if SQLITE_PRODUCTION_MODE and DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    DATABASES['default'].setdefault('OPTIONS', {})['transaction_mode'] = 'IMMEDIATE'
+
+# Optional na read replica para sa reports at exports (core.routers). Para sa local test,
+# puwedeng kopya ng db.sqlite3: REPLICA_DATABASE_URL=sqlite:///replica.sqlite3
+REPLICA_DATABASE_URL = os.environ.get('REPLICA_DATABASE_URL', '')
+if REPLICA_DATABASE_URL:
+    DATABASES['replica'] = dj_database_url.parse(REPLICA_DATABASE_URL, conn_max_age=600)
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+DATABASE_ROUTERS = ['core.routers.ReplicaRouter']
+# Max na tagal sa cache ng pages/snapshots na binasa sa replica, para hindi manatili ang lag
+REPLICA_CACHE_TIMEOUT = int(os.environ.get('REPLICA_CACHE_TIMEOUT', '30'))
+
+# Cache - file-based para iisa ang data version at KPI snapshot ng lahat ng gunicorn workers
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('CACHE_DIR', str(BASE_DIR / '.cache')),
+        'TIMEOUT': 300,
+        # Mas maraming entries dahil sa per-user view cache; default ng Django ay 300
+        'OPTIONS': {'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', '5000'))},
+    }
+}
+# locmem ay para lang sa iisang process (hal. runserver); hindi nakikita ng ibang workers ang invalidation
+if os.environ.get('CACHE_BACKEND') == 'locmem':
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'TIMEOUT': 300,
+        'OPTIONS': {'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', '5000'))},
+    }
+
+# Tag-based na view/fragment cache (core.caching); ini-invalidate ng signals pagka-commit
+VIEW_CACHE_ENABLED = os.environ.get('VIEW_CACHE_ENABLED', 'True') == 'True'
+VIEW_CACHE_TIMEOUT = int(os.environ.get('VIEW_CACHE_TIMEOUT', '600'))
+
+# Buffered ActivityLog writer; ACTIVITY_LOG_SYNC=True para direktang save (hal. sa tests)
+ACTIVITY_LOG_SYNC = os.environ.get('ACTIVITY_LOG_SYNC', 'False') == 'True'
+ACTIVITY_LOG_BATCH_SIZE = 200
+ACTIVITY_LOG_FLUSH_INTERVAL = 1.0
+# Ilang subok ng bulk write bago isa-isang i-save; ang hindi pa rin maisulat ay napupunta sa spill file
+ACTIVITY_LOG_MAX_RETRIES = 3
+ACTIVITY_LOG_SPILL_FILE = os.environ.get('ACTIVITY_LOG_SPILL_FILE', str(BASE_DIR / 'archive' / 'unwritten-activity.jsonl'))
+
+# Retention ng ActivityLog sa database; mas luma ay nililipat sa archive_activity_logs
+ACTIVITY_LOG_RETENTION_DAYS = int(os.environ.get('ACTIVITY_LOG_RETENTION_DAYS', '180'))
+ACTIVITY_LOG_ARCHIVE_DIR = os.environ.get('ACTIVITY_LOG_ARCHIVE_DIR', str(BASE_DIR / 'archive' / 'activity'))
+
+# Ilang araw sa pagitan ng StockSnapshot (take_stock_snapshot ay puwedeng i-cron araw-araw)
+STOCK_SNAPSHOT_INTERVAL_DAYS = int(os.environ.get('STOCK_SNAPSHOT_INTERVAL_DAYS', '1'))
+
+# Live dashboard (SSE). Kailangan ng ASGI deployment (tingnan ang build.sh), dahil sa WSGI ay
+# hawak ng bawat bukas na dashboard ang isang worker. Kapag WSGI ang takbo, hindi ito ginagamit
+# kahit naka-True: walang EventSource sa page at 204 ang sagot ng events endpoint.
+LIVE_EVENTS_ENABLED = os.environ.get('LIVE_EVENTS_ENABLED', 'False') == 'True'
+LIVE_EVENTS_POLL_INTERVAL = float(os.environ.get('LIVE_EVENTS_POLL_INTERVAL', '1.0'))
+
+# Sessions: cached_db (default) ay sa cache muna nagbabasa at DB ang fallback; signed_cookies
+# ay walang server-side na storage (hindi ma-revoke ang session hangga't hindi nag-e-expire)
+SESSION_ENGINE = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}[os.environ.get('SESSION_BACKEND', 'cached_db')]
+
+# Per-process cache ng naka-login na user at admin verdict (core.auth); 0 para i-disable.
+# ModelBackend ay nasa listahan pa para gumana ang sessions na gawa bago ang CachedModelBackend.
+AUTHENTICATION_BACKENDS = [
+    'core.auth.CachedModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+AUTH_USER_CACHE_TTL = int(os.environ.get('AUTH_USER_CACHE_TTL', '30'))
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -94,12 +184,26 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 STATIC_ROOT = BASE_DIR / 'staticfiles'
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    # Hashed filenames + .gz/.br sa collectstatic; far-future Cache-Control mula sa WhiteNoise
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+# Walang collectstatic sa dev/tests: unhashed URL imbes na ValueError
+WHITENOISE_MANIFEST_STRICT = False
 
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Server-side PDF reports (xhtml2pdf), naka-cache sa disk
+REPORT_PDF_DIR = MEDIA_ROOT / 'reports'
+REPORT_PDF_WORKERS = int(os.environ.get('REPORT_PDF_WORKERS', '2'))
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 